@@ -12,6 +12,7 @@ if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
 
 from src.bim_benchmark import paths, runner  # noqa: E402
+from src.bim_benchmark.cli import SUBCOMMANDS  # noqa: E402
 from src.bim_benchmark.cli import main as cli_main  # noqa: E402
 
 
@@ -33,7 +34,7 @@ def main(argv: list[str] | str | None = None) -> int:
     if argv is None:
         argv = sys.argv[1:]
 
-    if len(argv) == 1 and not str(argv[0]).startswith("-"):
+    if len(argv) == 1 and not str(argv[0]).startswith("-") and argv[0] not in SUBCOMMANDS:
         run_target(argv[0])
         return 0
 
@@ -1,11 +1,12 @@
-import ifcopenshell
+from scripts.scan_engine import count_of
+
+
+SCAN = count_of("IfcWall", fast_path=True)
 
 
 def count_walls(ifc_file_path):
     """Count all walls in the IFC model"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-        walls = ifc_file.by_type("IfcWall")
-        return len(walls)
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as e:
         return f"Error: {str(e)}"
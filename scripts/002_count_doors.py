@@ -1,11 +1,12 @@
-import ifcopenshell
+from scripts.scan_engine import count_of
+
+
+SCAN = count_of("IfcDoor", fast_path=True)
 
 
 def count_doors(ifc_file_path):
     """Count all doors in the IFC model"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-        doors = ifc_file.by_type("IfcDoor")
-        return len(doors)
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as e:
         return f"Error: {str(e)}"
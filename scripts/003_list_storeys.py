@@ -1,10 +1,13 @@
-import ifcopenshell
+from scripts.question_helpers import open_ifc
+
+
+REQUIRES = ("IfcBuildingStorey",)
 
 
 def list_storeys(ifc_file_path):
     """List all storey names in the building"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path, requires=REQUIRES)
         storeys = ifc_file.by_type("IfcBuildingStorey")
         storey_names = []
         for storey in storeys:
@@ -1,26 +1,17 @@
-import ifcopenshell
-
-from scripts.ifc_utils import get_element_area
+from scripts.building_facts import building_facts, ordered_sum
+from scripts.question_helpers import open_ifc
 
 
 def total_floor_area(ifc_file_path):
     """Return the summed floor area of all spaces in square metres."""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-        spaces = [space for space in ifc_file.by_type("IfcSpace")]
+        ifc_file = open_ifc(ifc_file_path)
+        spaces = building_facts(ifc_file).table(["IfcSpace"], ["area"])
 
-        if not spaces:
+        if spaces.empty:
             return 0.0
 
-        total_area = 0.0
-        for space in spaces:
-            try:
-                area = get_element_area(space)
-                if area and area > 0:
-                    total_area += area
-            except Exception:
-                continue
-
+        total_area = ordered_sum(spaces["area"][spaces["area"] > 0])
         return round(total_area, 2)
 
     except Exception as e:
@@ -1,23 +1,18 @@
-import ifcopenshell
-import ifcopenshell.geom
-
 from scripts.ifc_utils import get_element_bbox, get_length_scale, get_space_height, get_spaces_in_storey
+from scripts.question_helpers import open_ifc
 
 
 def building_height(ifc_file_path):
     """Estimate the building height in metres using space geometry and storey data."""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
 
         spaces = list(ifc_file.by_type("IfcSpace"))
         z_extents = []
-        if spaces:
-            settings = ifcopenshell.geom.settings()
-            settings.set(settings.USE_WORLD_COORDS, True)
-            for space in spaces:
-                bbox = get_element_bbox(space, settings)
-                if bbox:
-                    z_extents.extend([bbox[2], bbox[5]])
+        for space in spaces:
+            bbox = get_element_bbox(space)
+            if bbox:
+                z_extents.extend([bbox[2], bbox[5]])
 
         if z_extents:
             height = max(z_extents) - min(z_extents)
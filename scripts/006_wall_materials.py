@@ -1,11 +1,12 @@
-import ifcopenshell
 import ifcopenshell.util.element
 
+from scripts.question_helpers import open_ifc
+
 
 def wall_materials(ifc_file_path):
     """Extract unique materials used in walls"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         walls = ifc_file.by_type("IfcWall")
         materials = set()
 
@@ -1,12 +1,14 @@
 # scripts/largest_space.py
 import ifcopenshell
-import ifcopenshell.util.element
+
+from scripts.ifc_utils import get_element_psets
+from scripts.question_helpers import open_ifc
 
 
 def largest_space(ifc_file_path):
     """Find the name and area of the largest space"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
 
         max_area = 0.0
@@ -14,7 +16,7 @@ def largest_space(ifc_file_path):
 
         for space in spaces:
             # Get space area from property sets
-            psets = ifcopenshell.util.element.get_psets(space)
+            psets = get_element_psets(space)
             space_area = 0.0
 
             for pset_data in psets.values():
@@ -1,11 +1,12 @@
-import ifcopenshell
 import ifcopenshell.util.element
 
+from scripts.question_helpers import open_ifc
+
 
 def doors_per_floor(ifc_file_path):
     """Count doors on each floor"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         doors = ifc_file.by_type("IfcDoor")
         storeys = ifc_file.by_type("IfcBuildingStorey")
 
@@ -1,10 +1,10 @@
-import ifcopenshell
 from scripts.ifc_utils import is_external_wall, get_element_area
+from scripts.question_helpers import open_ifc
 
 
 def external_wall_area(ifc_file_path):
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         walls = [w for w in ifc_file.by_type("IfcWall") if hasattr(w, "is_a")]
         total_external_area = 0.0
 
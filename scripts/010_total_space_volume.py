@@ -1,24 +1,21 @@
-import ifcopenshell
-
 from scripts.ifc_utils import get_space_volume
+from scripts.scan_engine import collect, total
 
 
-def total_space_volume(ifc_file_path):
-    """Calculate total enclosed volume of all spaces in cubic metres."""
+def _volume(space):
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-        spaces = list(ifc_file.by_type("IfcSpace"))
-        total_volume = 0.0
+        volume = get_space_volume(space)
+    except Exception:
+        return None
+    return volume if volume and volume > 0 else None
+
 
-        for space in spaces:
-            try:
-                volume = get_space_volume(space)
-                if volume and volume > 0:
-                    total_volume += volume
-            except Exception:
-                continue
+SCAN = collect("IfcSpace", value=_volume, finish=lambda volumes: round(total(volumes), 2))
 
-        return round(total_volume, 2)
 
+def total_space_volume(ifc_file_path):
+    """Calculate total enclosed volume of all spaces in cubic metres."""
+    try:
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as e:
         return f"Error: {str(e)}"
@@ -2,11 +2,16 @@ import ifcopenshell
 import ifcopenshell.util.placement
 import math
 
+from scripts.question_helpers import open_ifc
+
+
+REQUIRES = ("IfcWindow",)
+
 
 def window_orientation(ifc_file_path):
     """Determine which direction most windows face"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path, requires=REQUIRES)
         windows = ifc_file.by_type("IfcWindow")
 
         if not windows:
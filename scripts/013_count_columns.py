@@ -1,11 +1,12 @@
-import ifcopenshell
+from scripts.scan_engine import count_of
+
+
+SCAN = count_of("IfcColumn", fast_path=True)
 
 
 def count_columns(ifc_file_path):
     """Count all structural columns"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-        columns = ifc_file.by_type("IfcColumn")
-        return len(columns)
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as e:
         return f"Error: {str(e)}"
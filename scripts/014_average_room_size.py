@@ -1,32 +1,21 @@
-import ifcopenshell
-from scripts.ifc_utils import get_element_area
+from scripts.building_facts import building_facts, ordered_sum
+from scripts.question_helpers import open_ifc
 
 
 def average_room_size(ifc_file_path):
     """Calculate average room size in the building, using geometry if properties are missing."""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-        spaces = ifc_file.by_type("IfcSpace")
+        ifc_file = open_ifc(ifc_file_path)
+        spaces = building_facts(ifc_file).table(["IfcSpace"], ["area"])
 
-        if not spaces:
+        if spaces.empty:
             return 0.0
 
-        total_area = 0.0
-        valid_spaces = 0
-
-        for space in spaces:
-            try:
-                area = get_element_area(space)
-            except Exception:
-                continue
-            if area and area > 0:
-                total_area += area
-                valid_spaces += 1
-
-        if valid_spaces == 0:
+        areas = spaces["area"][spaces["area"] > 0]
+        if areas.empty:
             return 0.0
 
-        average = total_area / valid_spaces
+        average = ordered_sum(areas) / len(areas)
         return round(average, 2)
 
     except Exception as e:
@@ -2,12 +2,13 @@ import ifcopenshell
 import ifcopenshell.util.placement
 
 from scripts.ifc_utils import get_length_scale
+from scripts.question_helpers import open_ifc
 
 
 def floor_most_rooms(ifc_file_path):
     """Find which floor has the most rooms using multiple relationship methods"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
         storeys = ifc_file.by_type("IfcBuildingStorey")
 
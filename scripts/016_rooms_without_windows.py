@@ -1,12 +1,11 @@
-import ifcopenshell
-
-from scripts.ifc_utils import map_elements_to_spaces
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
 
 
 def rooms_without_windows(ifc_file_path):
     """Check if there are any rooms without windows"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
         windows = ifc_file.by_type("IfcWindow")
 
@@ -16,15 +15,7 @@ def rooms_without_windows(ifc_file_path):
         if not windows:
             return True  # No windows means all rooms are without windows
 
-        element_map = map_elements_to_spaces(
-            ifc_file,
-            windows,
-            tolerance_horizontal=0.75,
-            tolerance_vertical=1.5,
-            max_matches=1,
-        )
-
-        spaces_with_windows = {space.id() for matches in element_map.values() for space in matches}
+        spaces_with_windows = get_fact(ifc_file, "lit_space_ids")
 
         # If heuristic mapping failed completely, assume windows exist but could not be matched
         if not spaces_with_windows and windows:
@@ -1,27 +1,21 @@
-import ifcopenshell
-
 from scripts.ifc_utils import get_wall_length
+from scripts.scan_engine import collect, total
 
 
-def total_wall_length(ifc_file_path):
-    """Calculate total length of all walls - simplified approach"""
+def _length(wall):
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-        walls = list(ifc_file.by_type("IfcWall"))
+        length = get_wall_length(wall)
+    except Exception:
+        return None
+    return length if length and length > 0 else None
 
-        if not walls:
-            return 0.0
 
-        total_length = 0.0
-        for wall in walls:
-            try:
-                length = get_wall_length(wall)
-            except Exception:
-                continue
-            if length and length > 0:
-                total_length += length
+SCAN = collect("IfcWall", value=_length, finish=lambda lengths: round(total(lengths), 2))
 
-        return round(total_length, 2)
 
+def total_wall_length(ifc_file_path):
+    """Calculate total length of all walls - simplified approach"""
+    try:
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as e:
         return f"Error: {str(e)}"
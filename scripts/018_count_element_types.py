@@ -1,10 +1,10 @@
-import ifcopenshell
+from scripts.question_helpers import open_ifc
 
 
 def count_element_types(ifc_file_path):
     """Count how many different types of building elements are used"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
 
         # Get all entities that are building elements
         building_element_types = set()
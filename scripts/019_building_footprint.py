@@ -1,15 +1,16 @@
 # scripts/building_footprint.py - Q019 (Hard)
 import ifcopenshell
-import ifcopenshell.util.element
-import ifcopenshell.geom
 import ifcopenshell.util.placement
 from collections import defaultdict
 
+from scripts.ifc_utils import get_element_psets, tessellate_batch
+from scripts.question_helpers import open_ifc
+
 
 def building_footprint(ifc_file_path):
     """Calculate building's footprint area using multiple methods"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
 
         # Method 1: Try to find ground floor slabs first
         footprint_area = _get_footprint_from_slabs(ifc_file)
@@ -58,7 +59,7 @@ def _get_footprint_from_slabs(ifc_file):
 
                 # Try property sets
                 if ground_floor_area == 0:
-                    psets = ifcopenshell.util.element.get_psets(slab)
+                    psets = get_element_psets(slab)
                     for pset_name, pset_data in psets.items():
                         area = pset_data.get("NetArea") or pset_data.get("GrossArea") or pset_data.get("Area")
                         if area:
@@ -110,7 +111,7 @@ def _get_footprint_from_spaces(ifc_file):
 
                         # Try property sets if no quantity found
                         if footprint_area == 0:
-                            psets = ifcopenshell.util.element.get_psets(space)
+                            psets = get_element_psets(space)
                             for pset_name, pset_data in psets.items():
                                 area = pset_data.get("FloorArea") or pset_data.get("Area") or pset_data.get("NetFloorArea")
                                 if area:
@@ -163,42 +164,14 @@ def _get_footprint_from_walls(ifc_file):
 def _get_footprint_from_geometry(ifc_file):
     """Method 4: Calculate footprint from actual 3D geometry"""
     try:
-        # Get building elements that contribute to footprint
-        elements = []
-        elements.extend(ifc_file.by_type("IfcWall"))
-        elements.extend(ifc_file.by_type("IfcSlab"))
-        elements.extend(ifc_file.by_type("IfcColumn"))
-
-        if not elements:
-            return 0.0
+        # Tessellate the building elements that contribute to footprint in one batch
+        batch = tessellate_batch(ifc_file, ["IfcWall", "IfcSlab", "IfcColumn"])
 
-        settings = ifcopenshell.geom.settings()
-        settings.set(settings.USE_WORLD_COORDS, True)
-
-        all_points = []
-
-        for element in elements:
-            try:
-                shape = ifcopenshell.geom.create_shape(settings, element)
-                if shape:
-                    geometry = shape.geometry
-                    if hasattr(geometry, "verts"):
-                        verts = geometry.verts
-                        # Extract X,Y coordinates (project to ground plane)
-                        for i in range(0, len(verts), 3):
-                            x, y = verts[i], verts[i + 1]
-                            all_points.append((x, y))
-            except Exception:
-                continue
-
-        if len(all_points) < 3:
+        if len(batch.verts) < 3:
             return 0.0
 
-        # Calculate bounding rectangle area
-        min_x = min(p[0] for p in all_points)
-        max_x = max(p[0] for p in all_points)
-        min_y = min(p[1] for p in all_points)
-        max_y = max(p[1] for p in all_points)
+        # Calculate bounding rectangle area (projected to the ground plane)
+        min_x, min_y, _, max_x, max_y, _ = batch.bounds()
 
         area = (max_x - min_x) * (max_y - min_y)
         return area if area > 0 else 0.0
@@ -1,10 +1,10 @@
-import ifcopenshell
+from scripts.question_helpers import open_ifc
 
 
 def most_common_room_type(ifc_file_path):
     """Find which room type appears most frequently"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
 
         if not spaces:
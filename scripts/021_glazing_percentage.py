@@ -1,21 +1,18 @@
-import ifcopenshell
+from scripts.facts import get_fact
 from scripts.ifc_utils import get_element_area
+from scripts.question_helpers import open_ifc
 
 
 def glazing_percentage(ifc_file_path):
     """Calculate percentage of building that is glazed (windows vs walls)"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
 
-        total_window_area = 0
-        for window in ifc_file.by_type("IfcWindow"):
-            total_window_area += get_element_area(window)
+        total_window_area = get_fact(ifc_file, "window_area_total")
         for curtain_wall in ifc_file.by_type("IfcCurtainWall"):
             total_window_area += get_element_area(curtain_wall)
 
-        total_wall_area = 0
-        for wall in ifc_file.by_type("IfcWall"):
-            total_wall_area += get_element_area(wall)
+        total_wall_area = get_fact(ifc_file, "wall_area_total")
 
         if total_wall_area == 0:
             return 0.0
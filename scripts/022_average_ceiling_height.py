@@ -1,12 +1,11 @@
-import ifcopenshell
-
 from scripts.ifc_utils import get_length_scale, get_space_height
+from scripts.question_helpers import open_ifc
 
 
 def average_ceiling_height(ifc_file_path):
     """Calculate average ceiling height in the building"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
 
         if not spaces:
@@ -1,12 +1,11 @@
-import ifcopenshell
-
-from scripts.ifc_utils import map_elements_to_spaces
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
 
 
 def naturally_lit_rooms(ifc_file_path):
     """Counts the number of rooms that have at least one mapped window."""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
     except Exception as e:
         return f"Error opening IFC file: {e}"
 
@@ -16,13 +15,4 @@ def naturally_lit_rooms(ifc_file_path):
     if not spaces or not windows:
         return 0
 
-    window_map = map_elements_to_spaces(
-        ifc_file,
-        windows,
-        tolerance_horizontal=0.75,
-        tolerance_vertical=1.5,
-        max_matches=1,
-    )
-
-    lit_space_ids = {space.id() for matches in window_map.values() for space in matches}
-    return len(lit_space_ids)
+    return len(get_fact(ifc_file, "lit_space_ids"))
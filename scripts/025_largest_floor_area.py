@@ -1,43 +1,37 @@
-import ifcopenshell
-from scripts.ifc_utils import get_spaces_in_storey, find_storey_for_element, get_element_area
+from scripts.building_facts import building_facts, grouped_sum
+from scripts.question_helpers import open_ifc
 
 
 def largest_floor_area(ifc_file_path):
     """Find which floor has the largest total area"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         storeys = ifc_file.by_type("IfcBuildingStorey")
-        spaces = ifc_file.by_type("IfcSpace")
 
         if not storeys:
             return "No floors found"
 
-        floor_areas = {}
+        facts = building_facts(ifc_file)
+
+        def floor_name(storey_id):
+            storey = ifc_file.by_id(int(storey_id))
+            return storey.Name or f"Floor_{storey.id()}"
 
         # Method 1: Sum space areas per floor
+        spaces = facts.table(["IfcSpace"], ["storey_id", "area"]).dropna(subset=["storey_id"])
+        space_totals = grouped_sum(spaces.fillna({"area": 0.0}), "storey_id", "area")
+        floor_areas = {}
         for storey in storeys:
-            storey_name = storey.Name or f"Floor_{storey.id()}"
-            total_area = 0.0
-
-            # Find spaces in this storey
-            storey_spaces = get_spaces_in_storey(storey, spaces)
-            for space in storey_spaces:
-                area = get_element_area(space)
-                total_area += area
-
+            total_area = space_totals.get(storey.id(), 0.0)
             if total_area > 0:
-                floor_areas[storey_name] = total_area
+                floor_areas[floor_name(storey.id())] = total_area
 
         # Method 2: If no spaces, try slabs
         if not floor_areas:
-            slabs = ifc_file.by_type("IfcSlab")
-            for slab in slabs:
-                # Try to associate slab with storey
-                storey = find_storey_for_element(slab, storeys)
-                if storey:
-                    storey_name = storey.Name or f"Floor_{storey.id()}"
-                    area = get_element_area(slab)
-                    floor_areas[storey_name] = floor_areas.get(storey_name, 0) + area
+            slabs = facts.table(["IfcSlab"], ["storey_id", "area"]).dropna(subset=["storey_id"])
+            for storey_id, area in grouped_sum(slabs.fillna({"area": 0.0}), "storey_id", "area").items():
+                name = floor_name(storey_id)
+                floor_areas[name] = floor_areas.get(name, 0) + area
 
         if not floor_areas:
             return "No floor areas found"
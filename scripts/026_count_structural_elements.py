@@ -1,44 +1,43 @@
-import ifcopenshell
+from scripts.ifc_utils import get_element_psets
+from scripts.scan_engine import collect
 
 
-def count_structural_elements(ifc_file_path):
-    """Count all structural elements (beams + columns + load-bearing walls)"""
-    try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
-
-        # Direct structural elements
-        beams = ifc_file.by_type("IfcBeam")
-        columns = ifc_file.by_type("IfcColumn")
-        structural_members = ifc_file.by_type("IfcStructuralMember")
+def _is_structural_wall(wall):
+    # Check if wall is load-bearing
+    if hasattr(wall, "PredefinedType"):
+        predefined = str(wall.PredefinedType).upper()
+        if "LOADBEARING" in predefined or "STRUCTURAL" in predefined:
+            return True
 
-        count = len(beams) + len(columns) + len(structural_members)
+    # Check property sets
+    psets = get_element_psets(wall)
+    for pset_data in psets.values():
+        load_bearing = pset_data.get("LoadBearing") or pset_data.get("IsLoadBearing")
+        if load_bearing:
+            return True
+    return False
 
-        # Check walls for structural/load-bearing ones
-        walls = ifc_file.by_type("IfcWall")
-        structural_walls = 0
 
-        for wall in walls:
-            is_structural = False
+def _counted(element):
+    if element.is_a("IfcWall") and not _is_structural_wall(element):
+        return None
+    return 1
 
-            # Check if wall is load-bearing
-            if hasattr(wall, "PredefinedType"):
-                predefined = str(wall.PredefinedType).upper()
-                if "LOADBEARING" in predefined or "STRUCTURAL" in predefined:
-                    is_structural = True
 
-            # Check property sets
-            if not is_structural:
-                psets = ifcopenshell.util.element.get_psets(wall)
-                for pset_data in psets.values():
-                    load_bearing = pset_data.get("LoadBearing") or pset_data.get("IsLoadBearing")
-                    if load_bearing:
-                        is_structural = True
-                        break
+# Direct structural elements, plus the walls that are load-bearing
+SCAN = collect(
+    "IfcBeam",
+    "IfcColumn",
+    "IfcStructuralMember",
+    "IfcWall",
+    value=_counted,
+    finish=lambda found: sum(len(elements) for elements in found.values()),
+)
 
-            if is_structural:
-                structural_walls += 1
-
-        return count + structural_walls
 
+def count_structural_elements(ifc_file_path):
+    """Count all structural elements (beams + columns + load-bearing walls)"""
+    try:
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as e:
         return f"Error: {str(e)}"
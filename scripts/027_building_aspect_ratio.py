@@ -1,12 +1,16 @@
 import ifcopenshell
-import ifcopenshell.geom
 import ifcopenshell.util.placement
+import numpy as np
+
+from scripts.geometry_kernels import plan_extent
+from scripts.ifc_utils import get_element_mesh
+from scripts.question_helpers import open_ifc
 
 
 def building_aspect_ratio(ifc_file_path):
     """Calculate building's aspect ratio (length to width)"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
 
         # Method 1: From building geometry
         ratio = _get_ratio_from_geometry(ifc_file)
@@ -36,33 +40,14 @@ def _get_ratio_from_geometry(ifc_file):
         if not all_elements:
             return 0.0
 
-        settings = ifcopenshell.geom.settings()
-        settings.set(settings.USE_WORLD_COORDS, True)
-
-        all_points = []
-
-        for element in all_elements[:20]:  # Limit to avoid performance issues
-            try:
-                shape = ifcopenshell.geom.create_shape(settings, element)
-                if shape:
-                    geometry = shape.geometry
-                    if hasattr(geometry, "verts"):
-                        verts = geometry.verts
-                        for i in range(0, len(verts), 3):
-                            all_points.append((verts[i], verts[i + 1]))
-            except:
-                continue
-
-        if len(all_points) < 4:
+        meshes = [get_element_mesh(element) for element in all_elements[:20]]  # Limit to avoid performance issues
+        points = [mesh.verts for mesh in meshes if mesh is not None]
+        if sum(len(verts) for verts in points) < 4:
             return 0.0
 
-        min_x = min(p[0] for p in all_points)
-        max_x = max(p[0] for p in all_points)
-        min_y = min(p[1] for p in all_points)
-        max_y = max(p[1] for p in all_points)
-
-        length = max(max_x - min_x, max_y - min_y)
-        width = min(max_x - min_x, max_y - min_y)
+        extent_x, extent_y = plan_extent(np.concatenate(points))
+        length = max(extent_x, extent_y)
+        width = min(extent_x, extent_y)
 
         return length / width if width > 0 else 0.0
 
@@ -3,32 +3,27 @@ import ifcopenshell.geom
 import numpy as np
 from scipy.spatial import ConvexHull
 
+from scripts.geometry_kernels import vertices
+from scripts.ifc_utils import tessellate_batch
+from scripts.question_helpers import open_ifc
+
 
 def verts_array(shape):
-    return np.array(shape.geometry.verts).reshape(-1, 3)
+    return vertices(shape.geometry)
 
 
 def get_external_wall_points(model, settings):
-    points = []
-    for wall in model.by_type("IfcWall") + model.by_type("IfcWallStandardCase"):
-        try:
-            shape = ifcopenshell.geom.create_shape(settings, wall)
-            pts = verts_array(shape)
-            points.extend(pts)
-        except:
-            continue
-    return np.array(points)
+    batch = tessellate_batch(model, ["IfcWall", "IfcWallStandardCase"], settings=settings)
+    return batch.verts.astype(np.float64)
 
 
 def get_door_candidates(model, settings):
+    batch = tessellate_batch(model, ["IfcDoor", "IfcBuildingElementProxy"], settings=settings)
     candidates = []
     for el in model.by_type("IfcDoor") + model.by_type("IfcBuildingElementProxy"):
-        try:
-            shape = ifcopenshell.geom.create_shape(settings, el)
-            center = verts_array(shape).mean(axis=0)
-            candidates.append((el, center))
-        except:
-            continue
+        verts = batch.element_verts(el.id())
+        if verts is not None:
+            candidates.append((el, verts.mean(axis=0, dtype=np.float64)))
     return candidates
 
 
@@ -47,7 +42,7 @@ def rooms_with_outdoor_access(ifc_file_path):
     settings = ifcopenshell.geom.settings()
     settings.set(settings.USE_WORLD_COORDS, True)
 
-    model = ifcopenshell.open(ifc_file_path)
+    model = open_ifc(ifc_file_path)
 
     # 1. Build "external envelope" from wall geometry
     wall_points = get_external_wall_points(model, settings)
@@ -1,15 +1,13 @@
 import math
 
-import ifcopenshell
-import ifcopenshell.geom
-
 from scripts.ifc_utils import get_element_bbox, get_length_scale, get_wall_length, is_external_wall
+from scripts.question_helpers import open_ifc
 
 
 def building_perimeter(ifc_file_path):
     """Calculate total perimeter length of the building"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
 
         # Method 1: From external walls
         perimeter = 0
@@ -70,12 +68,10 @@ def _calculate_perimeter_from_bounding_box(ifc_file):
     # Use the bounding box of all IfcWall objects as a fallback
     try:
         walls = ifc_file.by_type("IfcWall")
-        settings = ifcopenshell.geom.settings()
-        settings.set(settings.USE_WORLD_COORDS, True)
 
         xs, ys = [], []
         for wall in walls:
-            bbox = get_element_bbox(wall, settings)
+            bbox = get_element_bbox(wall)
             if not bbox:
                 continue
             min_x, min_y, _, max_x, max_y, _ = bbox
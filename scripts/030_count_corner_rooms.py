@@ -1,18 +1,18 @@
 import ifcopenshell
-from scripts.ifc_utils import is_external_wall
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
 
 
 def count_corner_rooms(ifc_file_path):
     """Count rooms that are corner rooms (have walls on 2+ exterior sides)"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
-        walls = ifc_file.by_type("IfcWall")
 
         if not spaces:
             return 0
 
-        external_walls = [wall for wall in walls if is_external_wall(wall)]
+        external_walls = [ifc_file.by_id(wall_id) for wall_id in get_fact(ifc_file, "external_walls")]
         corner_rooms = 0
 
         for space in spaces:
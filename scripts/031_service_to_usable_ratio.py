@@ -1,11 +1,11 @@
-import ifcopenshell
 from scripts.ifc_utils import get_element_area
+from scripts.question_helpers import open_ifc
 
 
 def service_to_usable_ratio(ifc_file_path):
     """Calculate ratio of service spaces to usable spaces"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
 
         if not spaces:
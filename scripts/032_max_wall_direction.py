@@ -1,11 +1,11 @@
-import ifcopenshell
 from scripts.ifc_utils import is_external_wall, get_element_area, get_wall_direction
+from scripts.question_helpers import open_ifc
 
 
 def max_wall_direction(ifc_file_path):
     """Find which direction has the most external wall area"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         walls = ifc_file.by_type("IfcWall")
 
         external_walls = [wall for wall in walls if is_external_wall(wall)]
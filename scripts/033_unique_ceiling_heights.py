@@ -1,11 +1,11 @@
-import ifcopenshell
 from scripts.ifc_utils import get_space_height
+from scripts.question_helpers import open_ifc
 
 
 def unique_ceiling_heights(ifc_file_path):
     """Count how many different ceiling heights exist in the building"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
 
         if not spaces:
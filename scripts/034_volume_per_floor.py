@@ -1,12 +1,13 @@
 import ifcopenshell
 import ifcopenshell.util.placement
 from scripts.ifc_utils import get_space_volume
+from scripts.question_helpers import open_ifc
 
 
 def volume_per_floor(ifc_file_path):
     """Calculate total volume of enclosed spaces per floor using multiple relationship methods"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
         storeys = ifc_file.by_type("IfcBuildingStorey")
 
@@ -1,22 +1,19 @@
 import ifcopenshell
-from scripts.ifc_utils import is_external_wall
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
 
 
 def rooms_on_exterior(ifc_file_path):
     """Find which rooms share walls with the building exterior"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
-        walls = ifc_file.by_type("IfcWall")
 
         if not spaces:
             return []
 
         # Get external walls
-        external_walls = []
-        for wall in walls:
-            if is_external_wall(wall):
-                external_walls.append(wall)
+        external_walls = [ifc_file.by_id(wall_id) for wall_id in get_fact(ifc_file, "external_walls")]
 
         if not external_walls:
             return ["No external walls identified"]
@@ -1,14 +1,11 @@
-import ifcopenshell
-import ifcopenshell.geom
-import ifcopenshell.util.element
-
-from scripts.ifc_utils import get_element_area, get_length_scale
+from scripts.ifc_utils import get_element_area, get_element_bbox, get_element_psets, get_length_scale
+from scripts.question_helpers import open_ifc
 
 
 def average_room_depth(ifc_file_path):
     """Calculate average room depth (shortest dimension)"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = ifc_file.by_type("IfcSpace")
 
         if not spaces:
@@ -56,7 +53,7 @@ def _get_room_depth(space):
 
     # Method 2: From property sets
     try:
-        psets = ifcopenshell.util.element.get_psets(space)
+        psets = get_element_psets(space)
         for pset_data in psets.values():
             width = pset_data.get("Width") or pset_data.get("RoomWidth")
             depth = pset_data.get("Depth") or pset_data.get("RoomDepth")
@@ -97,34 +94,8 @@ def _get_room_depth(space):
 
 def _calculate_depth_from_geometry(space):
     """Calculate room depth from geometric representation"""
-    try:
-        if hasattr(space, "Representation") and space.Representation:
-            settings = ifcopenshell.geom.settings()
-            settings.set(settings.USE_WORLD_COORDS, True)
-
-            shape = ifcopenshell.geom.create_shape(settings, space)
-            if shape:
-                geometry = shape.geometry
-                if hasattr(geometry, "verts"):
-                    verts = geometry.verts
-
-                    # Extract X,Y coordinates
-                    points = []
-                    for i in range(0, len(verts), 3):
-                        points.append((verts[i], verts[i + 1]))
-
-                    if len(points) >= 4:
-                        # Calculate bounding box dimensions
-                        min_x = min(p[0] for p in points)
-                        max_x = max(p[0] for p in points)
-                        min_y = min(p[1] for p in points)
-                        max_y = max(p[1] for p in points)
-
-                        width = max_x - min_x
-                        height = max_y - min_y
-
-                        return min(width, height)  # Return shorter dimension
-    except Exception:
-        pass
-
-    return 0.0
+    bbox = get_element_bbox(space)
+    if bbox is None:
+        return 0.0
+    min_x, min_y, _, max_x, max_y, _ = bbox
+    return min(max_x - min_x, max_y - min_y)  # Return shorter dimension
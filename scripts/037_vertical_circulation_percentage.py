@@ -1,11 +1,11 @@
-import ifcopenshell
 from scripts.ifc_utils import get_element_area
+from scripts.question_helpers import open_ifc
 
 
 def vertical_circulation_percentage(ifc_file_path):
     """Calculate percentage of floor area dedicated to vertical circulation"""
     try:
-        ifc_file = ifcopenshell.open(ifc_file_path)
+        ifc_file = open_ifc(ifc_file_path)
         spaces = list(ifc_file.by_type("IfcSpace"))
 
         if not spaces:
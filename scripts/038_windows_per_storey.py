@@ -1,10 +1,18 @@
-from scripts.question_helpers import count_elements_by_storey, get_ordered_storeys, open_ifc
+from scripts.question_helpers import (
+    SPATIAL_RELATIONSHIPS,
+    count_elements_by_storey,
+    get_ordered_storeys,
+    open_ifc,
+)
+
+
+REQUIRES = ("IfcWindow", *SPATIAL_RELATIONSHIPS)
 
 
 def windows_per_storey(ifc_file_path):
     """Count windows assigned to each building storey."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         windows = list(model.by_type("IfcWindow"))
         if not windows:
             return {"No windows found": 0}
@@ -1,10 +1,13 @@
 from scripts.question_helpers import open_ifc, orientation_counts
 
 
+REQUIRES = ("IfcWindow",)
+
+
 def window_orientation_breakdown(ifc_file_path):
     """Return counts of windows facing each cardinal direction."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         windows = list(model.by_type("IfcWindow"))
         if not windows:
             return {"No windows found": 0}
@@ -1,10 +1,13 @@
 from scripts.question_helpers import open_ifc, orientation_counts
 
 
+REQUIRES = ("IfcDoor",)
+
+
 def door_orientation_breakdown(ifc_file_path):
     """Return counts of doors facing each cardinal direction."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         doors = list(model.by_type("IfcDoor"))
         if not doors:
             return {"No doors found": 0}
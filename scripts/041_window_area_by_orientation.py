@@ -1,12 +1,20 @@
 from collections import defaultdict
 
-from scripts.question_helpers import element_area, element_orientation, open_ifc
+from scripts.question_helpers import (
+    PROPERTY_RELATIONSHIPS,
+    element_area,
+    element_orientation,
+    open_ifc,
+)
+
+
+REQUIRES = ("IfcWindow", *PROPERTY_RELATIONSHIPS)
 
 
 def window_area_by_orientation(ifc_file_path):
     """Sum total window area grouped by cardinal orientation."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         windows = list(model.by_type("IfcWindow"))
         if not windows:
             return {"No windows found": 0.0}
@@ -1,16 +1,19 @@
-from scripts.question_helpers import elements_area_by_storey, get_ordered_storeys, open_ifc
+from scripts.building_facts import building_facts, grouped_sum
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, SPATIAL_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcWindow", *PROPERTY_RELATIONSHIPS, *SPATIAL_RELATIONSHIPS)
 
 
 def window_area_by_storey(ifc_file_path):
     """Calculate the total glazed area assigned to each storey."""
     try:
-        model = open_ifc(ifc_file_path)
-        windows = list(model.by_type("IfcWindow"))
-        if not windows:
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        windows = building_facts(model).table(["IfcWindow"], ["storey", "area"])
+        if windows.empty:
             return {"No windows found": 0.0}
 
-        storeys = get_ordered_storeys(model)
-        areas = elements_area_by_storey(storeys, windows)
+        areas = grouped_sum(windows.dropna(subset=["area"]), "storey", "area")
         return areas if areas else {"Unassigned": 0.0}
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,10 +1,13 @@
-from scripts.question_helpers import get_element_dimensions, open_ifc
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, get_element_dimensions, open_ifc
+
+
+REQUIRES = ("IfcWindow", *PROPERTY_RELATIONSHIPS)
 
 
 def window_dimension_statistics(ifc_file_path):
     """Return summary statistics for window width and height."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         windows = list(model.by_type("IfcWindow"))
         if not windows:
             return {"count": 0, "average_width": 0.0, "average_height": 0.0}
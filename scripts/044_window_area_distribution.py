@@ -1,10 +1,18 @@
-from scripts.question_helpers import element_area, open_ifc, value_distribution_buckets
+from scripts.question_helpers import (
+    PROPERTY_RELATIONSHIPS,
+    element_area,
+    open_ifc,
+    value_distribution_buckets,
+)
+
+
+REQUIRES = ("IfcWindow", *PROPERTY_RELATIONSHIPS)
 
 
 def window_area_distribution(ifc_file_path):
     """Bucket window areas into 1.0 m² intervals."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         windows = list(model.by_type("IfcWindow"))
         if not windows:
             return {}
@@ -1,19 +1,21 @@
-from scripts.question_helpers import element_area, open_ifc
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, element_area
+from scripts.scan_engine import collect
+
+
+REQUIRES = ("IfcWindow", *PROPERTY_RELATIONSHIPS)
+
+
+def _is_large(window):
+    area = element_area(window)
+    return True if area is not None and area > 2.0 else None
+
+
+SCAN = collect("IfcWindow", value=_is_large, finish=lambda found: len(found["IfcWindow"]), requires=REQUIRES)
 
 
 def windows_larger_than_two_sq_m(ifc_file_path):
     """Count windows whose glazed area exceeds 2 m²."""
     try:
-        model = open_ifc(ifc_file_path)
-        windows = list(model.by_type("IfcWindow"))
-        if not windows:
-            return 0
-
-        count = 0
-        for window in windows:
-            area = element_area(window)
-            if area is not None and area > 2.0:
-                count += 1
-        return count
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
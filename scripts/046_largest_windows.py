@@ -1,10 +1,13 @@
-from scripts.question_helpers import element_area, open_ifc
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, element_area, open_ifc
+
+
+REQUIRES = ("IfcWindow", *PROPERTY_RELATIONSHIPS)
 
 
 def largest_windows(ifc_file_path):
     """List the five windows with the greatest glazed area."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         windows = list(model.by_type("IfcWindow"))
         if not windows:
             return []
@@ -1,10 +1,18 @@
-from scripts.question_helpers import count_elements_by_storey, get_ordered_storeys, open_ifc
+from scripts.question_helpers import (
+    SPATIAL_RELATIONSHIPS,
+    count_elements_by_storey,
+    get_ordered_storeys,
+    open_ifc,
+)
+
+
+REQUIRES = ("IfcDoor", *SPATIAL_RELATIONSHIPS)
 
 
 def storey_fewest_doors(ifc_file_path):
     """Identify the storey with the lowest door count."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         doors = list(model.by_type("IfcDoor"))
         if not doors:
             return "No doors found"
@@ -1,10 +1,18 @@
-from scripts.question_helpers import get_ordered_storeys, open_ifc, orientation_counts_by_storey
+from scripts.question_helpers import (
+    SPATIAL_RELATIONSHIPS,
+    get_ordered_storeys,
+    open_ifc,
+    orientation_counts_by_storey,
+)
+
+
+REQUIRES = ("IfcDoor", *SPATIAL_RELATIONSHIPS)
 
 
 def door_orientation_by_storey(ifc_file_path):
     """Provide door orientation breakdown for each storey."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         doors = list(model.by_type("IfcDoor"))
         if not doors:
             return {}
@@ -1,10 +1,13 @@
-from scripts.question_helpers import get_element_dimensions, open_ifc
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, get_element_dimensions, open_ifc
+
+
+REQUIRES = ("IfcDoor", *PROPERTY_RELATIONSHIPS)
 
 
 def door_dimension_statistics(ifc_file_path):
     """Return summary statistics for door width and height."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         doors = list(model.by_type("IfcDoor"))
         if not doors:
             return {"count": 0, "average_width": 0.0, "average_height": 0.0}
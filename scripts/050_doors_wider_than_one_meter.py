@@ -1,10 +1,13 @@
-from scripts.question_helpers import get_element_dimensions, open_ifc
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, get_element_dimensions, open_ifc
+
+
+REQUIRES = ("IfcDoor", *PROPERTY_RELATIONSHIPS)
 
 
 def doors_wider_than_one_meter(ifc_file_path):
     """Count doors with clear width greater than 1.0 m."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         doors = list(model.by_type("IfcDoor"))
         if not doors:
             return 0
@@ -1,10 +1,12 @@
-from scripts.question_helpers import open_ifc
+from scripts.scan_engine import count_of
+
+
+SCAN = count_of("IfcCurtainWall", fast_path=True)
 
 
 def count_curtain_walls(ifc_file_path):
     """Count the number of curtain wall assemblies."""
     try:
-        model = open_ifc(ifc_file_path)
-        return len(list(model.by_type("IfcCurtainWall")))
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,14 +1,12 @@
-from scripts.question_helpers import elements_area_by_storey, get_ordered_storeys, open_ifc
+from scripts.building_facts import building_facts, grouped_sum
+from scripts.question_helpers import open_ifc
 
 
 def space_area_by_storey(ifc_file_path):
     """Sum space floor area for each storey."""
     try:
         model = open_ifc(ifc_file_path)
-        spaces = list(model.by_type("IfcSpace"))
-        if not spaces:
-            return {}
-        storeys = get_ordered_storeys(model)
-        return elements_area_by_storey(storeys, spaces)
+        spaces = building_facts(model).table(["IfcSpace"], ["storey", "area"]).dropna(subset=["area"])
+        return grouped_sum(spaces, "storey", "area")
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,20 +1,12 @@
-from collections import defaultdict
-
-from scripts.question_helpers import classify_space_usage, open_ifc
+from scripts.building_facts import building_facts
+from scripts.question_helpers import open_ifc
 
 
 def space_usage_breakdown(ifc_file_path):
     """Group spaces into high-level usage categories using keyword heuristics."""
     try:
         model = open_ifc(ifc_file_path)
-        spaces = list(model.by_type("IfcSpace"))
-        if not spaces:
-            return {}
-
-        counts = defaultdict(int)
-        for space in spaces:
-            category = classify_space_usage(space)
-            counts[category] += 1
-        return dict(counts)
+        spaces = building_facts(model).table(["IfcSpace"], ["usage"])
+        return {usage: int(count) for usage, count in spaces.groupby("usage", sort=False).size().items()}
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
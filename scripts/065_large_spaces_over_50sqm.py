@@ -1,18 +1,18 @@
-from scripts.question_helpers import element_area, open_ifc
+from scripts.building_facts import building_facts
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcSpace", *PROPERTY_RELATIONSHIPS)
 
 
 def large_spaces_over_50sqm(ifc_file_path):
     """List spaces whose area exceeds 50 m²."""
     try:
-        model = open_ifc(ifc_file_path)
-        spaces = list(model.by_type("IfcSpace"))
-        result = []
-        for space in spaces:
-            area = element_area(space)
-            if area is None or area <= 50.0:
-                continue
-            name = getattr(space, "Name", None) or getattr(space, "LongName", None) or getattr(space, "GlobalId", "Unknown")
-            result.append({"name": str(name), "area": area})
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        spaces = building_facts(model).table(["IfcSpace"], ["area", "display_name"])
+        large = spaces[spaces["area"] > 50.0]
+        names, areas = large["display_name"].tolist(), large["area"].tolist()
+        result = [{"name": name, "area": area} for name, area in zip(names, areas)]
         result.sort(key=lambda item: item["area"], reverse=True)
         return result
     except Exception as exc:  # pragma: no cover
@@ -1,22 +1,21 @@
-from scripts.question_helpers import element_area, open_ifc
+from scripts.building_facts import building_facts
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcSpace", *PROPERTY_RELATIONSHIPS)
 
 
 def top10_largest_spaces(ifc_file_path):
     """Return the ten largest spaces by area."""
     try:
-        model = open_ifc(ifc_file_path)
-        spaces = list(model.by_type("IfcSpace"))
-        if not spaces:
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        spaces = building_facts(model).table(["IfcSpace"], ["area", "display_name"])
+        if spaces.empty:
             return []
 
-        items = []
-        for space in spaces:
-            area = element_area(space)
-            if area is None or area <= 0:
-                continue
-            name = getattr(space, "Name", None) or getattr(space, "LongName", None) or getattr(space, "GlobalId", "Unknown")
-            items.append({"name": str(name), "area": area})
-
+        sized = spaces[spaces["area"] > 0]
+        names, areas = sized["display_name"].tolist(), sized["area"].tolist()
+        items = [{"name": name, "area": area} for name, area in zip(names, areas)]
         items.sort(key=lambda item: item["area"], reverse=True)
         return items[:10]
     except Exception as exc:  # pragma: no cover
@@ -1,4 +1,4 @@
-from scripts.ifc_utils import map_elements_to_spaces
+from scripts.facts import get_fact
 from scripts.question_helpers import element_orientation, open_ifc
 
 
@@ -11,14 +11,7 @@ def spaces_with_multi_orientation_windows(ifc_file_path):
         if not spaces or not windows:
             return []
 
-        window_map = map_elements_to_spaces(
-            model,
-            windows,
-            spaces=spaces,
-            tolerance_horizontal=0.75,
-            tolerance_vertical=1.5,
-            max_matches=1,
-        )
+        window_map = get_fact(model, "window_space_map")
 
         orientation_map = {}
         for window in windows:
@@ -28,7 +21,7 @@ def spaces_with_multi_orientation_windows(ifc_file_path):
             orientation = element_orientation(window)
             if not orientation:
                 continue
-            space = mapped_spaces[0]
+            space = model.by_id(mapped_spaces[0])
             key = space.id()
             if key not in orientation_map:
                 orientation_map[key] = {"name": getattr(space, "Name", None) or getattr(space, "LongName", None) or getattr(space, "GlobalId", "Unknown"), "orientations": set()}
@@ -1,6 +1,7 @@
 from collections import defaultdict
 
-from scripts.ifc_utils import find_storey_for_element, map_elements_to_spaces
+from scripts.facts import get_fact
+from scripts.ifc_utils import find_storey_for_element
 from scripts.question_helpers import get_ordered_storeys, open_ifc, storey_label
 
 
@@ -25,22 +26,14 @@ def windowed_space_ratio_by_storey(ifc_file_path):
         if not windows:
             return {key: 0.0 for key in storey_counts}
 
-        window_map = map_elements_to_spaces(
-            model,
-            windows,
-            spaces=spaces,
-            tolerance_horizontal=0.75,
-            tolerance_vertical=1.5,
-            max_matches=1,
-        )
+        window_map = get_fact(model, "window_space_map")
 
         storey_window_counts = defaultdict(int)
         seen = set()
         for mapped_spaces in window_map.values():
             if not mapped_spaces:
                 continue
-            space = mapped_spaces[0]
-            sid = space.id()
+            sid = mapped_spaces[0]
             if sid in seen:
                 continue
             seen.add(sid)
@@ -1,5 +1,5 @@
-from scripts.ifc_utils import map_elements_to_spaces
-from scripts.question_helpers import element_area, open_ifc
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
 
 
 def lit_space_area_ratio(ifc_file_path):
@@ -11,9 +11,10 @@ def lit_space_area_ratio(ifc_file_path):
         if not spaces:
             return 0.0
 
+        space_areas = get_fact(model, "space_areas")
         total_area = 0.0
         for space in spaces:
-            area = element_area(space)
+            area = space_areas[space.id()]
             if area is not None:
                 total_area += area
 
@@ -23,21 +24,12 @@ def lit_space_area_ratio(ifc_file_path):
         if not windows:
             return 0.0
 
-        window_map = map_elements_to_spaces(
-            model,
-            windows,
-            spaces=spaces,
-            tolerance_horizontal=0.75,
-            tolerance_vertical=1.5,
-            max_matches=1,
-        )
-
-        lit_space_ids = {space.id() for matches in window_map.values() for space in matches}
+        lit_space_ids = get_fact(model, "lit_space_ids")
         lit_area = 0.0
         for space in spaces:
             if space.id() not in lit_space_ids:
                 continue
-            area = element_area(space)
+            area = space_areas[space.id()]
             if area is not None:
                 lit_area += area
         return lit_area / total_area if total_area else 0.0
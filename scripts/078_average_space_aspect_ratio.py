@@ -1,4 +1,4 @@
-from scripts.ifc_utils import get_element_bbox
+from scripts.building_facts import building_facts, ordered_sum
 from scripts.question_helpers import open_ifc
 
 
@@ -6,21 +6,9 @@ def average_space_aspect_ratio(ifc_file_path):
     """Compute average plan aspect ratio (long side / short side) across spaces."""
     try:
         model = open_ifc(ifc_file_path)
-        ratios = []
-        for space in model.by_type("IfcSpace"):
-            bbox = get_element_bbox(space)
-            if not bbox:
-                continue
-            min_x, min_y, _, max_x, max_y, _ = bbox
-            width = max_x - min_x
-            depth = max_y - min_y
-            short_side = min(width, depth)
-            long_side = max(width, depth)
-            if short_side <= 0 or long_side <= 0:
-                continue
-            ratios.append(long_side / short_side)
-        if not ratios:
+        ratios = building_facts(model).table(["IfcSpace"], ["aspect_ratio"])["aspect_ratio"].dropna()
+        if ratios.empty:
             return 0.0
-        return sum(ratios) / len(ratios)
+        return ordered_sum(ratios) / len(ratios)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
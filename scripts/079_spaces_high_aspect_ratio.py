@@ -1,4 +1,4 @@
-from scripts.ifc_utils import get_element_bbox
+from scripts.building_facts import building_facts
 from scripts.question_helpers import open_ifc
 
 
@@ -6,22 +6,10 @@ def spaces_high_aspect_ratio(ifc_file_path):
     """List spaces whose plan aspect ratio exceeds 2:1."""
     try:
         model = open_ifc(ifc_file_path)
-        result = []
-        for space in model.by_type("IfcSpace"):
-            bbox = get_element_bbox(space)
-            if not bbox:
-                continue
-            min_x, min_y, _, max_x, max_y, _ = bbox
-            width = max_x - min_x
-            depth = max_y - min_y
-            short_side = min(width, depth)
-            long_side = max(width, depth)
-            if short_side <= 0 or long_side <= 0:
-                continue
-            ratio = long_side / short_side
-            if ratio > 2.0:
-                name = getattr(space, "Name", None) or getattr(space, "LongName", None) or getattr(space, "GlobalId", "Unknown")
-                result.append({"name": str(name), "ratio": ratio})
+        spaces = building_facts(model).table(["IfcSpace"], ["aspect_ratio", "display_name"])
+        elongated = spaces[spaces["aspect_ratio"] > 2.0]
+        names, ratios = elongated["display_name"].tolist(), elongated["aspect_ratio"].tolist()
+        result = [{"name": name, "ratio": ratio} for name, ratio in zip(names, ratios)]
         result.sort(key=lambda item: item["ratio"], reverse=True)
         return result
     except Exception as exc:  # pragma: no cover
@@ -1,4 +1,8 @@
-from scripts.question_helpers import element_area, open_ifc
+from scripts.building_facts import building_facts, ordered_sum
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcSpace", *PROPERTY_RELATIONSHIPS)
 
 CORRIDOR_KEYWORDS = ["corridor", "hallway", "hall", "passage", "lobby"]
 
@@ -6,24 +10,9 @@ CORRIDOR_KEYWORDS = ["corridor", "hallway", "hall", "passage", "lobby"]
 def corridor_area_total(ifc_file_path):
     """Total area of circulation spaces identified as corridors or halls."""
     try:
-        model = open_ifc(ifc_file_path)
-        total = 0.0
-        for space in model.by_type("IfcSpace"):
-            labels = " ".join(
-                str(value)
-                for value in (
-                    getattr(space, "LongName", ""),
-                    getattr(space, "Name", ""),
-                    getattr(space, "ObjectType", ""),
-                    getattr(space, "Description", ""),
-                )
-                if value
-            ).lower()
-            if not any(keyword in labels for keyword in CORRIDOR_KEYWORDS):
-                continue
-            area = element_area(space)
-            if area is not None:
-                total += area
-        return total
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        spaces = building_facts(model).table(["IfcSpace"], ["label_text", "area"]).dropna(subset=["area"])
+        corridors = spaces["label_text"].map(lambda labels: any(keyword in labels for keyword in CORRIDOR_KEYWORDS))
+        return ordered_sum(spaces["area"][corridors.astype(bool)])
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
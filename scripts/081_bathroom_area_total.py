@@ -1,4 +1,8 @@
-from scripts.question_helpers import element_area, open_ifc
+from scripts.building_facts import building_facts, ordered_sum
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcSpace", *PROPERTY_RELATIONSHIPS)
 
 BATHROOM_KEYWORDS = ["bath", "toilet", "wc", "restroom", "lavatory", "sanitary"]
 
@@ -6,24 +10,9 @@ BATHROOM_KEYWORDS = ["bath", "toilet", "wc", "restroom", "lavatory", "sanitary"]
 def bathroom_area_total(ifc_file_path):
     """Total area of sanitary spaces (bathrooms, toilets, restrooms)."""
     try:
-        model = open_ifc(ifc_file_path)
-        total = 0.0
-        for space in model.by_type("IfcSpace"):
-            labels = " ".join(
-                str(value)
-                for value in (
-                    getattr(space, "LongName", ""),
-                    getattr(space, "Name", ""),
-                    getattr(space, "ObjectType", ""),
-                    getattr(space, "Description", ""),
-                )
-                if value
-            ).lower()
-            if not any(keyword in labels for keyword in BATHROOM_KEYWORDS):
-                continue
-            area = element_area(space)
-            if area is not None:
-                total += area
-        return total
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        spaces = building_facts(model).table(["IfcSpace"], ["label_text", "area"]).dropna(subset=["area"])
+        bathrooms = spaces["label_text"].map(lambda labels: any(keyword in labels for keyword in BATHROOM_KEYWORDS))
+        return ordered_sum(spaces["area"][bathrooms.astype(bool)])
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,23 +1,12 @@
-from collections import defaultdict
-
-from scripts.question_helpers import classify_space_usage, element_area, open_ifc
+from scripts.building_facts import building_facts, grouped_sum
+from scripts.question_helpers import open_ifc
 
 
 def space_area_by_usage(ifc_file_path):
     """Total area grouped by inferred space usage category."""
     try:
         model = open_ifc(ifc_file_path)
-        spaces = list(model.by_type("IfcSpace"))
-        if not spaces:
-            return {}
-
-        totals = defaultdict(float)
-        for space in spaces:
-            area = element_area(space)
-            if area is None:
-                continue
-            category = classify_space_usage(space)
-            totals[category] += area
-        return dict(totals)
+        spaces = building_facts(model).table(["IfcSpace"], ["area", "usage"]).dropna(subset=["area"])
+        return grouped_sum(spaces, "usage", "area")
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
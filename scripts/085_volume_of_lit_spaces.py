@@ -1,4 +1,5 @@
-from scripts.ifc_utils import get_space_volume, map_elements_to_spaces
+from scripts.facts import get_fact
+from scripts.ifc_utils import get_space_volume
 from scripts.question_helpers import open_ifc
 
 
@@ -11,15 +12,7 @@ def volume_of_lit_spaces(ifc_file_path):
         if not spaces or not windows:
             return 0.0
 
-        window_map = map_elements_to_spaces(
-            model,
-            windows,
-            spaces=spaces,
-            tolerance_horizontal=0.75,
-            tolerance_vertical=1.5,
-            max_matches=1,
-        )
-        lit_space_ids = {space.id() for matches in window_map.values() for space in matches}
+        lit_space_ids = get_fact(model, "lit_space_ids")
         total = 0.0
         for space in spaces:
             if space.id() not in lit_space_ids:
@@ -1,28 +1,30 @@
-from scripts.question_helpers import get_ordered_storeys, open_ifc, storey_elevation, storey_label
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
+
+
+REQUIRES = ("IfcBuildingStorey",)
 
 
 def storey_height_differences(ifc_file_path):
     """Return elevation differences between successive storeys."""
     try:
-        model = open_ifc(ifc_file_path)
-        storeys = get_ordered_storeys(model)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        storeys = get_fact(model, "storey_elevations")
         if len(storeys) < 2:
             return []
 
         differences = []
-        previous = storeys[0]
-        prev_elev = storey_elevation(previous)
-        for current in storeys[1:]:
-            curr_elev = storey_elevation(current)
+        _, prev_label, prev_elev = storeys[0]
+        for _, curr_label, curr_elev in storeys[1:]:
             diff = curr_elev - prev_elev
             differences.append(
                 {
-                    "from": storey_label(previous),
-                    "to": storey_label(current),
+                    "from": prev_label,
+                    "to": curr_label,
                     "height": diff,
                 }
             )
-            previous = current
+            prev_label = curr_label
             prev_elev = curr_elev
         return differences
     except Exception as exc:  # pragma: no cover
@@ -1,18 +1,21 @@
-from scripts.question_helpers import get_ordered_storeys, open_ifc, storey_elevation
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
+
+
+REQUIRES = ("IfcBuildingStorey",)
 
 
 def average_storey_height(ifc_file_path):
     """Average vertical spacing between consecutive storeys."""
     try:
-        model = open_ifc(ifc_file_path)
-        storeys = get_ordered_storeys(model)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        storeys = get_fact(model, "storey_elevations")
         if len(storeys) < 2:
             return 0.0
 
         diffs = []
-        prev_elev = storey_elevation(storeys[0])
-        for storey in storeys[1:]:
-            curr_elev = storey_elevation(storey)
+        _, _, prev_elev = storeys[0]
+        for _, _, curr_elev in storeys[1:]:
             diffs.append(curr_elev - prev_elev)
             prev_elev = curr_elev
         diffs = [diff for diff in diffs if diff > 0]
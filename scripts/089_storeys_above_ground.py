@@ -1,10 +1,14 @@
-from scripts.question_helpers import get_ordered_storeys, open_ifc, storey_elevation
+from scripts.facts import get_fact
+from scripts.question_helpers import open_ifc
+
+
+REQUIRES = ("IfcBuildingStorey",)
 
 
 def storeys_above_ground(ifc_file_path):
     """Count storeys with elevation at or above 0."""
     try:
-        model = open_ifc(ifc_file_path)
-        return sum(1 for storey in get_ordered_storeys(model) if storey_elevation(storey) >= 0)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        return sum(1 for _, _, elevation in get_fact(model, "storey_elevations") if elevation >= 0)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
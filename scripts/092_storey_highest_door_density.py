@@ -1,30 +1,26 @@
-from scripts.question_helpers import (
-    count_elements_by_storey,
-    elements_area_by_storey,
-    get_ordered_storeys,
-    open_ifc,
-)
+from scripts.building_facts import building_facts, grouped_sum
+from scripts.question_helpers import open_ifc
 
 
 def storey_highest_door_density(ifc_file_path):
     """Find the storey with the highest number of doors per square metre."""
     try:
         model = open_ifc(ifc_file_path)
-        doors = list(model.by_type("IfcDoor"))
-        spaces = list(model.by_type("IfcSpace"))
-        if not doors or not spaces:
+        facts = building_facts(model)
+        doors = facts.table(["IfcDoor"], ["storey"])
+        spaces = facts.table(["IfcSpace"], ["storey", "area"])
+        if doors.empty or spaces.empty:
             return "Insufficient data"
 
-        storeys = get_ordered_storeys(model)
-        door_counts = count_elements_by_storey(storeys, doors)
-        area_totals = elements_area_by_storey(storeys, spaces)
+        door_counts = doors.groupby("storey", sort=False).size()
+        area_totals = grouped_sum(spaces.dropna(subset=["area"]), "storey", "area")
 
         ratios = {}
         for storey_name, door_count in door_counts.items():
             area = area_totals.get(storey_name)
             if area is None or area <= 0:
                 continue
-            ratios[storey_name] = door_count / area
+            ratios[storey_name] = int(door_count) / area
 
         if not ratios:
             return "No ratios computed"
@@ -1,15 +1,17 @@
-from scripts.question_helpers import count_elements_by_storey, get_ordered_storeys, open_ifc
+from scripts.building_facts import building_facts
+from scripts.question_helpers import SPATIAL_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcColumn", *SPATIAL_RELATIONSHIPS)
 
 
 def column_count_by_storey(ifc_file_path):
     """Count structural columns per storey."""
     try:
-        model = open_ifc(ifc_file_path)
-        columns = list(model.by_type("IfcColumn"))
-        if not columns:
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        columns = building_facts(model).table(["IfcColumn"], ["storey"])
+        if columns.empty:
             return {"No columns": 0}
-        storeys = get_ordered_storeys(model)
-        counts = count_elements_by_storey(storeys, columns)
-        return counts if counts else {"Unassigned": len(columns)}
+        return {storey: int(count) for storey, count in columns.groupby("storey", sort=False).size().items()}
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,17 +1,19 @@
-from scripts.question_helpers import count_elements_by_storey, get_ordered_storeys, open_ifc
+from scripts.building_facts import building_facts
+from scripts.question_helpers import SPATIAL_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcWindow", *SPATIAL_RELATIONSHIPS)
 
 
 def storey_most_windows(ifc_file_path):
     """Identify the storey with the highest window count."""
     try:
-        model = open_ifc(ifc_file_path)
-        windows = list(model.by_type("IfcWindow"))
-        if not windows:
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        windows = building_facts(model).table(["IfcWindow"], ["storey"])
+        if windows.empty:
             return "No windows found"
-        storeys = get_ordered_storeys(model)
-        counts = count_elements_by_storey(storeys, windows)
-        if not counts:
-            return "No storey assignments"
+
+        counts = {storey: int(count) for storey, count in windows.groupby("storey", sort=False).size().items()}
         target = max(counts.items(), key=lambda item: (item[1], item[0]))
         return target[0]
     except Exception as exc:  # pragma: no cover
@@ -1,10 +1,12 @@
-from scripts.question_helpers import open_ifc
+from scripts.scan_engine import count_of
+
+
+SCAN = count_of("IfcBeam", fast_path=True)
 
 
 def count_beams(ifc_file_path):
     """Count structural beams in the model."""
     try:
-        model = open_ifc(ifc_file_path)
-        return len(list(model.by_type("IfcBeam")))
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,21 +1,27 @@
 from scripts.ifc_utils import get_element_bbox
-from scripts.question_helpers import open_ifc
+from scripts.scan_engine import collect, total
+
+
+REQUIRES = ("IfcBeam",)
+
+
+def _length(beam):
+    """Approximate a beam's centerline length by the longest side of its bounding box."""
+    bbox = get_element_bbox(beam)
+    if not bbox:
+        return None
+    min_x, min_y, min_z, max_x, max_y, max_z = bbox
+    spans = [max_x - min_x, max_y - min_y, max_z - min_z]
+    length = max(spans)
+    return length if length > 0 else None
+
+
+SCAN = collect("IfcBeam", value=_length, finish=total, requires=REQUIRES)
 
 
 def total_beam_length(ifc_file_path):
     """Approximate total beam centerline length using bounding boxes."""
     try:
-        model = open_ifc(ifc_file_path)
-        total = 0.0
-        for beam in model.by_type("IfcBeam"):
-            bbox = get_element_bbox(beam)
-            if not bbox:
-                continue
-            min_x, min_y, min_z, max_x, max_y, max_z = bbox
-            spans = [max_x - min_x, max_y - min_y, max_z - min_z]
-            length = max(spans)
-            if length > 0:
-                total += length
-        return total
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
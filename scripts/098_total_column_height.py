@@ -1,21 +1,24 @@
 from scripts.ifc_utils import get_element_bbox
-from scripts.question_helpers import open_ifc
+from scripts.scan_engine import collect, total
+
+
+REQUIRES = ("IfcColumn",)
+
+
+def _height(column):
+    bbox = get_element_bbox(column)
+    if not bbox:
+        return None
+    height = bbox[5] - bbox[2]
+    return height if height > 0 else None
+
+
+SCAN = collect("IfcColumn", value=_height, finish=total, requires=REQUIRES)
 
 
 def total_column_height(ifc_file_path):
     """Sum vertical extents of structural columns."""
     try:
-        model = open_ifc(ifc_file_path)
-        total = 0.0
-        for column in model.by_type("IfcColumn"):
-            bbox = get_element_bbox(column)
-            if not bbox:
-                continue
-            min_z = bbox[2]
-            max_z = bbox[5]
-            height = max_z - min_z
-            if height > 0:
-                total += height
-        return total
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
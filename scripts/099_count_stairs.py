@@ -1,12 +1,21 @@
-from scripts.question_helpers import open_ifc
+from scripts.scan_engine import collect
+
+
+REQUIRES = ("IfcStair", "IfcStairFlight")
+
+
+def _counts(found):
+    stairs = len(found["IfcStair"])
+    flights = len(found["IfcStairFlight"])
+    return {"IfcStair": stairs, "IfcStairFlight": flights, "total": stairs + flights}
+
+
+SCAN = collect(*REQUIRES, value=lambda element: 1, finish=_counts, requires=REQUIRES)
 
 
 def count_stairs(ifc_file_path):
     """Count stair assemblies and stair flights."""
     try:
-        model = open_ifc(ifc_file_path)
-        stairs = len(list(model.by_type("IfcStair")))
-        flights = len(list(model.by_type("IfcStairFlight")))
-        return {"IfcStair": stairs, "IfcStairFlight": flights, "total": stairs + flights}
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
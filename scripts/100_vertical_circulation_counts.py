@@ -1,17 +1,30 @@
-from scripts.question_helpers import open_ifc
+from scripts.scan_engine import collect
+
+
+REQUIRES = ("IfcStair", "IfcStairFlight", "IfcRamp", "IfcRampFlight", "IfcTransportElement")
+
+
+def _counted(element):
+    if not element.is_a("IfcTransportElement"):
+        return 1
+    predefined = getattr(element, "PredefinedType", None)
+    return 1 if predefined and str(predefined).upper() == "ELEVATOR" else None
+
+
+def _counts(found):
+    return {
+        "stairs": len(found["IfcStair"]) + len(found["IfcStairFlight"]),
+        "ramps": len(found["IfcRamp"]) + len(found["IfcRampFlight"]),
+        "elevators": len(found["IfcTransportElement"]),
+    }
+
+
+SCAN = collect(*REQUIRES, value=_counted, finish=_counts, requires=REQUIRES)
 
 
 def vertical_circulation_counts(ifc_file_path):
     """Count major vertical circulation elements (stairs, ramps, elevators)."""
     try:
-        model = open_ifc(ifc_file_path)
-        stair_count = len(list(model.by_type("IfcStair"))) + len(list(model.by_type("IfcStairFlight")))
-        ramp_count = len(list(model.by_type("IfcRamp"))) + len(list(model.by_type("IfcRampFlight")))
-        elevators = 0
-        for element in model.by_type("IfcTransportElement"):
-            predefined = getattr(element, "PredefinedType", None)
-            if predefined and str(predefined).upper() == "ELEVATOR":
-                elevators += 1
-        return {"stairs": stair_count, "ramps": ramp_count, "elevators": elevators}
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,15 +1,19 @@
 from scripts.question_helpers import open_ifc
+from scripts.scan_engine import count_of
+
+
+def _is_elevator(element):
+    predefined = getattr(element, "PredefinedType", None)
+    return bool(predefined and str(predefined).upper() == "ELEVATOR")
+
+
+SCAN = count_of("IfcTransportElement", where=_is_elevator)
 
 
 def count_elevators(ifc_file_path):
     """Count transport elements classified as elevators."""
     try:
         model = open_ifc(ifc_file_path)
-        count = 0
-        for element in model.by_type("IfcTransportElement"):
-            predefined = getattr(element, "PredefinedType", None)
-            if predefined and str(predefined).upper() == "ELEVATOR":
-                count += 1
-        return count
+        return SCAN.evaluate(model)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,15 +1,22 @@
-from scripts.question_helpers import elements_area_by_storey, get_ordered_storeys, open_ifc, unique_elements
+from scripts.building_facts import building_facts, grouped_sum
+from scripts.question_helpers import PROPERTY_RELATIONSHIPS, SPATIAL_RELATIONSHIPS, open_ifc
+
+
+REQUIRES = ("IfcSlab", *PROPERTY_RELATIONSHIPS, *SPATIAL_RELATIONSHIPS)
 
 
 def slab_area_by_storey(ifc_file_path):
     """Total slab area per storey."""
     try:
-        model = open_ifc(ifc_file_path)
-        slabs = unique_elements(model.by_type("IfcSlab"))
-        if not slabs:
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
+        slabs = building_facts(model).table(["IfcSlab"], ["storey", "area"])
+        # Count a GlobalId shared by several slabs once, as unique_elements does.
+        global_ids = slabs["global_id"]
+        shared = global_ids.notna() & (global_ids != "") & global_ids.duplicated()
+        slabs = slabs[~shared]
+        if slabs.empty:
             return {"No slabs": 0.0}
-        storeys = get_ordered_storeys(model)
-        areas = elements_area_by_storey(storeys, slabs)
+        areas = grouped_sum(slabs.dropna(subset=["area"]), "storey", "area")
         return areas if areas else {"Unassigned": 0.0}
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
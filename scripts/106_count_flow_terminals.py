@@ -1,10 +1,12 @@
-from scripts.question_helpers import open_ifc, safe_by_type
+from scripts.scan_engine import count_of
+
+
+SCAN = count_of("IfcFlowTerminal", safe=True, fast_path=True)
 
 
 def count_flow_terminals(ifc_file_path):
     """Count HVAC/MEP flow terminals (diffusers, grilles, outlets)."""
     try:
-        model = open_ifc(ifc_file_path)
-        return len(safe_by_type(model, "IfcFlowTerminal"))
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -1,10 +1,13 @@
 from scripts.question_helpers import open_ifc, safe_by_type
 
 
+REQUIRES = ("IfcFurniture",)
+
+
 def top_furniture_types(ifc_file_path):
     """List the five most common furniture types by count."""
     try:
-        model = open_ifc(ifc_file_path)
+        model = open_ifc(ifc_file_path, requires=REQUIRES)
         furniture = safe_by_type(model, "IfcFurniture")
         if not furniture:
             return []
@@ -1,21 +1,27 @@
 from scripts.ifc_utils import get_element_bbox
-from scripts.question_helpers import open_ifc
+from scripts.scan_engine import collect, total
+
+
+REQUIRES = ("IfcRailing",)
+
+
+def _length(railing):
+    """Approximate a railing's length by the longer horizontal side of its bounding box."""
+    bbox = get_element_bbox(railing)
+    if not bbox:
+        return None
+    min_x, min_y, _, max_x, max_y, _ = bbox
+    spans = [max_x - min_x, max_y - min_y]
+    length = max(spans)
+    return length if length > 0 else None
+
+
+SCAN = collect("IfcRailing", value=_length, finish=total, requires=REQUIRES)
 
 
 def total_railing_length(ifc_file_path):
     """Approximate total railing length using bounding boxes."""
     try:
-        model = open_ifc(ifc_file_path)
-        total = 0.0
-        for railing in model.by_type("IfcRailing"):
-            bbox = get_element_bbox(railing)
-            if not bbox:
-                continue
-            min_x, min_y, _, max_x, max_y, _ = bbox
-            spans = [max_x - min_x, max_y - min_y]
-            length = max(spans)
-            if length > 0:
-                total += length
-        return total
+        return SCAN.evaluate_file(ifc_file_path)
     except Exception as exc:  # pragma: no cover
         return f"Error: {exc}"
@@ -0,0 +1,233 @@
+"""Columnar per-element facts for aggregate questions."""
+
+from __future__ import annotations
+
+import math
+import weakref
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import ifcopenshell
+import pandas as pd
+
+from scripts.ifc_utils import get_element_bbox, get_space_height, get_space_volume, is_external_wall, storey_resolver
+from scripts.question_helpers import (
+    classify_space_usage,
+    element_area,
+    element_orientation,
+    get_element_dimensions,
+    get_ordered_storeys,
+    storey_elevation,
+    storey_label,
+)
+
+
+FACT_COLUMNS = (
+    "storey_id",
+    "storey",
+    "storey_elevation",
+    "area",
+    "volume",
+    "height",
+    "width",
+    "orientation",
+    "is_external",
+    "usage",
+    "display_name",
+    "label_text",
+    "aspect_ratio",
+)
+DEFAULT_CLASSES = ("IfcSpace", "IfcWall", "IfcSlab", "IfcDoor", "IfcWindow", "IfcColumn", "IfcBeam")
+UNASSIGNED = "Unassigned"
+
+
+def _safe(getter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def call(element):
+        try:
+            return getter(element)
+        except Exception:
+            return None
+
+    return call
+
+
+def _space_only(getter: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    return lambda element: getter(element) if element.is_a("IfcSpace") else None
+
+
+def _height(element) -> Optional[float]:
+    if element.is_a("IfcSpace"):
+        return get_space_height(element)
+    if element.is_a("IfcDoor") or element.is_a("IfcWindow"):
+        return get_element_dimensions(element)[1]
+    return None
+
+
+def _width(element) -> Optional[float]:
+    if element.is_a("IfcDoor") or element.is_a("IfcWindow"):
+        return get_element_dimensions(element)[0]
+    return None
+
+
+def _is_external(element) -> Optional[bool]:
+    return bool(is_external_wall(element)) if element.is_a("IfcWall") else None
+
+
+def _display_name(element) -> str:
+    name = getattr(element, "Name", None) or getattr(element, "LongName", None) or getattr(element, "GlobalId", "Unknown")
+    return str(name)
+
+
+def _label_text(element) -> str:
+    """Lower-cased LongName, Name, ObjectType and Description, for keyword filters."""
+    values = (getattr(element, attr, "") for attr in ("LongName", "Name", "ObjectType", "Description"))
+    return " ".join(str(value) for value in values if value).lower()
+
+
+def _aspect_ratio(element) -> Optional[float]:
+    """Long side over short side of the element's plan bounding box."""
+    bbox = get_element_bbox(element)
+    if not bbox:
+        return None
+    min_x, min_y, _, max_x, max_y, _ = bbox
+    short_side = min(max_x - min_x, max_y - min_y)
+    long_side = max(max_x - min_x, max_y - min_y)
+    if short_side <= 0 or long_side <= 0:
+        return None
+    return long_side / short_side
+
+
+# Value columns and the helper each one reproduces; unavailable values become NaN/None.
+_VALUE_GETTERS: Dict[str, Callable[[Any], Any]] = {
+    "area": _safe(element_area),
+    "volume": _safe(_space_only(get_space_volume)),
+    "height": _safe(_height),
+    "width": _safe(_width),
+    "orientation": _safe(element_orientation),
+    "is_external": _safe(_is_external),
+    "usage": _safe(_space_only(classify_space_usage)),
+    "display_name": _safe(_display_name),
+    "label_text": _safe(_label_text),
+    "aspect_ratio": _safe(_space_only(_aspect_ratio)),
+}
+_FLOAT_COLUMNS = ("storey_elevation", "area", "volume", "height", "width", "aspect_ratio")
+
+
+class BuildingFacts:
+    """One row per element with the values aggregate questions group and filter on.
+
+    Rows are built per entity class in ``by_type`` order with one walk over the elements,
+    and each column is computed with the same helper the scripts use (``element_area``,
+    ``get_space_volume``, ``classify_space_usage``, ...), so group-bys over the table give
+    the answers of the per-element loops. Columns are computed on first request and kept,
+    so later questions on the same model reuse them.
+    """
+
+    def __init__(self, model: ifcopenshell.file) -> None:
+        self._model = weakref.ref(model)
+        self._columns: Dict[str, Dict[str, List[Any]]] = {}
+        self._storeys: Optional[List[Any]] = None
+
+    @property
+    def model(self) -> ifcopenshell.file:
+        model = self._model()
+        if model is None:
+            raise RuntimeError("The model of these facts has been released")
+        return model
+
+    @property
+    def storeys(self) -> List[Any]:
+        if self._storeys is None:
+            self._storeys = get_ordered_storeys(self.model)
+        return self._storeys
+
+    def _class_columns(self, ifc_class: str, columns: Sequence[str]) -> Dict[str, List[Any]]:
+        elements = list(self.model.by_type(ifc_class))
+        data = self._columns.get(ifc_class)
+        if data is None:
+            data = self._columns[ifc_class] = {
+                "element_id": [element.id() for element in elements],
+                "ifc_class": [element.is_a() for element in elements],
+                "global_id": [getattr(element, "GlobalId", None) for element in elements],
+                "name": [getattr(element, "Name", None) for element in elements],
+            }
+
+        missing = [column for column in columns if column not in data]
+        if not missing:
+            return data
+        needs_storey = any(column.startswith("storey") for column in missing)
+        storey_of = storey_resolver(self.storeys) if needs_storey else None
+        values: Dict[str, List[Any]] = {column: [] for column in missing}
+        for element in elements:
+            storey = storey_of(element) if storey_of else None
+            for column in missing:
+                if column == "storey_id":
+                    values[column].append(storey.id() if storey else None)
+                elif column == "storey":
+                    values[column].append(storey_label(storey) if storey else UNASSIGNED)
+                elif column == "storey_elevation":
+                    values[column].append(storey_elevation(storey) if storey else math.nan)
+                else:
+                    values[column].append(_VALUE_GETTERS[column](element))
+        data.update(values)
+        return data
+
+    def table(
+        self,
+        ifc_classes: Iterable[str] = DEFAULT_CLASSES,
+        columns: Sequence[str] = FACT_COLUMNS,
+    ) -> pd.DataFrame:
+        """Return the facts of ``ifc_classes`` (subtypes included) restricted to ``columns``."""
+        unknown = [column for column in columns if column not in FACT_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown fact columns: {', '.join(unknown)}")
+
+        frames = []
+        for ifc_class in ifc_classes:
+            data = self._class_columns(ifc_class, columns)
+            frame = pd.DataFrame(
+                {column: data[column] for column in ("element_id", "ifc_class", "global_id", "name", *columns)}
+            )
+            frames.append(frame)
+        if not frames:
+            return pd.DataFrame(columns=["element_id", "ifc_class", "global_id", "name", *columns])
+
+        table = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        table = table.drop_duplicates("element_id", ignore_index=True)
+        table["element_id"] = table["element_id"].astype("int64")
+        if "storey_id" in table:
+            table["storey_id"] = table["storey_id"].astype("Int64")
+        for column in _FLOAT_COLUMNS:
+            if column in table:
+                table[column] = pd.to_numeric(table[column], errors="coerce").astype("float64")
+        return table
+
+
+def ordered_sum(values: pd.Series) -> float:
+    """Sum in row order, bit-identical to a ``total += value`` loop.
+
+    pandas reductions use pairwise or compensated summation, which can differ from the
+    per-element loops in the last digit.
+    """
+    array = values.to_numpy(dtype="float64")
+    return float(array.cumsum()[-1]) if len(array) else 0.0
+
+
+def grouped_sum(table: pd.DataFrame, by: str, column: str) -> Dict[Any, float]:
+    """``{group: ordered_sum(column)}`` with groups in order of first appearance."""
+    return {key: ordered_sum(values) for key, values in table.groupby(by, sort=False)[column]}
+
+
+def grouped_mean(table: pd.DataFrame, by: str, column: str) -> Dict[Any, float]:
+    """``{group: ordered_sum(column) / count}`` with groups in order of first appearance."""
+    return {key: ordered_sum(values) / len(values) for key, values in table.groupby(by, sort=False)[column]}
+
+
+_FACTS: "weakref.WeakKeyDictionary[ifcopenshell.file, BuildingFacts]" = weakref.WeakKeyDictionary()
+
+
+def building_facts(model: ifcopenshell.file) -> BuildingFacts:
+    """Return the (cached) :class:`BuildingFacts` of ``model``."""
+    facts = _FACTS.get(model)
+    if facts is None:
+        facts = _FACTS[model] = BuildingFacts(model)
+    return facts
@@ -0,0 +1,147 @@
+"""Closed-form quantities of elements whose body is a single ``IfcExtrudedAreaSolid``.
+
+An extrusion of a polygonal profile is a prism: its volume is the profile area times the
+extrusion's component along the profile normal, and its world bounding box is that of the
+profile's corners at both ends. :func:`extrusion_quantities` computes these from the
+profile, the solid's position and the element's placement chain without tessellating.
+Elements with other bodies (breps, boolean results, mapped items, curved profiles) and
+elements with openings, whose voids only tessellation subtracts, return None.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+import ifcopenshell.util.placement
+
+BoundingBox = Tuple[float, float, float, float, float, float]
+
+# Extrusions whose direction is this close to the world Z axis are measured as walls or
+# slabs (length in plan); others as beams and members (length along the extrusion).
+VERTICAL_TOLERANCE = 1e-6
+
+
+class ExtrusionQuantities:
+    """Quantities of one extruded element, in metres.
+
+    ``area`` is the net profile area (cross-section, or footprint of a vertical
+    extrusion), ``volume`` the gross solid volume, ``length`` the longest side of the
+    profile in plan for vertical extrusions and the extrusion depth otherwise, ``height``
+    the world Z extent and ``bbox`` the world bounding box.
+    """
+
+    __slots__ = ("area", "volume", "length", "height", "bbox")
+
+    def __init__(self, area: float, volume: float, length: float, height: float, bbox: BoundingBox) -> None:
+        self.area = area
+        self.volume = volume
+        self.length = length
+        self.height = height
+        self.bbox = bbox
+
+
+def body_solid(element):
+    """The element's only body item if it is an ``IfcExtrudedAreaSolid``, else None."""
+    representation = getattr(element, "Representation", None)
+    if representation is None:
+        return None
+    bodies = [rep for rep in representation.Representations or () if rep.RepresentationIdentifier == "Body"]
+    if len(bodies) != 1 or len(bodies[0].Items or ()) != 1:
+        return None
+    solid = bodies[0].Items[0]
+    return solid if solid.is_a("IfcExtrudedAreaSolid") else None
+
+
+def _polyline(curve) -> Optional[np.ndarray]:
+    if curve is None or not curve.is_a("IfcPolyline"):
+        return None
+    points = np.array([point.Coordinates[:2] for point in curve.Points], dtype=np.float64)
+    if len(points) > 1 and np.allclose(points[0], points[-1]):
+        points = points[:-1]
+    return points if len(points) >= 3 else None
+
+
+def _shoelace(points: np.ndarray) -> float:
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1))))
+
+
+def profile_outline(profile) -> Optional[Tuple[np.ndarray, float]]:
+    """The profile's outer polygon ``(N, 2)`` in its own position and its net area.
+
+    Supports rectangle profiles and arbitrary closed profiles (with voids) bounded by
+    polylines; None for anything else.
+    """
+    if profile.is_a("IfcRectangleProfileDef"):
+        half_x, half_y = profile.XDim / 2.0, profile.YDim / 2.0
+        outline = np.array([(-half_x, -half_y), (half_x, -half_y), (half_x, half_y), (-half_x, half_y)])
+        area = float(profile.XDim * profile.YDim)
+    elif profile.is_a("IfcArbitraryClosedProfileDef"):
+        outline = _polyline(profile.OuterCurve)
+        if outline is None:
+            return None
+        area = _shoelace(outline)
+        for inner_curve in getattr(profile, "InnerCurves", None) or ():
+            inner = _polyline(inner_curve)
+            if inner is None:
+                return None
+            area -= _shoelace(inner)
+    else:
+        return None
+    position = getattr(profile, "Position", None)
+    if position is not None:
+        matrix = ifcopenshell.util.placement.get_axis2placement(position)
+        outline = outline @ matrix[:2, :2].T + matrix[:2, 3]
+    return outline, area
+
+
+def _profile_length(outline: np.ndarray) -> float:
+    """Longest side of the profile's bounding rectangle in its own axes."""
+    return float((outline.max(axis=0) - outline.min(axis=0)).max())
+
+
+def extrusion_quantities(element, length_scale: float = 1.0) -> Optional[ExtrusionQuantities]:
+    """Exact quantities of ``element`` from its extruded body, or None when it has none.
+
+    ``length_scale`` converts project length units to metres.
+    """
+    if getattr(element, "HasOpenings", None):
+        return None
+    solid = body_solid(element)
+    if solid is None or solid.SweptArea is None:
+        return None
+    outline = profile_outline(solid.SweptArea)
+    if outline is None:
+        return None
+    outline, area = outline
+
+    direction = np.array(solid.ExtrudedDirection.DirectionRatios, dtype=np.float64)
+    direction = direction / np.linalg.norm(direction)
+    depth = float(solid.Depth)
+
+    transform = ifcopenshell.util.placement.get_local_placement(element.ObjectPlacement)
+    if solid.Position is not None:
+        transform = transform @ ifcopenshell.util.placement.get_axis2placement(solid.Position)
+
+    base = np.column_stack([outline, np.zeros(len(outline))])
+    corners = np.vstack([base, base + depth * direction])
+    world = corners @ transform[:3, :3].T + transform[:3, 3]
+    lower = world.min(axis=0) * length_scale
+    upper = world.max(axis=0) * length_scale
+    bbox = tuple(float(value) for value in np.concatenate([lower, upper]))
+
+    world_direction = transform[:3, :3] @ direction
+    if abs(abs(world_direction[2]) - 1.0) <= VERTICAL_TOLERANCE:
+        length = _profile_length(outline)
+    else:
+        length = depth
+
+    return ExtrusionQuantities(
+        area=area * length_scale**2,
+        volume=area * depth * abs(direction[2]) * length_scale**3,
+        length=length * length_scale,
+        height=float(upper[2] - lower[2]),
+        bbox=bbox,
+    )
+
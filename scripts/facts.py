@@ -0,0 +1,172 @@
+"""Named intermediate facts that several questions derive their answers from.
+
+A fact is computed from the model (and from the facts it requires) at most once per
+model and kept for later questions. Values only hold element ids, numbers and strings,
+so the runner can compute a fact in one worker and inject it into the others.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import weakref
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import ifcopenshell
+
+from scripts.ifc_utils import get_element_area, is_external_wall, map_elements_to_spaces, registered_model_path
+from scripts.question_helpers import element_area, get_ordered_storeys, storey_elevation, storey_label
+
+
+class Fact:
+    """``compute(model, *required_values)`` for the fact called ``name``.
+
+    ``uses`` names the entity types the fact reads, so a model revision that leaves them
+    untouched keeps the fact (and the answers derived from it) valid.
+    """
+
+    def __init__(
+        self, name: str, requires: Sequence[str], compute: Callable[..., Any], uses: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.requires = tuple(requires)
+        self.compute = compute
+        self.uses = tuple(uses)
+
+
+FACTS: Dict[str, Fact] = {}
+
+
+def fact(name: str, *requires: str, uses: Sequence[str] = ()) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Register the decorated function as the fact ``name`` requiring ``requires``."""
+
+    def register(compute: Callable[..., Any]) -> Callable[..., Any]:
+        FACTS[name] = Fact(name, requires, compute, uses)
+        return compute
+
+    return register
+
+
+@fact("window_space_map", uses=("IfcWindow", "IfcSpace"))
+def _window_space_map(model: ifcopenshell.file) -> Dict[int, List[int]]:
+    """``{window id: [space id]}`` with the daylight questions' tolerances."""
+    spaces = list(model.by_type("IfcSpace"))
+    windows = list(model.by_type("IfcWindow"))
+    if not spaces or not windows:
+        return {}
+    window_map = map_elements_to_spaces(
+        model,
+        windows,
+        spaces=spaces,
+        tolerance_horizontal=0.75,
+        tolerance_vertical=1.5,
+        max_matches=1,
+    )
+    return {window_id: [space.id() for space in matches] for window_id, matches in window_map.items()}
+
+
+@fact("lit_space_ids", "window_space_map")
+def _lit_space_ids(model: ifcopenshell.file, window_space_map: Dict[int, List[int]]) -> frozenset:
+    """Ids of the spaces with at least one mapped window."""
+    return frozenset(space_id for space_ids in window_space_map.values() for space_id in space_ids)
+
+
+@fact("space_areas", uses=("IfcSpace",))
+def _space_areas(model: ifcopenshell.file) -> Dict[int, Any]:
+    """``{space id: element_area(space)}`` in ``by_type`` order (None when unknown)."""
+    return {space.id(): element_area(space) for space in model.by_type("IfcSpace")}
+
+
+@fact("external_walls", uses=("IfcWall",))
+def _external_walls(model: ifcopenshell.file) -> Tuple[int, ...]:
+    """Ids of the walls ``is_external_wall`` accepts, in ``by_type`` order."""
+    return tuple(wall.id() for wall in model.by_type("IfcWall") if is_external_wall(wall))
+
+
+def _area_total(model: ifcopenshell.file, ifc_class: str) -> float:
+    total = 0.0
+    for element in model.by_type(ifc_class):
+        total += get_element_area(element)
+    return total
+
+
+@fact("window_area_total", uses=("IfcWindow",))
+def _window_area_total(model: ifcopenshell.file) -> float:
+    return _area_total(model, "IfcWindow")
+
+
+@fact("wall_area_total", uses=("IfcWall",))
+def _wall_area_total(model: ifcopenshell.file) -> float:
+    return _area_total(model, "IfcWall")
+
+
+@fact("storey_elevations", uses=("IfcBuildingStorey",))
+def _storey_elevations(model: ifcopenshell.file) -> List[Tuple[int, str, float]]:
+    """``(storey id, label, elevation)`` for every storey, lowest first."""
+    return [(storey.id(), storey_label(storey), storey_elevation(storey)) for storey in get_ordered_storeys(model)]
+
+
+def fact_closure(names: Iterable[str]) -> List[str]:
+    """``names`` and everything they require, each after its requirements."""
+    ordered: List[str] = []
+    visiting: set = set()
+
+    def visit(name: str) -> None:
+        if name in ordered:
+            return
+        if name not in FACTS:
+            raise ValueError(f"Unknown fact {name!r}")
+        if name in visiting:
+            raise ValueError(f"Fact {name!r} requires itself")
+        visiting.add(name)
+        for required in FACTS[name].requires:
+            visit(required)
+        visiting.discard(name)
+        ordered.append(name)
+
+    for name in names:
+        visit(name)
+    return ordered
+
+
+_VALUES: "weakref.WeakKeyDictionary[ifcopenshell.file, Dict[str, Any]]" = weakref.WeakKeyDictionary()
+_INJECTED: Dict[str, Dict[str, Any]] = {}
+
+
+@contextlib.contextmanager
+def injected_facts(ifc_file_path, values: Dict[str, Any]) -> Iterator[None]:
+    """Serve ``values`` to :func:`get_fact` for the model read from ``ifc_file_path``."""
+    key = os.path.realpath(ifc_file_path)
+    _INJECTED[key] = values
+    try:
+        yield
+    finally:
+        _INJECTED.pop(key, None)
+
+
+def get_fact(model: ifcopenshell.file, name: str) -> Any:
+    """Return the fact ``name`` of ``model``: injected by the runner, cached, or computed."""
+    values = _VALUES.get(model)
+    if values is None:
+        values = _VALUES[model] = {}
+    if name not in values:
+        injected = _INJECTED.get(registered_model_path(model) or "", {})
+        for required in fact_closure([name]):
+            if required in values:
+                continue
+            if required in injected:
+                values[required] = injected[required]
+            else:
+                spec = FACTS[required]
+                values[required] = spec.compute(model, *(values[dep] for dep in spec.requires))
+    return values[name]
+
+
+def fact_entity_types(names: Iterable[str]) -> set:
+    """The entity types read by ``names`` and the facts they require."""
+    return {entity_type for name in fact_closure(names) for entity_type in FACTS[name].uses}
+
+
+def compute_facts(model: ifcopenshell.file, names: Iterable[str]) -> Dict[str, Any]:
+    """Return ``names`` and the facts they require, computing the missing ones."""
+    return {name: get_fact(model, name) for name in fact_closure(names)}
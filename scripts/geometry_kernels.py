@@ -0,0 +1,111 @@
+"""Vectorised measurements of triangle meshes held as NumPy arrays.
+
+``vertices`` and ``faces`` view an ifcopenshell geometry's buffers as ``(N, 3)`` and
+``(M, 3)`` arrays without building Python tuples, and the kernels below work on those
+arrays in a few NumPy passes however many vertices the mesh has.
+"""
+
+from __future__ import annotations
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+BoundingBox = Tuple[float, float, float, float, float, float]
+
+
+def vertices(geometry) -> np.ndarray:
+    """The geometry's vertices as a read-only ``(N, 3)`` float64 view of its buffer."""
+    buffer = getattr(geometry, "verts_buffer", None)
+    if buffer is None:
+        return np.asarray(geometry.verts, dtype=np.float64).reshape(-1, 3)
+    return np.frombuffer(buffer, dtype=np.float64).reshape(-1, 3)
+
+
+def faces(geometry) -> np.ndarray:
+    """The geometry's triangles as a read-only ``(M, 3)`` int32 view of its buffer."""
+    buffer = getattr(geometry, "faces_buffer", None)
+    if buffer is None:
+        return np.asarray(geometry.faces, dtype=np.int32).reshape(-1, 3)
+    return np.frombuffer(buffer, dtype=np.int32).reshape(-1, 3)
+
+
+def bbox_array(verts: np.ndarray) -> np.ndarray:
+    """``[min_x, min_y, min_z, max_x, max_y, max_z]`` of a non-empty ``(N, 3)`` array."""
+    return np.concatenate([verts.min(axis=0), verts.max(axis=0)]).astype(np.float64)
+
+
+def bbox(verts: np.ndarray) -> Optional[BoundingBox]:
+    """The axis-aligned bounding box of ``verts`` as six floats, or None when empty."""
+    if not len(verts):
+        return None
+    return tuple(float(value) for value in bbox_array(verts))
+
+
+def _triangles(verts: np.ndarray, tris: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    verts = np.asarray(verts, dtype=np.float64)
+    return verts[tris[:, 0]], verts[tris[:, 1]], verts[tris[:, 2]]
+
+
+def surface_area(verts: np.ndarray, tris: np.ndarray) -> float:
+    """Total area of the mesh's triangles."""
+    if not len(tris):
+        return 0.0
+    a, b, c = _triangles(verts, tris)
+    return float(0.5 * np.linalg.norm(np.cross(b - a, c - a), axis=1).sum())
+
+
+def is_closed(tris: np.ndarray) -> bool:
+    """Whether every edge of the mesh is shared by exactly two triangles."""
+    if not len(tris):
+        return False
+    edges = np.concatenate([tris[:, [0, 1]], tris[:, [1, 2]], tris[:, [2, 0]]])
+    edges.sort(axis=1)
+    _, counts = np.unique(edges, axis=0, return_counts=True)
+    return bool((counts == 2).all())
+
+
+def signed_volume(verts: np.ndarray, tris: np.ndarray) -> float:
+    """Volume enclosed by the mesh from signed tetrahedra against the origin.
+
+    Exact for a closed, consistently oriented mesh (positive when the triangles wind
+    outwards); meaningless for an open one, see :func:`is_closed`.
+    """
+    if not len(tris):
+        return 0.0
+    a, b, c = _triangles(verts, tris)
+    # Shifting to the first vertex keeps the products small for meshes far from the origin.
+    origin = a[0]
+    a, b, c = a - origin, b - origin, c - origin
+    return float(np.einsum("ij,ij->i", a, np.cross(b, c)).sum() / 6.0)
+
+
+def closed_volume(verts: np.ndarray, tris: np.ndarray) -> Optional[float]:
+    """The volume of a closed mesh, or None when the mesh is open or inside out."""
+    if not is_closed(tris):
+        return None
+    volume = signed_volume(verts, tris)
+    return volume if volume > 0 else None
+
+
+def plan_area(verts: np.ndarray, tris: np.ndarray) -> float:
+    """Area of the mesh's upward-facing triangles projected onto the XY plane.
+
+    For a closed solid whose vertical sections do not overlap (extrusions, spaces, slabs)
+    this is its footprint.
+    """
+    if not len(tris):
+        return 0.0
+    a, b, c = _triangles(verts, tris)
+    ab, ac = b - a, c - a
+    projected = 0.5 * (ab[:, 0] * ac[:, 1] - ab[:, 1] * ac[:, 0])
+    return float(projected[projected > 0].sum())
+
+
+def plan_extent(verts: np.ndarray) -> Tuple[float, float]:
+    """Width along X and depth along Y of the vertices' bounding box."""
+    if not len(verts):
+        return 0.0, 0.0
+    lower = verts[:, :2].min(axis=0)
+    upper = verts[:, :2].max(axis=0)
+    return float(upper[0] - lower[0]), float(upper[1] - lower[1])
@@ -1,22 +1,113 @@
+import contextlib
+import hashlib
 import math
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import os
+import struct
+import tempfile
+import weakref
+import zipfile
+from collections import OrderedDict, deque
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import ifcopenshell
 import ifcopenshell.geom
 import ifcopenshell.util.element
 import ifcopenshell.util.placement
+import numpy as np
 from ifcopenshell.util import unit as ifc_unit
 
+from scripts import geometry_kernels as kernels
+from scripts.extrusions import ExtrusionQuantities, extrusion_quantities
+
+try:  # pragma: no cover - not available on Windows
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
 
 BoundingBox = Tuple[float, float, float, float, float, float]
 
 
 _UNIT_SCALE_CACHE: Dict[int, Dict[str, float]] = {}
+_TRACKED_FILES: set = set()
+_FILE_DIGEST_CACHE: Dict[Tuple[str, int, int], str] = {}
+
+# Reading the umask means setting it, so it is read once at import, before any threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def make_shareable(fd: int) -> None:
+    """Give a ``tempfile.mkstemp`` file (always 0600) the mode a plain ``open`` would get."""
+    if hasattr(os, "fchmod"):  # not available on Windows
+        os.fchmod(fd, 0o666 & ~_UMASK)
+
+
+def file_digest(path) -> str:
+    """Return the SHA-256 of a file's contents, memoised on (path, size, mtime)."""
+    real_path = os.path.realpath(os.fspath(path))
+    stat = os.stat(real_path)
+    key = (real_path, stat.st_size, stat.st_mtime_ns)
+    digest = _FILE_DIGEST_CACHE.get(key)
+    if digest is None:
+        sha = hashlib.sha256()
+        with open(real_path, "rb") as handle:
+            for chunk in iter(lambda: handle.read(1 << 20), b""):
+                sha.update(chunk)
+        digest = sha.hexdigest()
+        _FILE_DIGEST_CACHE[key] = digest
+    return digest
+
+
+class PsetCache:
+    """Process-wide memo of ``ifcopenshell.util.element.get_psets`` per element.
+
+    Entries hold property and quantity sets, including those inherited from the element's
+    type, exactly as ``get_psets`` returns them, grouped per model so they are dropped
+    with it. The returned dicts are shared between callers and must not be mutated.
+    ``hits`` and ``misses`` count how often a lookup was served from the memo.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._psets: Dict[int, Dict[int, Dict[str, Dict[str, Any]]]] = {}
+
+    def get(self, element) -> Dict[str, Dict[str, Any]]:
+        file_key = _file_key(element)
+        if file_key is None:
+            self.misses += 1
+            return ifcopenshell.util.element.get_psets(element)
+        model_psets = self._psets.setdefault(file_key, {})
+        psets = model_psets.get(element.id())
+        if psets is None:
+            self.misses += 1
+            psets = model_psets[element.id()] = ifcopenshell.util.element.get_psets(element)
+        else:
+            self.hits += 1
+        return psets
+
+    def forget_file(self, file_key: int) -> None:
+        self._psets.pop(file_key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "elements": sum(len(model_psets) for model_psets in self._psets.values()),
+        }
+
+
+PSET_CACHE = PsetCache()
+
+
+def get_element_psets(element) -> Dict[str, Dict[str, Any]]:
+    """Property and quantity sets of ``element`` (type-inherited included), memoised per model."""
+    return PSET_CACHE.get(element)
 
 
 def is_external_wall(wall):
     """Check if a wall is external (simplified heuristic)"""
-    psets = ifcopenshell.util.element.get_psets(wall)
+    psets = get_element_psets(wall)
     is_external = False
 
     # Check IsExternal property
@@ -45,7 +136,7 @@ def is_external_wall(wall):
 
 def get_property_value(element, property_names):
     """Get a numerical property value from an element's property sets."""
-    psets = ifcopenshell.util.element.get_psets(element)
+    psets = get_element_psets(element)
     for pset_data in psets.values():
         for name in property_names:
             if name in pset_data and pset_data[name] is not None:
@@ -97,6 +188,43 @@ def _get_unit_scales_from_file(ifc_file: Optional[ifcopenshell.file]) -> Dict[st
     return scales
 
 
+def _file_key(obj: Any) -> Optional[int]:
+    """Identify the underlying file of an entity or ``ifcopenshell.file`` (None if unknown)."""
+    owner = getattr(obj, "wrapped_data", obj)
+    try:
+        return int(owner.file_pointer())
+    except Exception:
+        return None
+
+
+def _forget_file_key(file_key: int) -> None:
+    GEOMETRY_CACHE.forget_file(file_key)
+    PSET_CACHE.forget_file(file_key)
+    QUANTITY_ENGINE.forget_file(file_key)
+    _MODEL_PATHS.pop(file_key, None)
+    _MODELS.pop(file_key, None)
+    _STOREY_INDEXES.pop(file_key, None)
+    _TRACKED_FILES.discard(file_key)
+
+
+def _track_model(ifc_file: ifcopenshell.file) -> Optional[int]:
+    """Return the file key of ``ifc_file`` and drop its caches once it is garbage collected,
+    since a later model may be allocated at the same address."""
+    file_key = _file_key(ifc_file)
+    if file_key is not None and file_key not in _TRACKED_FILES:
+        _TRACKED_FILES.add(file_key)
+        weakref.finalize(ifc_file, _forget_file_key, file_key)
+    return file_key
+
+
+def forget_model_caches(ifc_file: ifcopenshell.file) -> None:
+    """Drop every per-model cache entry held for ``ifc_file`` (e.g. before it is freed)."""
+    _UNIT_SCALE_CACHE.pop(id(ifc_file), None)
+    file_key = _file_key(ifc_file)
+    if file_key is not None:
+        _forget_file_key(file_key)
+
+
 def _get_unit_scales(element: Optional[Any]) -> Dict[str, float]:
     if element is None:
         return {"length": 1.0, "area": 1.0, "volume": 1.0}
@@ -178,7 +306,7 @@ def get_element_area(element):
         return _convert_area_value(best, length_scale=length_scale, area_scale=area_scale)
 
     # Method 2: Property sets
-    psets = ifcopenshell.util.element.get_psets(element)
+    psets = get_element_psets(element)
     for pset_data in psets.values():
         area = (
             pset_data.get("Area")
@@ -217,32 +345,619 @@ def _init_geom_settings(settings: Optional[ifcopenshell.geom.settings] = None) -
     return new_settings
 
 
-def get_element_area_from_geometry(element, settings: Optional[ifcopenshell.geom.settings] = None) -> float:
-    """Calculate the area of an element from its geometry as a fallback."""
-    settings = _init_geom_settings(settings)
-    area = 0.0
+_UNSET = object()
+
+
+class TessellatedMesh:
+    """Triangulated geometry of one element: ``verts`` (N, 3) in metres and ``faces`` (M, 3).
 
-    if hasattr(element, "Representation") and element.Representation:
+    ``bbox`` is given for meshes read back from a :class:`GeometryStore`, whose float32
+    vertices would otherwise round it.
+    """
+
+    __slots__ = ("verts", "faces", "_bbox", "_volume")
+
+    def __init__(self, verts: np.ndarray, faces: np.ndarray, bbox: Optional[BoundingBox] = None) -> None:
+        self.verts = verts
+        self.faces = faces
+        self._bbox = bbox
+        self._volume: Any = _UNSET
+
+    @classmethod
+    def from_record(cls, record: "ShapeRecord") -> "TessellatedMesh":
+        verts, faces, bbox = record
+        return cls(verts, faces, tuple(float(value) for value in bbox))
+
+    @property
+    def nbytes(self) -> int:
+        return self.verts.nbytes + self.faces.nbytes
+
+    def bbox(self) -> Optional[BoundingBox]:
+        return self._bbox if self._bbox is not None else kernels.bbox(self.verts)
+
+    def surface_area(self) -> float:
+        return kernels.surface_area(self.verts, self.faces)
+
+    def plan_area(self) -> float:
+        return kernels.plan_area(self.verts, self.faces)
+
+    @property
+    def volume(self) -> Optional[float]:
+        """Enclosed volume, or None when the mesh is not a closed, outward-facing shell."""
+        if self._volume is _UNSET:
+            self._volume = kernels.closed_volume(self.verts, self.faces)
+        return self._volume
+
+
+def _tessellate(element, settings: ifcopenshell.geom.settings) -> Optional[TessellatedMesh]:
+    """Tessellate ``element`` once; None when it has no usable geometry."""
+    if not hasattr(element, "Representation") or not element.Representation:
+        return None
+    try:
+        shape = ifcopenshell.geom.create_shape(settings, element)
+    except Exception:
+        return None
+    if not shape or not hasattr(shape.geometry, "verts"):
+        return None
+    return TessellatedMesh(kernels.vertices(shape.geometry), kernels.faces(shape.geometry))
+
+
+class GeometryCache:
+    """Process-wide LRU of tessellated meshes keyed by (file, element id).
+
+    Every geometry helper goes through this cache when called with the default settings,
+    so an element is tessellated at most once per process while its mesh stays within
+    ``max_mb`` of cached vertex/face data. Failed tessellations are remembered too.
+    """
+
+    def __init__(self, max_mb: float) -> None:
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._settings: Optional[ifcopenshell.geom.settings] = None
+        self._meshes: "OrderedDict[Tuple[int, int], Optional[TessellatedMesh]]" = OrderedDict()
+
+    def get_mesh(self, element) -> Optional[TessellatedMesh]:
+        file_key = _file_key(element)
+        if file_key is None:
+            return _tessellate(element, _init_geom_settings())
+        key = (file_key, element.id())
+        if key in self._meshes:
+            self.hits += 1
+            self._meshes.move_to_end(key)
+            return self._meshes[key]
+
+        self.misses += 1
+        if self._settings is None:
+            self._settings = _init_geom_settings()
+        mesh = self._stored_mesh(element, file_key)
+        self._meshes[key] = mesh
+        if mesh is not None:
+            self.nbytes += mesh.nbytes
+            self._evict()
+        return mesh
+
+    def _stored_mesh(self, element, file_key: int) -> Optional[TessellatedMesh]:
+        """The mesh from the model's ``shape`` store, tessellated and queued for it if new.
+
+        ``create_shape`` shapes an element's first representation while the iterator picks
+        its body, so these meshes are kept apart from the iterator's store. Meshes of a
+        stored model always come back narrowed to float32 with their exact float64 bbox,
+        whether or not this run tessellated them.
+        """
+        store = _geometry_store(_MODEL_PATHS.get(file_key), self._settings, kernel="shape")
+        if store is None:
+            return _tessellate(element, self._settings)
+        record = store.record(element.id())
+        if record is not None:
+            return TessellatedMesh.from_record(record)
+        if element.id() in store.failed:
+            return None
+        mesh = _tessellate(element, self._settings)
+        if mesh is None or not len(mesh.verts):
+            store.queue(element.id(), None)
+            return None
+        record = (mesh.verts.astype(np.float32), mesh.faces, kernels.bbox_array(mesh.verts))
+        store.queue(element.id(), record)
+        return TessellatedMesh.from_record(record)
+
+    def _evict(self) -> None:
+        while self.nbytes > self.max_bytes and len(self._meshes) > 1:
+            _, mesh = self._meshes.popitem(last=False)
+            if mesh is not None:
+                self.nbytes -= mesh.nbytes
+
+    def forget_file(self, file_key: int) -> None:
+        for key in [key for key in self._meshes if key[0] == file_key]:
+            mesh = self._meshes.pop(key)
+            if mesh is not None:
+                self.nbytes -= mesh.nbytes
+
+
+GEOMETRY_CACHE = GeometryCache(float(os.environ.get("BIM_GEOMETRY_CACHE_MB", "256")))
+
+
+def get_element_mesh(element, settings: Optional[ifcopenshell.geom.settings] = None) -> Optional[TessellatedMesh]:
+    """Return the element's world-coordinate mesh, cached unless custom ``settings`` are given.
+
+    Meshes of models opened through ``open_ifc`` are also kept in the model's ``shape``
+    :class:`GeometryStore`, so later runs and other workers read them back.
+    """
+    if settings is not None:
+        return _tessellate(element, settings)
+    return GEOMETRY_CACHE.get_mesh(element)
+
+
+class QuantityEngine:
+    """Process-wide memo of closed-form extrusion quantities per element.
+
+    Elements whose body :func:`extrusion_quantities` cannot evaluate are left to
+    tessellation. ``analytic`` and ``tessellated`` count the distinct elements with a
+    representation that took each path.
+    """
+
+    def __init__(self) -> None:
+        self.analytic = 0
+        self.tessellated = 0
+        self._quantities: Dict[int, Dict[int, Optional[ExtrusionQuantities]]] = {}
+        self._length_scales: Dict[int, float] = {}
+
+    def get(self, element) -> Optional[ExtrusionQuantities]:
+        file_key = _file_key(element)
+        if file_key is None or not getattr(element, "Representation", None):
+            return None
+        model_quantities = self._quantities.setdefault(file_key, {})
+        if element.id() in model_quantities:
+            return model_quantities[element.id()]
+        length_scale = self._length_scales.get(file_key)
+        if length_scale is None:
+            length_scale = self._length_scales[file_key] = ifc_unit.calculate_unit_scale(element.file)
         try:
-            shape = ifcopenshell.geom.create_shape(settings, element)
-            if shape:
-                verts = shape.geometry.verts
-                if len(verts) >= 9:
-                    x_coords = [verts[i] for i in range(0, len(verts), 3)]
-                    y_coords = [verts[i] for i in range(1, len(verts), 3)]
-                    z_coords = [verts[i] for i in range(2, len(verts), 3)]
-
-                    if x_coords and y_coords and z_coords:
-                        width = max(x_coords) - min(x_coords)
-                        depth = max(y_coords) - min(y_coords)
-                        height = max(z_coords) - min(z_coords)
-
-                        area1 = width * height
-                        area2 = depth * height
-                        area = max(area1, area2)
+            quantities = extrusion_quantities(element, length_scale)
         except Exception:
-            pass  # Ignore geometry creation errors
-    return area
+            quantities = None
+        model_quantities[element.id()] = quantities
+        if quantities is None:
+            self.tessellated += 1
+        else:
+            self.analytic += 1
+        return quantities
+
+    def forget_file(self, file_key: int) -> None:
+        self._quantities.pop(file_key, None)
+        self._length_scales.pop(file_key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {"analytic": self.analytic, "tessellated": self.tessellated}
+
+
+QUANTITY_ENGINE = QuantityEngine()
+
+
+def get_element_quantities(element) -> Optional[ExtrusionQuantities]:
+    """Exact area, volume, length, height and bbox of an extruded element (None otherwise)."""
+    return QUANTITY_ENGINE.get(element)
+
+
+GEOMETRY_THREADS = int(os.environ.get("BIM_GEOMETRY_THREADS", "0")) or os.cpu_count() or 1
+GEOMETRY_STORE_DIR = os.environ.get(
+    "BIM_GEOMETRY_STORE_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache", "geometry"),
+)
+
+# element id -> (verts (N, 3), faces (M, 3), float64 bbox)
+ShapeRecord = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+class GeometryBatch:
+    """Columnar tessellation of many elements.
+
+    Row ``i`` describes element ``ids[i]``: its vertices are
+    ``verts[offsets[i]:offsets[i + 1]]`` (an (N, 3) float32 block), its triangles are
+    ``faces[face_offsets[i]:face_offsets[i + 1]]`` (indices into the element's own vertices)
+    and its bounding box is ``bboxes[i]`` as ``(min_x, min_y, min_z, max_x, max_y, max_z)``.
+    Bounding boxes are taken from the float64 kernel output before the vertices are
+    narrowed to float32.
+    """
+
+    __slots__ = ("ids", "offsets", "verts", "face_offsets", "faces", "bboxes", "_rows")
+
+    def __init__(
+        self,
+        ids: np.ndarray,
+        offsets: np.ndarray,
+        verts: np.ndarray,
+        face_offsets: np.ndarray,
+        faces: np.ndarray,
+        bboxes: np.ndarray,
+    ) -> None:
+        self.ids = ids
+        self.offsets = offsets
+        self.verts = verts
+        self.face_offsets = face_offsets
+        self.faces = faces
+        self.bboxes = bboxes
+        self._rows: Optional[Dict[int, int]] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, element_id: int) -> bool:
+        return self.row(element_id) is not None
+
+    def row(self, element_id: int) -> Optional[int]:
+        if self._rows is None:
+            self._rows = {int(element_id): row for row, element_id in enumerate(self.ids)}
+        return self._rows.get(int(element_id))
+
+    def element_verts(self, element_id: int) -> Optional[np.ndarray]:
+        row = self.row(element_id)
+        if row is None:
+            return None
+        return self.verts[self.offsets[row] : self.offsets[row + 1]]
+
+    def element_faces(self, element_id: int) -> Optional[np.ndarray]:
+        row = self.row(element_id)
+        if row is None:
+            return None
+        return self.faces[self.face_offsets[row] : self.face_offsets[row + 1]]
+
+    def records(self) -> Dict[int, ShapeRecord]:
+        return {
+            int(element_id): (self.element_verts(element_id), self.element_faces(element_id), self.bboxes[row])
+            for row, element_id in enumerate(self.ids)
+        }
+
+    def take(self, element_ids: Iterable[int]) -> "GeometryBatch":
+        """Rows for ``element_ids`` that are present; the batch itself when it holds exactly those."""
+        wanted = sorted({int(element_id) for element_id in element_ids if element_id in self})
+        if len(wanted) == len(self.ids):
+            return self
+        records = self.records()
+        return _build_batch({element_id: records[element_id] for element_id in wanted})
+
+    def bounds(self) -> Optional[BoundingBox]:
+        """Bounding box of every element in the batch."""
+        if not len(self.ids):
+            return None
+        lower = self.bboxes[:, :3].min(axis=0)
+        upper = self.bboxes[:, 3:].max(axis=0)
+        return (
+            float(lower[0]),
+            float(lower[1]),
+            float(lower[2]),
+            float(upper[0]),
+            float(upper[1]),
+            float(upper[2]),
+        )
+
+
+def _build_batch(records: Dict[int, ShapeRecord]) -> GeometryBatch:
+    ids = np.array(sorted(records), dtype=np.int64)
+    offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    face_offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+    bboxes = np.empty((len(ids), 6), dtype=np.float64)
+    for row, element_id in enumerate(ids):
+        verts, faces, bbox = records[int(element_id)]
+        offsets[row + 1] = offsets[row] + len(verts)
+        face_offsets[row + 1] = face_offsets[row] + len(faces)
+        bboxes[row] = bbox
+    if records:
+        verts = np.concatenate([records[int(element_id)][0] for element_id in ids]).astype(np.float32)
+        faces = np.concatenate([records[int(element_id)][1] for element_id in ids]).astype(np.int32)
+    else:
+        verts = np.empty((0, 3), dtype=np.float32)
+        faces = np.empty((0, 3), dtype=np.int32)
+    return GeometryBatch(ids, offsets, verts, face_offsets, faces, bboxes)
+
+
+def _batch_targets(ifc_file: ifcopenshell.file, targets: Iterable[Any]) -> List[Any]:
+    elements = {}
+    for target in targets:
+        candidates = ifc_file.by_type(target) if isinstance(target, str) else [target]
+        for element in candidates:
+            if element.is_a("IfcProduct") and getattr(element, "Representation", None):
+                elements.setdefault(element.id(), element)
+    return [elements[element_id] for element_id in sorted(elements)]
+
+
+def _iterate_shapes(
+    ifc_file: ifcopenshell.file,
+    elements: List[Any],
+    threads: int,
+    settings: ifcopenshell.geom.settings,
+) -> Dict[int, ShapeRecord]:
+    records: Dict[int, ShapeRecord] = {}
+    if not elements:
+        return records
+    iterator = ifcopenshell.geom.iterator(settings, ifc_file, threads, include=elements)
+    if not iterator.initialize():
+        return records
+    while True:
+        shape = iterator.get()
+        verts = kernels.vertices(shape.geometry)
+        if len(verts):
+            records[shape.id] = (verts, kernels.faces(shape.geometry), kernels.bbox_array(verts))
+        if not iterator.next():
+            break
+    return records
+
+
+_MODEL_PATHS: Dict[int, str] = {}
+_GEOMETRY_STORES: Dict[str, "GeometryStore"] = {}
+
+
+def register_model_path(ifc_file: ifcopenshell.file, ifc_file_path) -> None:
+    """Remember ``ifc_file`` and where it was read from, so per-model indexes and the
+    geometry store can be reached from its elements."""
+    file_key = _track_model(ifc_file)
+    if file_key is not None:
+        _MODELS[file_key] = ifc_file
+        _MODEL_PATHS[file_key] = os.path.realpath(ifc_file_path)
+
+
+def registered_model_path(ifc_file: ifcopenshell.file) -> Optional[str]:
+    """The real path ``ifc_file`` was registered under, or None."""
+    return _MODEL_PATHS.get(_file_key(ifc_file))
+
+
+def _settings_key(settings: ifcopenshell.geom.settings) -> str:
+    values = [f"ifcopenshell={ifcopenshell.version}"]
+    for name in settings.setting_names():
+        try:
+            values.append(f"{name}={settings.get(name)!r}")
+        except RuntimeError:  # setting without a value
+            continue
+    return hashlib.sha256("\n".join(values).encode("utf-8")).hexdigest()[:16]
+
+
+def mmap_npz(path: str) -> Dict[str, np.ndarray]:
+    """Map each member of an uncompressed ``.npz`` read-only instead of loading it."""
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as handle:
+        for info in archive.infolist():
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"{path} has compressed members")
+            handle.seek(info.header_offset + 26)
+            name_length, extra_length = struct.unpack("<HH", handle.read(4))
+            handle.seek(info.header_offset + 30 + name_length + extra_length)
+            version = np.lib.format.read_magic(handle)
+            if version == (1, 0):
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handle)
+            else:
+                shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handle)
+            name = info.filename[: -len(".npy")]
+            if 0 in shape:
+                arrays[name] = np.empty(shape, dtype=dtype)
+            else:
+                arrays[name] = np.memmap(
+                    path,
+                    dtype=dtype,
+                    mode="r",
+                    offset=handle.tell(),
+                    shape=shape,
+                    order="F" if fortran_order else "C",
+                )
+    return arrays
+
+
+class GeometryStore:
+    """Tessellated geometry of one model persisted as uncompressed ``.npz`` segments.
+
+    The store is a directory named after the model's digest, the tessellation kernel and
+    the geometry settings. Segments are mapped read-only, so later runs and concurrent
+    workers share the page cache instead of re-tessellating. An update writes only the
+    elements no segment holds yet, as a new segment under an exclusive lock, so workers
+    adding at the same time never drop each other's records. A segment at least half the
+    size of the one before it is merged into that one, which keeps the segment count
+    logarithmic and rewrites each element a logarithmic number of times. Elements the
+    kernel could not shape are recorded as well.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.failed: set = set()
+        self._segments: "OrderedDict[str, Tuple[GeometryBatch, np.ndarray]]" = OrderedDict()
+        self._pending: Dict[int, ShapeRecord] = {}
+        self._pending_failed: set = set()
+        self.load()
+
+    def load(self) -> None:
+        """Map segments written since the last load and forget those merged away."""
+        try:
+            names = sorted(name for name in os.listdir(self.path) if name.endswith(".npz") and name[0] != ".")
+        except OSError:
+            names = []
+        segments = OrderedDict()
+        for name in names:
+            segment = self._segments.get(name)
+            if segment is None:
+                try:
+                    arrays = mmap_npz(os.path.join(self.path, name))
+                    batch = GeometryBatch(
+                        arrays["ids"],
+                        arrays["offsets"],
+                        arrays["verts"],
+                        arrays["face_offsets"],
+                        arrays["faces"],
+                        arrays["bboxes"],
+                    )
+                    segment = (batch, arrays["failed"])
+                except (OSError, ValueError, KeyError, struct.error, zipfile.BadZipFile):
+                    continue  # merged away since the listing; its records are in a later segment
+                self.failed.update(segment[1].tolist())
+            segments[name] = segment
+        self._segments = segments
+
+    def __contains__(self, element_id: int) -> bool:
+        return any(element_id in batch for batch, _ in self._segments.values())
+
+    def record(self, element_id: int) -> Optional[ShapeRecord]:
+        for batch, _ in self._segments.values():
+            row = batch.row(element_id)
+            if row is not None:
+                return batch.element_verts(element_id), batch.element_faces(element_id), batch.bboxes[row]
+        return None
+
+    def missing(self, elements: List[Any]) -> List[Any]:
+        return [element for element in elements if element.id() not in self.failed and element.id() not in self]
+
+    def take(self, element_ids: Iterable[int]) -> GeometryBatch:
+        """The stored rows for ``element_ids``, as one batch ordered by element id."""
+        wanted = {int(element_id) for element_id in element_ids}
+        holding = [batch for batch, _ in self._segments.values() if any(element_id in batch for element_id in wanted)]
+        if len(holding) == 1:
+            return holding[0].take(wanted)
+        records = {}
+        for element_id in wanted:
+            record = self.record(element_id)
+            if record is not None:
+                records[element_id] = record
+        return _build_batch(records)
+
+    @contextlib.contextmanager
+    def _locked(self):
+        os.makedirs(self.path, exist_ok=True)
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.path, ".lock"), "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _write(self, records: Dict[int, ShapeRecord], failed: Iterable[int]) -> None:
+        sequence = int(next(reversed(self._segments)).split("-")[0]) + 1 if self._segments else 0
+        name = f"{sequence:08d}-{os.getpid()}.npz"
+        batch = _build_batch(records)
+        failed = np.array(sorted(failed), dtype=np.int64)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".", suffix=".tmp")
+        make_shareable(fd)
+        with os.fdopen(fd, "wb") as handle:
+            np.savez(
+                handle,
+                ids=batch.ids,
+                offsets=batch.offsets,
+                verts=batch.verts,
+                face_offsets=batch.face_offsets,
+                faces=batch.faces,
+                bboxes=batch.bboxes,
+                failed=failed,
+            )
+        os.replace(tmp_path, os.path.join(self.path, name))
+        self._segments[name] = (batch, failed)
+        self.failed.update(failed.tolist())
+
+    def _compact(self) -> None:
+        while len(self._segments) >= 2:
+            (older_name, (older, older_failed)), (newer_name, (newer, newer_failed)) = list(self._segments.items())[-2:]
+            if 2 * (len(newer) + len(newer_failed)) < len(older) + len(older_failed):
+                break
+            records = older.records()
+            records.update(newer.records())
+            # The merged segment is in place before its inputs go, so a concurrent load
+            # that misses an input always finds the merged one.
+            self._write(records, set(older_failed.tolist()) | set(newer_failed.tolist()))
+            for name in (older_name, newer_name):
+                del self._segments[name]
+                try:
+                    os.unlink(os.path.join(self.path, name))
+                except OSError:
+                    pass
+
+    def add(self, records: Dict[int, ShapeRecord], failed: Iterable[int]) -> None:
+        """Persist ``records`` and ``failed`` element ids that no segment holds yet."""
+        with self._locked():
+            self.load()  # skip anything another worker has stored meanwhile
+            records = {element_id: record for element_id, record in records.items() if element_id not in self}
+            failed = set(failed) - self.failed - set(records)
+            if not records and not failed:
+                return
+            self._write(records, failed)
+            self._compact()
+
+    def queue(self, element_id: int, record: Optional[ShapeRecord]) -> None:
+        """Remember one element's record (None: it failed) for the next :meth:`flush`."""
+        if record is None:
+            self._pending_failed.add(element_id)
+        else:
+            self._pending[element_id] = record
+
+    def flush(self) -> None:
+        if self._pending or self._pending_failed:
+            pending, pending_failed = self._pending, self._pending_failed
+            self._pending, self._pending_failed = {}, set()
+            self.add(pending, pending_failed)
+
+
+def _geometry_store(
+    model_path: Optional[str], settings: ifcopenshell.geom.settings, kernel: str = "iterator"
+) -> Optional[GeometryStore]:
+    if not GEOMETRY_STORE_DIR or model_path is None:
+        return None
+    try:
+        digest = file_digest(model_path)
+    except OSError:
+        return None
+    store_path = os.path.join(GEOMETRY_STORE_DIR, f"{digest}-{kernel}-{_settings_key(settings)}")
+    if store_path not in _GEOMETRY_STORES:
+        _GEOMETRY_STORES[store_path] = GeometryStore(store_path)
+    return _GEOMETRY_STORES[store_path]
+
+
+def flush_geometry_stores() -> None:
+    """Write the meshes tessellated one element at a time since the last flush."""
+    for store in _GEOMETRY_STORES.values():
+        store.flush()
+
+
+def tessellate_batch(
+    ifc_file: ifcopenshell.file,
+    targets: Iterable[Any],
+    threads: Optional[int] = None,
+    settings: Optional[ifcopenshell.geom.settings] = None,
+) -> GeometryBatch:
+    """Tessellate ``targets`` (entity type names and/or elements) with the geometry iterator.
+
+    The iterator shapes elements on ``threads`` kernel threads (``BIM_GEOMETRY_THREADS`` or
+    the CPU count by default) and picks each product's body representation. Elements that
+    fail to tessellate are left out of the batch; rows are ordered by element id. Models
+    opened through ``open_ifc`` keep their geometry in a :class:`GeometryStore` under
+    ``BIM_GEOMETRY_STORE_DIR`` (empty to disable), so only elements never seen before are
+    tessellated.
+    """
+    elements = _batch_targets(ifc_file, targets)
+    settings = _init_geom_settings(settings)
+    threads = threads or GEOMETRY_THREADS
+    store = _geometry_store(registered_model_path(ifc_file), settings)
+    if store is None:
+        return _build_batch(_iterate_shapes(ifc_file, elements, threads, settings))
+
+    missing = store.missing(elements)
+    if missing:
+        records = _iterate_shapes(ifc_file, missing, threads, settings)
+        store.add(records, [element.id() for element in missing if element.id() not in records])
+    return store.take(element.id() for element in elements)
+
+
+def get_element_area_from_geometry(element, settings: Optional[ifcopenshell.geom.settings] = None) -> float:
+    """Calculate the area of an element from its geometry as a fallback."""
+    quantities = get_element_quantities(element) if settings is None else None
+    if quantities is not None:
+        bbox = quantities.bbox
+    else:
+        mesh = get_element_mesh(element, settings)
+        if mesh is None or len(mesh.verts) < 3:
+            return 0.0
+        bbox = mesh.bbox()
+    min_x, min_y, min_z, max_x, max_y, max_z = bbox
+    width = max_x - min_x
+    depth = max_y - min_y
+    height = max_z - min_z
+    return max(width * height, depth * height)
 
 
 def get_space_volume(space):
@@ -265,7 +980,7 @@ def get_space_volume(space):
                             return value
 
     # Method 2: Property sets
-    psets = ifcopenshell.util.element.get_psets(space)
+    psets = get_element_psets(space)
     for pset_data in psets.values():
         volume = pset_data.get("Volume") or pset_data.get("NetVolume") or pset_data.get("GrossVolume")
         if volume:
@@ -282,30 +997,23 @@ def get_space_volume(space):
 
 
 def get_space_volume_from_geometry(space, settings: Optional[ifcopenshell.geom.settings] = None) -> float:
-    """Calculate the volume of a space from its geometry."""
-    settings = _init_geom_settings(settings)
-    if hasattr(space, "Representation") and space.Representation:
-        try:
-            shape = ifcopenshell.geom.create_shape(settings, space)
-            if shape:
-                geometry = shape.geometry
-                if hasattr(geometry, "volume") and geometry.volume:
-                    return geometry.volume
-
-                verts = geometry.verts
-                if len(verts) >= 9:
-                    x_coords = [verts[i] for i in range(0, len(verts), 3)]
-                    y_coords = [verts[i] for i in range(1, len(verts), 3)]
-                    z_coords = [verts[i] for i in range(2, len(verts), 3)]
-
-                    if x_coords and y_coords and z_coords:
-                        width = max(x_coords) - min(x_coords)
-                        depth = max(y_coords) - min(y_coords)
-                        height = max(z_coords) - min(z_coords)
-                        return width * depth * height
-        except Exception:
-            pass  # Ignore geometry creation errors
-    return 0.0
+    """Calculate the volume of a space from its geometry.
+
+    The exact volume of an extruded space, else the enclosed volume of a closed mesh and
+    the bounding-box volume of an open one.
+    """
+    quantities = get_element_quantities(space) if settings is None else None
+    if quantities is not None:
+        return quantities.volume
+    mesh = get_element_mesh(space, settings)
+    if mesh is None:
+        return 0.0
+    if mesh.volume:
+        return mesh.volume
+    if len(mesh.verts) < 3:
+        return 0.0
+    min_x, min_y, min_z, max_x, max_y, max_z = mesh.bbox()
+    return (max_x - min_x) * (max_y - min_y) * (max_z - min_z)
 
 
 def get_space_height(space):
@@ -323,7 +1031,7 @@ def get_space_height(space):
                             return float(qty.LengthValue) * length_scale
 
     # Method 2: From property sets
-    psets = ifcopenshell.util.element.get_psets(space)
+    psets = get_element_psets(space)
     for pset_data in psets.values():
         height = pset_data.get("Height") or pset_data.get("CeilingHeight") or pset_data.get("NetHeight")
         if height:
@@ -389,8 +1097,110 @@ def get_wall_direction(wall):
     return None
 
 
+class StoreyIndex:
+    """Containing storey of any element of one model.
+
+    Parents are collected in one pass over ``IfcRelContainedInSpatialStructure`` and the
+    decomposition relations behind ``Decomposes``. A lookup walks them breadth-first,
+    containment before decomposition, exactly like the traversal in
+    :func:`find_storey_for_element`, and is memoised per element.
+    """
+
+    def __init__(self, model: ifcopenshell.file) -> None:
+        self._contained_in: Dict[int, List[Any]] = {}
+        self._decomposes: Dict[int, List[Any]] = {}
+        self._storeys: Dict[int, Optional[Any]] = {}
+
+        for rel in model.by_type("IfcRelContainedInSpatialStructure"):
+            parent = getattr(rel, "RelatingStructure", None)
+            if parent is None:
+                continue
+            for element in getattr(rel, "RelatedElements", None) or []:
+                self._contained_in.setdefault(element.id(), []).append(parent)
+
+        # IFC2X3 ``Decomposes`` also covers IfcRelNests; later schemas only IfcRelAggregates.
+        decomposition = "IfcRelDecomposes" if model.schema == "IFC2X3" else "IfcRelAggregates"
+        for rel in model.by_type(decomposition):
+            parent = getattr(rel, "RelatingObject", None)
+            if parent is None:
+                continue
+            for element in getattr(rel, "RelatedObjects", None) or []:
+                self._decomposes.setdefault(element.id(), []).append(parent)
+
+    def storey_of(self, element) -> Optional[Any]:
+        element_id = element.id()
+        if element_id not in self._storeys:
+            self._storeys[element_id] = self._search(element)
+        return self._storeys[element_id]
+
+    def _search(self, element) -> Optional[Any]:
+        visited = set()
+        queue = deque([element])
+        while queue:
+            current = queue.popleft()
+            current_id = current.id()
+            if current_id in visited:
+                continue
+            visited.add(current_id)
+            if current.is_a("IfcBuildingStorey"):
+                return current
+            for parents in (self._contained_in.get(current_id, ()), self._decomposes.get(current_id, ())):
+                for parent in parents:
+                    if parent.is_a("IfcBuildingStorey"):
+                        return parent
+                    queue.append(parent)
+        return None
+
+
+_MODELS: "weakref.WeakValueDictionary[int, ifcopenshell.file]" = weakref.WeakValueDictionary()
+_STOREY_INDEXES: Dict[int, StoreyIndex] = {}
+
+
+def storey_index(model: ifcopenshell.file) -> StoreyIndex:
+    """Return the (cached) :class:`StoreyIndex` of ``model``."""
+    file_key = _track_model(model)
+    if file_key is None:
+        return StoreyIndex(model)
+    if file_key not in _STOREY_INDEXES:
+        _STOREY_INDEXES[file_key] = StoreyIndex(model)
+    return _STOREY_INDEXES[file_key]
+
+
+def _storey_index_for(element) -> Optional[StoreyIndex]:
+    file_key = _file_key(element)
+    if file_key is None:
+        return None
+    model = _MODELS.get(file_key)
+    return storey_index(model) if model is not None else None
+
+
+def storey_resolver(storeys) -> Callable[[Any], Optional[Any]]:
+    """Return ``element -> storey`` equivalent to ``find_storey_for_element(element, storeys)``.
+
+    The storey list is indexed once, so resolving many elements costs O(1) each for
+    models opened through ``open_ifc`` (answered from their :class:`StoreyIndex`).
+    """
+    storeys = list(storeys)
+    storey_ids = {storey.id(): storey for storey in storeys}
+
+    def resolve(element):
+        index = _storey_index_for(element)
+        if index is None:
+            return _find_storey_by_traversal(element, storeys)
+        storey = index.storey_of(element)
+        if storey is None:
+            return None
+        return storey_ids.get(storey.id(), storey)
+
+    return resolve
+
+
 def find_storey_for_element(element, storeys):
     """Find which storey contains an element."""
+    return storey_resolver(storeys)(element)
+
+
+def _find_storey_by_traversal(element, storeys):
     storey_ids = {storey.id(): storey for storey in storeys}
     visited = set()
     queue = [element]
@@ -446,8 +1256,9 @@ def get_spaces_in_storey(storey, spaces):
     """Get all spaces contained in a storey"""
     storey_spaces = []
     target_id = getattr(storey, "id", lambda: None)()
+    storey_of = storey_resolver([storey])
     for space in spaces:
-        container = find_storey_for_element(space, [storey])
+        container = storey_of(space)
         if container is None:
             continue
         if container is storey:
@@ -459,29 +1270,18 @@ def get_spaces_in_storey(storey, spaces):
 
 
 def get_element_bbox(element, settings: Optional[ifcopenshell.geom.settings] = None) -> Optional[BoundingBox]:
-    """Return the element bounding box in metres."""
-    settings = _init_geom_settings(settings)
-    if not hasattr(element, "Representation") or not element.Representation:
-        return None
-    try:
-        shape = ifcopenshell.geom.create_shape(settings, element)
-    except Exception:
-        return None
-    if not shape or not hasattr(shape.geometry, "verts"):
-        return None
-
-    verts = shape.geometry.verts
-    if not verts:
+    """Return the element bounding box in metres, in closed form for extruded elements.
+
+    An extruded element whose tessellation fails, such as a wall whose first
+    representation is its 2D ``Axis``, gets a bbox here even though it has no mesh.
+    """
+    quantities = get_element_quantities(element) if settings is None else None
+    if quantities is not None:
+        return quantities.bbox
+    mesh = get_element_mesh(element, settings)
+    if mesh is None:
         return None
-
-    xs = [verts[i] for i in range(0, len(verts), 3)]
-    ys = [verts[i] for i in range(1, len(verts), 3)]
-    zs = [verts[i] for i in range(2, len(verts), 3)]
-
-    if not xs or not ys or not zs:
-        return None
-
-    return (min(xs), min(ys), min(zs), max(xs), max(ys), max(zs))
+    return mesh.bbox()
 
 
 def get_bbox_center(bbox: BoundingBox) -> Tuple[float, float, float]:
@@ -527,6 +1327,32 @@ def _horizontal_distance_to_bbox(point: Tuple[float, float, float], bbox: Boundi
     return (dx**2 + dy**2) ** 0.5
 
 
+class _SpaceGrid:
+    """Uniform XY grid over the space bboxes of one storey, grown by the horizontal tolerance.
+
+    Each space is listed in every cell its grown bbox touches, so the cell containing a
+    point holds every space whose prism can contain that point.
+    """
+
+    def __init__(self, entries: List[Tuple[int, BoundingBox]], margin: float) -> None:
+        spans = [max(bbox[3] - bbox[0], bbox[4] - bbox[1]) + 2 * margin for _, bbox in entries]
+        spans = [span for span in spans if span > 0]
+        self.cell_size = sum(spans) / len(spans) if spans else 1.0
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        for position, bbox in entries:
+            low_x, low_y = self._cell(bbox[0] - margin, bbox[1] - margin)
+            high_x, high_y = self._cell(bbox[3] + margin, bbox[4] + margin)
+            for cell_x in range(low_x, high_x + 1):
+                for cell_y in range(low_y, high_y + 1):
+                    self.cells.setdefault((cell_x, cell_y), []).append(position)
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def candidates(self, x: float, y: float) -> List[int]:
+        return self.cells.get(self._cell(x, y), [])
+
+
 def map_elements_to_spaces(
     model: ifcopenshell.file,
     elements: Iterable[Any],
@@ -542,13 +1368,12 @@ def map_elements_to_spaces(
     if not spaces:
         return {}
 
-    settings = _init_geom_settings()
     storeys = list(model.by_type("IfcBuildingStorey"))
     space_storey_map: Dict[int, Optional[int]] = {}
     space_bboxes: Dict[int, BoundingBox] = {}
 
     for space in spaces:
-        bbox = get_element_bbox(space, settings)
+        bbox = get_element_bbox(space)
         if not bbox:
             continue
         space_bboxes[space.id()] = bbox
@@ -558,26 +1383,35 @@ def map_elements_to_spaces(
     if not space_bboxes:
         return {}
 
+    # Bucket spaces per storey on a grid; candidates keep their position in ``spaces`` so
+    # the stable distance sort below breaks ties exactly like a scan over every space.
+    buckets: Dict[Optional[int], List[Tuple[int, BoundingBox]]] = {}
+    for position, space in enumerate(spaces):
+        space_bbox = space_bboxes.get(space.id())
+        if space_bbox:
+            buckets.setdefault(space_storey_map.get(space.id()), []).append((position, space_bbox))
+    grids = {storey_id: _SpaceGrid(entries, tolerance_horizontal) for storey_id, entries in buckets.items()}
+
     element_map: Dict[int, List[Any]] = {}
 
     for element in elements:
-        bbox = get_element_bbox(element, settings)
+        bbox = get_element_bbox(element)
         if not bbox:
             continue
         center = get_bbox_center(bbox)
         element_storey = find_storey_for_element(element, storeys)
         element_storey_id = element_storey.id() if element_storey else None
 
-        matches: List[Tuple[float, Any]] = []
-        for space in spaces:
-            space_bbox = space_bboxes.get(space.id())
-            if not space_bbox:
-                continue
-
-            target_storey = space_storey_map.get(space.id())
-            if element_storey_id is not None and target_storey not in (element_storey_id, None):
-                continue
+        if element_storey_id is None:
+            searched = list(grids.values())
+        else:
+            searched = [grids[storey_id] for storey_id in (element_storey_id, None) if storey_id in grids]
+        positions = sorted(position for grid in searched for position in grid.candidates(center[0], center[1]))
 
+        matches: List[Tuple[float, Any]] = []
+        for position in positions:
+            space = spaces[position]
+            space_bbox = space_bboxes[space.id()]
             if _point_within_prism(center, space_bbox, tolerance_horizontal, tolerance_vertical):
                 distance = _horizontal_distance_to_bbox(center, space_bbox)
                 matches.append((distance, space))
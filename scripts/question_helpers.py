@@ -1,15 +1,34 @@
 """Utility helpers for question scripts to reduce duplication."""
 from __future__ import annotations
 
+import functools
+import glob
+import hashlib
+import json
 import math
-from collections import defaultdict
+import mmap
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+from collections import Counter, defaultdict
 from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar
 
 import ifcopenshell
-import ifcopenshell.util.element
 import ifcopenshell.util.placement
+import numpy as np
 
-from scripts.ifc_utils import find_storey_for_element, get_element_area, get_length_scale
+from scripts.ifc_utils import (
+    file_digest,
+    get_element_area,
+    get_element_psets,
+    get_length_scale,
+    make_shareable,
+    mmap_npz,
+    register_model_path,
+    storey_resolver,
+)
 
 
 Storey = TypeVar("Storey")
@@ -30,12 +49,638 @@ SPACE_USAGE_KEYWORDS: Dict[str, Tuple[str, ...]] = {
 }
 
 
-def open_ifc(ifc_file_path: str) -> ifcopenshell.file:
-    """Open an IFC file and raise a descriptive error on failure."""
+_OPEN_MODELS: Dict[str, ifcopenshell.file] = {}
+
+
+def _model_key(ifc_file_path) -> str:
+    return os.path.realpath(os.fspath(ifc_file_path))
+
+
+def register_open_model(ifc_file_path, model: ifcopenshell.file) -> None:
+    """Serve an already parsed model from :func:`open_ifc` instead of re-reading the file."""
+    _OPEN_MODELS[_model_key(ifc_file_path)] = model
+    register_model_path(model, ifc_file_path)
+
+
+def release_open_model(ifc_file_path) -> None:
+    """Forget a model registered with :func:`register_open_model`."""
+    _OPEN_MODELS.pop(_model_key(ifc_file_path), None)
+
+
+SNAPSHOT_SUFFIX = ".ifcrdb"
+USE_SNAPSHOTS = os.environ.get("BIM_IFC_SNAPSHOTS", "1") != "0"
+USE_SUBSETS = os.environ.get("BIM_IFC_SUBSETS", "1") != "0"
+
+
+def _snapshot_pattern(ifc_file_path) -> str:
+    stem, _ = os.path.splitext(os.path.realpath(os.fspath(ifc_file_path)))
+    return f"{glob.escape(stem)}.*{SNAPSHOT_SUFFIX}"
+
+
+def _snapshot_digest(ifc_file_path) -> str:
+    """The file's SHA-256, recorded beside its snapshots with the size and mtime it was for.
+
+    Every ``open_ifc`` in a per-question worker looks its snapshot up, so the record saves
+    each of them a full read of an unchanged file, like the STEP histogram store does.
+    """
+    real_path = os.path.realpath(os.fspath(ifc_file_path))
+    stem, _ = os.path.splitext(real_path)
+    record_path = f"{stem}{SNAPSHOT_SUFFIX}.json"
+    stat = os.stat(real_path)
+    try:
+        with open(record_path, encoding="utf-8") as handle:
+            record = json.load(handle)
+        if (record["size"], record["mtime_ns"]) == (stat.st_size, stat.st_mtime_ns):
+            return record["sha256"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    digest = file_digest(real_path)
+    after = os.stat(real_path)
+    if (after.st_size, after.st_mtime_ns) != (stat.st_size, stat.st_mtime_ns):
+        return digest  # changed while it was read: do not vouch for either version
     try:
-        return ifcopenshell.open(ifc_file_path)
-    except Exception as exc:  # pragma: no cover - defensive
-        raise RuntimeError(f"Error opening IFC file: {exc}") from exc
+        fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(record_path), suffix=".tmp")
+        make_shareable(fd)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            json.dump({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": digest}, handle)
+        os.replace(tmp_name, record_path)
+    except OSError:
+        pass
+    return digest
+
+
+def snapshot_path(ifc_file_path) -> str:
+    """Where the binary snapshot of an IFC file lives: next to it, keyed by its SHA-256."""
+    stem, _ = os.path.splitext(os.path.realpath(os.fspath(ifc_file_path)))
+    return f"{stem}.{_snapshot_digest(ifc_file_path)[:16]}{SNAPSHOT_SUFFIX}"
+
+
+def write_snapshot(ifc_file_path) -> str:
+    """Convert an IFC file into its snapshot (a RocksDB store) and return its path.
+
+    The store holds every instance with its attributes and the inverse index, so psets,
+    quantities and relationships read from it exactly as from the parsed STEP file.
+    Snapshots of earlier versions of the file are removed.
+    """
+    target = snapshot_path(ifc_file_path)
+    tmp_dir = tempfile.mkdtemp(dir=os.path.dirname(target), suffix=".tmp")
+    try:
+        ifcopenshell.convert_path_to_rocksdb(os.path.realpath(os.fspath(ifc_file_path)), os.path.join(tmp_dir, "db"))
+        for stale in glob.glob(_snapshot_pattern(ifc_file_path)):
+            shutil.rmtree(stale, ignore_errors=True)
+        os.replace(os.path.join(tmp_dir, "db"), target)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+    return target
+
+
+def _open_snapshot(ifc_file_path) -> Optional[ifcopenshell.file]:
+    # Globbing first keeps the digest (a full read of the file) off the path of models
+    # that have never been snapshotted.
+    if not USE_SNAPSHOTS or not glob.glob(_snapshot_pattern(ifc_file_path)):
+        return None
+    try:
+        path = snapshot_path(ifc_file_path)
+        if not os.path.isdir(path):
+            return None  # only snapshots of other versions of the file
+        # Read-only, so that several workers can open the store at once.
+        return ifcopenshell.open(path, readonly=True)
+    except Exception:
+        return None  # a damaged snapshot: parse the STEP file instead
+
+
+def open_ifc(
+    ifc_file_path: str, snapshot: bool = True, requires: Optional[Sequence[str]] = None
+) -> ifcopenshell.file:
+    """Open an IFC file and raise a descriptive error on failure.
+
+    Models registered through :func:`register_open_model` (for example by the runner's
+    parse-once mode before it forks question workers) are returned without re-parsing.
+    A question that declares the entity and relationship types it reads (its module-level
+    ``REQUIRES``) passes them as ``requires`` and gets a model holding only those, read
+    through :func:`read_step_subset`. Otherwise the file's snapshot (see
+    :func:`write_snapshot`) is opened when one exists for its current contents, and the
+    STEP text is parsed when none does. A snapshot opens much faster but reads entities
+    from disk, so callers that keep the model for many questions pass ``snapshot=False``.
+    """
+    model = _OPEN_MODELS.get(_model_key(ifc_file_path))
+    if model is not None:
+        return model
+    model = None
+    if requires is not None and USE_SUBSETS:
+        try:
+            model = read_step_subset(ifc_file_path, requires)
+        except Exception:  # pragma: no cover - defensive: parse the whole file instead
+            model = None
+    if model is None and snapshot:
+        model = _open_snapshot(ifc_file_path)
+    if model is None:
+        try:
+            model = ifcopenshell.open(ifc_file_path)
+        except Exception as exc:  # pragma: no cover - defensive
+            raise RuntimeError(f"Error opening IFC file: {exc}") from exc
+    register_model_path(model, ifc_file_path)
+    return model
+
+
+def is_open_model(ifc_file_path) -> bool:
+    """Whether :func:`open_ifc` would return an already parsed model for this path."""
+    return _model_key(ifc_file_path) in _OPEN_MODELS
+
+
+STEP_HISTOGRAM_DIR = os.environ.get(
+    "BIM_STEP_HISTOGRAM_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache", "step_histograms"),
+)
+
+# String literals and comments are matched (and dropped) so that text inside them that
+# looks like an instance is not counted.
+_STEP_TOKEN = re.compile(rb"'(?:[^']|'')*'|/\*.*?\*/|#\d+\s*=\s*([A-Za-z][A-Za-z0-9_]*)\s*\(", re.DOTALL)
+_STEP_SCHEMA = re.compile(rb"FILE_SCHEMA\s*\(\s*\(\s*'([^']*)'")
+_STEP_DATA = re.compile(rb"ENDSEC\s*;\s*DATA\s*;")
+_STEP_HISTOGRAMS: Dict[Tuple[str, int, int], Tuple[Optional[str], Dict[str, int]]] = {}
+
+
+def _scan_step_file(real_path: str) -> Tuple[Optional[str], Dict[str, int]]:
+    with open(real_path, "rb") as handle:
+        try:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return None, {}
+        with data:
+            start = _STEP_DATA.search(data)
+            header = data[: start.start()] if start else b""
+            schema = _STEP_SCHEMA.search(header)
+            counts = Counter(name for name in _STEP_TOKEN.findall(data, start.end() if start else 0) if name)
+    return (
+        schema.group(1).decode("ascii", "replace") if schema else None,
+        {name.decode("ascii").upper(): count for name, count in counts.items()},
+    )
+
+
+def step_entity_histogram(ifc_file_path) -> Tuple[Optional[str], Dict[str, int]]:
+    """Return ``(schema, {ENTITY NAME: instances})`` from one pass over the STEP text.
+
+    The DATA section is read through a memory map without building any entity, so this
+    costs a fraction of :func:`open_ifc`. Histograms are memoised per process and saved in
+    ``BIM_STEP_HISTOGRAM_DIR`` (empty to disable), keyed by path, size and mtime, so a file
+    is only scanned again after it changes.
+    """
+    real_path = os.path.realpath(os.fspath(ifc_file_path))
+    stat = os.stat(real_path)
+    key = (real_path, stat.st_size, stat.st_mtime_ns)
+    histogram = _STEP_HISTOGRAMS.get(key)
+    if histogram is not None:
+        return histogram
+
+    store_path = None
+    if STEP_HISTOGRAM_DIR:
+        name = json.dumps(key).encode("utf-8")
+        store_path = os.path.join(STEP_HISTOGRAM_DIR, f"{hashlib.sha1(name).hexdigest()}.json")
+        try:
+            with open(store_path, encoding="utf-8") as handle:
+                stored = json.load(handle)
+            histogram = (stored["schema"], stored["counts"])
+        except (OSError, ValueError, KeyError):
+            histogram = None
+    if histogram is None:
+        histogram = _scan_step_file(real_path)
+        if store_path is not None:
+            try:
+                os.makedirs(STEP_HISTOGRAM_DIR, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=STEP_HISTOGRAM_DIR, suffix=".tmp")
+                make_shareable(fd)
+                with os.fdopen(fd, "w", encoding="utf-8") as handle:
+                    json.dump({"schema": histogram[0], "counts": histogram[1]}, handle)
+                os.replace(tmp_name, store_path)
+            except OSError:
+                pass
+    _STEP_HISTOGRAMS[key] = histogram
+    return histogram
+
+
+@functools.lru_cache(maxsize=None)
+def schema_lineage(schema: Optional[str], entity_name: str) -> Optional[Tuple[str, ...]]:
+    """``entity_name`` and its supertypes in ``schema``, nearest first and lower-cased.
+
+    None if the schema or the entity is unknown.
+    """
+    try:
+        declaration = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema).declaration_by_name(entity_name)
+    except (RuntimeError, TypeError, ValueError):
+        return None
+    names = []
+    while declaration is not None:
+        names.append(declaration.name().lower())
+        declaration = declaration.supertype()
+    return tuple(names)
+
+
+def count_step_entities(ifc_file_path, entity_types: Iterable[str], *, safe: bool = False) -> Optional[int]:
+    """Count instances of ``entity_types`` and their subtypes without parsing the model.
+
+    Matches ``sum(len(model.by_type(t)) for t in entity_types)``, with subtypes taken from
+    the file's schema (``IfcWall`` includes ``IfcWallStandardCase``). With ``safe`` a type
+    the schema lacks counts zero. Returns None when the histogram cannot answer (unknown
+    schema, or an unknown type without ``safe``), so callers can fall back to the parse.
+    """
+    schema, counts = step_entity_histogram(ifc_file_path)
+    if schema is None:
+        return None
+    total = 0
+    for entity_type in entity_types:
+        if schema_lineage(schema, entity_type) is None:
+            if safe:
+                continue
+            return None
+        wanted = entity_type.lower()
+        for name, count in counts.items():
+            lineage = schema_lineage(schema, name)
+            if lineage is not None and wanted in lineage:
+                total += count
+    return total
+
+
+STEP_INDEX_DIR = os.environ.get(
+    "BIM_STEP_INDEX_DIR",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache", "step_index"),
+)
+
+# The start of an instance record (its id and entity name), a reference, or the ";" that
+# ends a record. String literals and comments are matched so that text inside them is skipped.
+_STEP_RECORD = re.compile(
+    rb"'(?:[^']|'')*'|/\*.*?\*/|#(\d+)\s*=\s*([A-Za-z][A-Za-z0-9_]*)\s*\(|#(\d+)|;", re.DOTALL
+)
+_STEP_ARGUMENT = re.compile(rb"'(?:[^']|'')*'|[(),]|[^'(),]+")
+_STEP_INDEXES: Dict[Tuple[str, int, int], "StepIndex"] = {}
+_STEP_INDEX_FIELDS = ("ids", "starts", "ends", "types", "ref_offsets", "refs")
+
+# Entity types every subset loads: IfcProject brings the units, contexts and owner history.
+SUBSET_BASE_TYPES = ("IfcProject",)
+# What a question's REQUIRES adds to read property and quantity sets (element_area,
+# get_element_psets), or to place elements on storeys (storey_resolver).
+PROPERTY_RELATIONSHIPS = ("IfcRelDefinesByProperties", "IfcRelDefinesByType")
+SPATIAL_RELATIONSHIPS = ("IfcBuildingStorey", "IfcRelContainedInSpatialStructure", "IfcRelAggregates")
+# Relationships every subset follows from their relating element, so a loaded wall or beam
+# keeps the openings that cut its geometry (HasOpenings) as it has them in the full model.
+VOID_RELATIONSHIPS = ("IfcRelVoidsElement",)
+
+
+class StepIndex:
+    """Byte range, entity name and outgoing references of every instance record.
+
+    Records are numbered (rows) in file order. The references of row ``r`` are the rows
+    ``refs[ref_offsets[r]:ref_offsets[r + 1]]``; references to missing instances are dropped.
+    """
+
+    def __init__(self, schema: Optional[str], data_offset: int, type_names: Sequence[str], **arrays: np.ndarray) -> None:
+        self.schema = schema
+        self.data_offset = data_offset
+        self.type_names = list(type_names)
+        self.ids = arrays["ids"]
+        self.starts = arrays["starts"]
+        self.ends = arrays["ends"]
+        self.types = arrays["types"]
+        self.ref_offsets = arrays["ref_offsets"]
+        self.refs = arrays["refs"]
+        self._order: Optional[np.ndarray] = None
+
+    def rows_for_ids(self, ids: Sequence[int]) -> np.ndarray:
+        """Rows of the instances ``ids``; ids the file lacks are left out."""
+        if self._order is None:
+            self._order = np.argsort(self.ids, kind="stable")
+        ids = np.asarray(ids, dtype=np.int64)
+        if not len(self._order) or not len(ids):
+            return np.empty(0, dtype=np.int64)
+        found = np.minimum(np.searchsorted(self.ids[self._order], ids), len(self._order) - 1)
+        rows = self._order[found]
+        return rows[self.ids[rows] == ids]
+
+    def rows_of(self, codes: Iterable[int]) -> np.ndarray:
+        """Rows of the records whose entity name has one of the ``codes``, in file order."""
+        return np.flatnonzero(np.isin(self.types, list(codes)))
+
+    def references(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """``(referenced rows, position in rows of the referencing record)``."""
+        begins = self.ref_offsets[rows]
+        counts = self.ref_offsets[rows + 1] - begins
+        total = int(counts.sum())
+        if not total:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        owners = np.repeat(np.arange(len(rows)), counts)
+        positions = np.repeat(begins - np.cumsum(counts) + counts, counts) + np.arange(total)
+        return self.refs[positions], owners
+
+
+def _index_step_file(real_path: str) -> StepIndex:
+    ids, starts, ends, types, ref_offsets, ref_ids = [], [], [], [], [0], []
+    codes: Dict[str, int] = {}
+    with open(real_path, "rb") as handle:
+        try:
+            data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            data = None
+        if data is not None:
+            with data:
+                start = _STEP_DATA.search(data)
+                schema = _STEP_SCHEMA.search(data[: start.start()] if start else b"")
+                data_offset = start.end() if start else -1
+                record_start = None
+                for match in _STEP_RECORD.finditer(data, max(data_offset, 0)):
+                    if match.group(3) is not None:
+                        if record_start is not None:
+                            ref_ids.append(int(match.group(3)))
+                    elif match.group(1) is not None:
+                        record_start = match.start()
+                        record_id = int(match.group(1))
+                        name = match.group(2).decode("ascii").upper()
+                    elif record_start is not None and match.group(0) == b";":
+                        ids.append(record_id)
+                        starts.append(record_start)
+                        ends.append(match.end())
+                        types.append(codes.setdefault(name, len(codes)))
+                        ref_offsets.append(len(ref_ids))
+                        record_start = None
+    if data is None:
+        schema, data_offset = None, -1
+    ids_array = np.array(ids, dtype=np.int64)
+    refs = np.array(ref_ids, dtype=np.int64)
+    ref_offsets_array = np.array(ref_offsets, dtype=np.int64)
+    # References that belong to an unterminated trailing record are cut off.
+    refs = refs[: ref_offsets_array[-1]]
+    # Turn referenced ids into rows, and drop references to instances the file lacks.
+    order = np.argsort(ids_array, kind="stable")
+    found = np.searchsorted(ids_array[order], refs)
+    found[found == len(order)] = 0
+    rows = order[found] if len(order) else found
+    valid = (ids_array[rows] == refs) if len(order) else np.zeros(len(refs), dtype=bool)
+    rows = np.where(valid, rows, -1)
+    owners = np.repeat(np.arange(len(ids_array)), np.diff(ref_offsets_array))
+    kept_per_row = np.bincount(owners[valid], minlength=len(ids_array))
+    return StepIndex(
+        schema.group(1).decode("ascii", "replace") if schema else None,
+        data_offset,
+        list(codes),
+        ids=ids_array,
+        starts=np.array(starts, dtype=np.int64),
+        ends=np.array(ends, dtype=np.int64),
+        types=np.array(types, dtype=np.int32),
+        ref_offsets=np.concatenate(([0], np.cumsum(kept_per_row))).astype(np.int64),
+        refs=rows[valid],
+    )
+
+
+def step_offset_index(ifc_file_path) -> StepIndex:
+    """Return the :class:`StepIndex` of a STEP file from one pass over its memory map.
+
+    Indexes are memoised per process and saved in ``BIM_STEP_INDEX_DIR`` (empty to
+    disable) as ``.npz`` files keyed by path, size and mtime, like the histograms of
+    :func:`step_entity_histogram`.
+    """
+    real_path = os.path.realpath(os.fspath(ifc_file_path))
+    stat = os.stat(real_path)
+    key = (real_path, stat.st_size, stat.st_mtime_ns)
+    index = _STEP_INDEXES.get(key)
+    if index is not None:
+        return index
+
+    store_path = None
+    if STEP_INDEX_DIR:
+        name = json.dumps(key).encode("utf-8")
+        store_path = os.path.join(STEP_INDEX_DIR, f"{hashlib.sha1(name).hexdigest()}.npz")
+        try:
+            # Memory-mapped, so a narrow subset only pages in the rows it reaches.
+            stored = mmap_npz(store_path)
+            index = StepIndex(
+                str(stored["schema"]) or None,
+                int(stored["data_offset"]),
+                stored["type_names"].tolist(),
+                **{field: stored[field] for field in _STEP_INDEX_FIELDS},
+            )
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            index = None
+    if index is None:
+        index = _index_step_file(real_path)
+        if store_path is not None:
+            try:
+                os.makedirs(STEP_INDEX_DIR, exist_ok=True)
+                fd, tmp_name = tempfile.mkstemp(dir=STEP_INDEX_DIR, suffix=".tmp")
+                make_shareable(fd)
+                with os.fdopen(fd, "wb") as handle:
+                    np.savez(
+                        handle,
+                        schema=np.array(index.schema or ""),
+                        data_offset=np.array(index.data_offset),
+                        type_names=np.array(index.type_names, dtype=str),
+                        **{field: getattr(index, field) for field in _STEP_INDEX_FIELDS},
+                    )
+                os.replace(tmp_name, store_path)
+            except OSError:
+                pass
+    _STEP_INDEXES[key] = index
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _subtype_names(schema: str, entity_name: str) -> frozenset:
+    """``entity_name`` and all its subtypes in ``schema``, upper-cased like the index."""
+    pending = [ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema).declaration_by_name(entity_name)]
+    names = set()
+    while pending:
+        declaration = pending.pop()
+        names.add(declaration.name().upper())
+        pending.extend(declaration.subtypes())
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=None)
+def _attribute_names(schema: str, entity_name: str) -> Tuple[str, ...]:
+    declaration = ifcopenshell.ifcopenshell_wrapper.schema_by_name(schema).declaration_by_name(entity_name)
+    return tuple(attribute.name() for attribute in declaration.all_attributes())
+
+
+def _split_arguments(text: bytes) -> List[List]:
+    """The top-level arguments of a record, each a list of tokens and nested lists."""
+    stack: List[List] = [[[]]]
+    for token in _STEP_ARGUMENT.findall(text, text.index(b"(") + 1):
+        if token == b"(":
+            stack.append([[]])
+        elif token == b")":
+            if len(stack) == 1:
+                break
+            items = stack.pop()
+            stack[-1][-1].append([item for item in items if item])
+        elif token == b",":
+            stack[-1].append([])
+        elif token.strip():
+            stack[-1][-1].append(token.strip())
+    return stack[0]
+
+
+def _join_argument(parts: List) -> bytes:
+    return b"".join(
+        b"(" + b",".join(_join_argument(item) for item in part) + b")" if isinstance(part, list) else part
+        for part in parts
+    )
+
+
+def _reference_of(parts: List) -> Optional[int]:
+    if len(parts) == 1 and isinstance(parts[0], bytes) and parts[0].startswith(b"#"):
+        return int(parts[0][1:])
+    return None
+
+
+class _Relationship:
+    """A relationship record split into its ``Related*`` references and the rest."""
+
+    def __init__(self, text: bytes, schema: str, entity_name: str) -> None:
+        self.text = text
+        self.arguments = _split_arguments(text)
+        names = _attribute_names(schema, entity_name)
+        self.related: Dict[int, List[int]] = {}
+        self.relating_element: Optional[int] = None
+        for position, parts in enumerate(self.arguments):
+            if position < len(names) and names[position].startswith("Related"):
+                if len(parts) == 1 and isinstance(parts[0], list):
+                    members = [_reference_of(item) for item in parts[0]]
+                    self.related[position] = [ref for ref in members if ref is not None]
+                else:
+                    ref = _reference_of(parts)
+                    self.related[position] = [ref] if ref is not None else []
+            elif position < len(names) and names[position].startswith("Relating"):
+                self.relating_element = _reference_of(parts)
+
+    def links(self, loaded: set) -> bool:
+        return any(ref in loaded for refs in self.related.values() for ref in refs)
+
+    def relating(self) -> List[int]:
+        """Ids referenced outside the ``Related*`` attributes."""
+        pending = [part for position, parts in enumerate(self.arguments) if position not in self.related for part in parts]
+        found = []
+        while pending:
+            part = pending.pop()
+            if isinstance(part, list):
+                pending.extend(part)
+            elif part.startswith(b"#"):
+                found.append(int(part[1:]))
+        return found
+
+    def pruned(self, loaded: set) -> bytes:
+        """The record with its ``Related*`` lists cut down to the loaded instances."""
+        arguments = []
+        for position, parts in enumerate(self.arguments):
+            if position in self.related and len(parts) == 1 and isinstance(parts[0], list):
+                parts = [[item for item in parts[0] if _reference_of(item) in loaded]]
+            arguments.append(_join_argument(parts))
+        return self.text[: self.text.index(b"(")] + b"(" + b",".join(arguments) + b");"
+
+
+def _load_closure(index: StepIndex, selected: np.ndarray, rows: np.ndarray) -> None:
+    """Mark ``rows`` and every record they reach through references in ``selected``."""
+    frontier = np.unique(rows[~selected[rows]])
+    while frontier.size:
+        selected[frontier] = True
+        referenced, _ = index.references(frontier)
+        referenced = np.unique(referenced)
+        frontier = referenced[~selected[referenced]]
+
+
+def read_step_subset(ifc_file_path, requires: Iterable[str]) -> Optional[ifcopenshell.file]:
+    """Parse only the instances a question needs, located through :func:`step_offset_index`.
+
+    ``requires`` names entity types (with their subtypes) and relationship types. Every
+    instance of an entity type is loaded together with everything it references, so its
+    placement, representation and type chains come along. A relationship is loaded when
+    one of its ``Related*`` instances is, with those lists cut down to the loaded members,
+    and brings its relating side along: ``IfcRelDefinesByProperties`` adds the property
+    sets of loaded elements and ``IfcRelAggregates`` their spatial parents. The
+    ``VOID_RELATIONSHIPS`` go the other way: one is loaded, with its opening, when its
+    relating element is, so geometry computed on a subset matches the full model. Step ids
+    are kept, so ids match the full model. Returns None when the file cannot be subset.
+    """
+    index = step_offset_index(ifc_file_path)
+    if index.schema is None or index.data_offset < 0:
+        return None
+    entity_names, relationship_names = set(), set()
+    for entity_type in (*SUBSET_BASE_TYPES, *requires):
+        lineage = schema_lineage(index.schema, entity_type)
+        if lineage is not None:
+            names = relationship_names if "ifcrelationship" in lineage else entity_names
+            names.update(_subtype_names(index.schema, entity_type))
+    void_names = set()
+    for relationship_type in VOID_RELATIONSHIPS:
+        if schema_lineage(index.schema, relationship_type) is not None:
+            void_names.update(_subtype_names(index.schema, relationship_type))
+    entity_codes = {code for code, name in enumerate(index.type_names) if name in entity_names}
+    relationship_codes = {code for code, name in enumerate(index.type_names) if name in relationship_names}
+    void_codes = {code for code, name in enumerate(index.type_names) if name in void_names}
+
+    selected = np.zeros(len(index.ids), dtype=bool)
+    _load_closure(index, selected, index.rows_of(entity_codes))
+    with open(os.path.realpath(os.fspath(ifc_file_path)), "rb") as handle:
+        data = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        with data:
+
+            def record(row: int) -> bytes:
+                return data[int(index.starts[row]) : int(index.ends[row])]
+
+            voids = index.rows_of(void_codes)
+            if voids.size:
+                referenced, owners = index.references(voids)
+                touching = np.zeros(len(voids), dtype=bool)
+                touching[owners[selected[referenced]]] = True
+                loaded = set(index.ids[selected].tolist())
+                linked = [
+                    row
+                    for row in voids[touching].tolist()
+                    if _Relationship(record(row), index.schema, index.type_names[index.types[row]]).relating_element
+                    in loaded
+                ]
+                # Copied whole: the record's only Related* member is the opening it brings.
+                _load_closure(index, selected, np.asarray(linked, dtype=np.int64))
+
+            relationships: Dict[int, _Relationship] = {}
+            pending = index.rows_of(relationship_codes)
+            while pending.size:
+                # Only relationships referencing a loaded instance at all can link one.
+                referenced, owners = index.references(pending)
+                touching = np.zeros(len(pending), dtype=bool)
+                touching[owners[selected[referenced]]] = True
+                loaded = set(index.ids[selected].tolist())
+                linked = []
+                for row in pending[touching].tolist():
+                    relationship = relationships.get(row)
+                    if relationship is None:
+                        relationship = relationships[row] = _Relationship(
+                            record(row), index.schema, index.type_names[index.types[row]]
+                        )
+                    if relationship.links(loaded):
+                        linked.append(row)
+                if not linked:
+                    break
+                selected[linked] = True
+                relating = [ref for row in linked for ref in relationships[row].relating()]
+                _load_closure(index, selected, index.rows_for_ids(relating))
+                pending = pending[~selected[pending]]
+
+            loaded = set(index.ids[selected].tolist())
+            # Consecutive unchanged records are copied in one slice.
+            copied = selected.copy()
+            copied[list(relationships)] = False
+            boundaries = np.flatnonzero(np.diff(np.concatenate(([False], copied, [False])).astype(np.int8)))
+            runs = {int(first): int(last) - 1 for first, last in zip(boundaries[::2], boundaries[1::2])}
+            records = []
+            for row in np.flatnonzero(selected & ~copied).tolist() + list(runs):
+                if row in runs:
+                    records.append((row, data[int(index.starts[row]) : int(index.ends[runs[row]])]))
+                elif row in relationships:
+                    records.append((row, relationships[row].pruned(loaded)))
+            records.sort()
+            text = b"\n".join([data[: index.data_offset], *(text for _, text in records), b"ENDSEC;\nEND-ISO-10303-21;\n"])
+    try:
+        return ifcopenshell.file.from_string(text.decode("utf-8"))
+    except (UnicodeDecodeError, RuntimeError):
+        return None
 
 
 def safe_by_type(model: ifcopenshell.file, entity: str, *, include_subtypes: bool = True):
@@ -121,10 +766,10 @@ def group_elements_by_storey(
     valid_storeys = [s for s in storeys if storey_filter(s)]
     element_groups: Dict[str, List] = defaultdict(list)
 
-    storey_lookup = {s.id(): s for s in valid_storeys}
+    storey_of = storey_resolver(valid_storeys)
 
     for element in elements:
-        storey = find_storey_for_element(element, valid_storeys)
+        storey = storey_of(element)
         if storey is None:
             element_groups[default_label].append(element)
         else:
@@ -141,8 +786,9 @@ def count_elements_by_storey(
 ) -> Dict[str, int]:
     """Count elements by storey using containment relationships."""
     counts = defaultdict(int)
+    storey_of = storey_resolver(storeys)
     for element in elements:
-        storey = find_storey_for_element(element, storeys)
+        storey = storey_of(element)
         if storey is None:
             counts[default_label] += 1
         else:
@@ -196,9 +842,10 @@ def orientation_counts_by_storey(
 ) -> Dict[str, Dict[str, int]]:
     """Return orientation counts grouped by storey."""
     grouped = defaultdict(lambda: defaultdict(int))
+    storey_of = storey_resolver(storeys)
 
     for element in elements:
-        storey = find_storey_for_element(element, storeys)
+        storey = storey_of(element)
         key = storey_label(storey) if storey else default_label
         orientation = element_orientation(element, axis_index=axis_index)
         if orientation:
@@ -241,11 +888,12 @@ def elements_area_by_storey(
     default_label: str = "Unassigned",
 ) -> Dict[str, float]:
     areas = defaultdict(float)
+    storey_of = storey_resolver(storeys)
     for element in elements:
         area = element_area(element)
         if area is None:
             continue
-        storey = find_storey_for_element(element, storeys)
+        storey = storey_of(element)
         key = storey_label(storey) if storey else default_label
         areas[key] += area
     return dict(areas)
@@ -268,7 +916,7 @@ def get_element_dimensions(element) -> Tuple[Optional[float], Optional[float]]:
 
     if width is None or height is None:
         # Try from property sets as fallback
-        psets = ifcopenshell.util.element.get_psets(element)
+        psets = get_element_psets(element)
         width_candidates = ["Width", "OverallWidth", "NominalWidth", "ClearWidth"]
         height_candidates = ["Height", "OverallHeight", "NominalHeight", "ClearHeight"]
 
@@ -312,7 +960,7 @@ def classify_space_usage(space) -> str:
         if value:
             labels.append(str(value))
 
-    psets = ifcopenshell.util.element.get_psets(space)
+    psets = get_element_psets(space)
     for data in psets.values():
         for key in ("Name", "Usage", "Category", "SpaceType", "Function", "OccupancyType"):
             value = data.get(key)
@@ -0,0 +1,207 @@
+"""Per-element aggregations that several questions can share one model pass for."""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Hashable, Optional, Sequence, Tuple
+
+import ifcopenshell
+
+from scripts.question_helpers import count_step_entities, is_open_model, open_ifc, schema_lineage
+
+
+class Scan:
+    """A question answered by folding the elements of a few entity types.
+
+    ``step(accumulator, entity_type, element)`` is called for every element returned by
+    ``model.by_type(entity_type)`` for each of ``entity_types``, starting from
+    ``initial()``; ``finish(accumulator)`` turns the result into the answer. With
+    ``safe`` an entity type unknown to the schema contributes no elements (like
+    ``safe_by_type``); otherwise the lookup error becomes the answer's error.
+    ``fast_path`` marks a scan whose answer is ``finish(number of elements)``, which
+    :meth:`evaluate_file` can take from the STEP histogram without parsing the model.
+    ``requires`` is passed to :func:`open_ifc` when the scan parses the model on its own,
+    like a script's ``REQUIRES``.
+    """
+
+    def __init__(
+        self,
+        entity_types: Sequence[str],
+        initial: Callable[[], Any],
+        step: Callable[[Any, str, Any], Any],
+        finish: Callable[[Any], Any] = lambda accumulator: accumulator,
+        *,
+        safe: bool = False,
+        fast_path: bool = False,
+        requires: Optional[Sequence[str]] = None,
+    ) -> None:
+        self.entity_types = tuple(entity_types)
+        self.initial = initial
+        self.step = step
+        self.finish = finish
+        self.safe = safe
+        self.fast_path = fast_path
+        self.requires = tuple(requires) if requires is not None else None
+
+    def evaluate(self, model: ifcopenshell.file) -> Any:
+        """Answer this scan alone; errors are raised like the equivalent loop would."""
+        results, _ = run_scans(model, {None: self})
+        if isinstance(results[None], Exception):
+            raise results[None]
+        return results[None]
+
+    def count_from_step(self, ifc_file_path: str) -> Optional[Any]:
+        """The fast-path answer from the STEP histogram, or None when it has to be parsed.
+
+        A model already parsed in this process is counted with ``by_type`` instead.
+        """
+        if not self.fast_path or is_open_model(ifc_file_path):
+            return None
+        count = count_step_entities(ifc_file_path, self.entity_types, safe=self.safe)
+        return self.finish(count) if count is not None else None
+
+    def evaluate_file(self, ifc_file_path: str) -> Any:
+        """Answer this scan for the model at ``ifc_file_path``, parsing it only if needed."""
+        answer = self.count_from_step(ifc_file_path)
+        if answer is not None:
+            return answer
+        return self.evaluate(open_ifc(ifc_file_path, requires=self.requires))
+
+
+def count_of(
+    *entity_types: str,
+    where: Optional[Callable[[Any], bool]] = None,
+    safe: bool = False,
+    fast_path: bool = False,
+) -> Scan:
+    """Count the elements of ``entity_types`` (summed per type) matching ``where``.
+
+    With ``fast_path`` the count may come from the STEP histogram, which cannot see
+    attributes, so it cannot be combined with ``where``.
+    """
+    if fast_path and where is not None:
+        raise ValueError("A fast-path count cannot filter elements with 'where'")
+    if where is None:
+        step = lambda count, entity_type, element: count + 1
+    else:
+        step = lambda count, entity_type, element: count + 1 if where(element) else count
+    return Scan(entity_types, int, step, safe=safe, fast_path=fast_path)
+
+
+def collect(
+    *entity_types: str,
+    value: Callable[[Any], Any],
+    finish: Callable[[Dict[str, list]], Any],
+    safe: bool = False,
+    requires: Optional[Sequence[str]] = None,
+) -> Scan:
+    """Answer ``finish(values)`` from ``value(element)`` of the elements of ``entity_types``.
+
+    ``values`` maps each entity type, in the order given, to the values of its elements
+    in ``by_type`` order, leaving out ``None``. Keeping the types apart makes the answer
+    independent of the order a fused run visits them in, which float sums depend on.
+    """
+
+    def initial() -> Dict[str, list]:
+        return {entity_type: [] for entity_type in entity_types}
+
+    def step(values: Dict[str, list], entity_type: str, element: Any) -> Dict[str, list]:
+        item = value(element)
+        if item is not None:
+            values[entity_type].append(item)
+        return values
+
+    return Scan(entity_types, initial, step, finish, safe=safe, requires=requires)
+
+
+def total(values: Dict[str, list]) -> float:
+    """Sum every collected value, type by type, from ``0.0`` as the loops they replace did."""
+    result = 0.0
+    for items in values.values():
+        for item in items:
+            result += item
+    return result
+
+
+class ScanStats:
+    """How many ``by_type`` passes a fused run made compared with running scans one by one."""
+
+    def __init__(self, scans: int, passes: int, unfused_passes: int) -> None:
+        self.scans = scans
+        self.passes = passes
+        self.unfused_passes = unfused_passes
+
+    @property
+    def passes_saved(self) -> int:
+        return self.unfused_passes - self.passes
+
+
+def run_scans(model: ifcopenshell.file, scans: Dict[Hashable, Scan]) -> Tuple[Dict[Hashable, Any], ScanStats]:
+    """Evaluate every scan with one ``by_type`` pass per distinct entity type.
+
+    A type whose schema supertype is also subscribed gets no pass of its own: its scans
+    are fed from the supertype's pass, filtered with ``is_a`` (which keeps ``by_type``
+    order). Each pass feeds its elements to every scan subscribed to that type; types are
+    visited in the order they were first declared, so a scan spanning several types must
+    not depend on the order of its types. A scan whose type lookup or step raises gets
+    the exception as its result and is fed nothing further.
+    """
+    accumulators: Dict[Hashable, Any] = {}
+    errors: Dict[Hashable, Exception] = {}
+    subscribers: Dict[str, list] = {}
+    for key, scan in scans.items():
+        accumulators[key] = scan.initial()
+        for entity_type in scan.entity_types:
+            subscribers.setdefault(entity_type, []).append(key)
+
+    # Route each subscribed type to the pass of its outermost subscribed supertype.
+    subscribed = {entity_type.lower(): entity_type for entity_type in subscribers}
+    passes: Dict[str, list] = {}
+    for entity_type in subscribers:
+        outer = entity_type
+        for supertype in (schema_lineage(model.schema, entity_type) or ())[1:]:
+            outer = subscribed.get(supertype, outer)
+        passes.setdefault(outer, []).append(entity_type)
+
+    for pass_type, entity_types in passes.items():
+        try:
+            elements = model.by_type(pass_type)
+        except RuntimeError as exc:
+            for key in subscribers[pass_type]:
+                if not scans[key].safe:
+                    errors.setdefault(key, exc)
+            continue
+        live = [
+            (key, entity_type, scans[key].step)
+            for entity_type in entity_types
+            for key in subscribers[entity_type]
+            if key not in errors
+        ]
+        for element in elements:
+            failed = False
+            for key, entity_type, step in live:
+                if entity_type != pass_type and not element.is_a(entity_type):
+                    continue
+                try:
+                    accumulators[key] = step(accumulators[key], entity_type, element)
+                except Exception as exc:
+                    errors[key] = exc
+                    failed = True
+            if failed:
+                live = [entry for entry in live if entry[0] not in errors]
+
+    results: Dict[Hashable, Any] = {}
+    for key, scan in scans.items():
+        if key in errors:
+            results[key] = errors[key]
+            continue
+        try:
+            results[key] = scan.finish(accumulators[key])
+        except Exception as exc:
+            results[key] = exc
+
+    stats = ScanStats(
+        len(scans),
+        len(passes),
+        sum(len(scan.entity_types) for scan in scans.values()),
+    )
+    return results, stats
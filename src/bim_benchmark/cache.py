@@ -0,0 +1,152 @@
+"""Content-addressed on-disk cache of question results."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import limits, paths
+
+
+CACHE_FORMAT_VERSION = 1
+DEFAULT_MAX_SIZE_MB = 512.0
+
+_UNCACHEABLE_PREFIXES = ("Error", limits.TIMEOUT_RESULT, limits.MEMORY_LIMIT_RESULT, limits.CPU_LIMIT_RESULT)
+_IMPORT_SCAN_CACHE: Dict[Tuple[str, int], List[str]] = {}
+
+
+def _file_digest(path: Path) -> str:
+    paths.ensure_scripts_importable()
+    from scripts.ifc_utils import file_digest
+
+    return file_digest(path)
+
+
+def _scripts_imports(source_path: Path) -> List[str]:
+    """Names of the ``scripts.*`` modules imported by one source file (memoised on mtime)."""
+    try:
+        key = (str(source_path), source_path.stat().st_mtime_ns)
+    except OSError:
+        return []
+    if key in _IMPORT_SCAN_CACHE:
+        return _IMPORT_SCAN_CACHE[key]
+    try:
+        tree = ast.parse(source_path.read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        return []
+    module_names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.ImportFrom) and node.module:
+            if node.module == "scripts":
+                module_names.extend(alias.name for alias in node.names)
+            elif node.module.startswith("scripts."):
+                module_names.append(node.module[len("scripts."):])
+        elif isinstance(node, ast.Import):
+            module_names.extend(
+                alias.name[len("scripts."):] for alias in node.names if alias.name.startswith("scripts.")
+            )
+    _IMPORT_SCAN_CACHE[key] = module_names
+    return module_names
+
+
+def imported_helpers(script_path: str | Path) -> List[Path]:
+    """Return the ``scripts/*.py`` helper modules a script imports, followed transitively."""
+    found: Dict[str, Path] = {}
+    pending = [Path(script_path)]
+    while pending:
+        for name in _scripts_imports(pending.pop()):
+            helper_path = paths.SCRIPTS_DIR / f"{name.replace('.', '/')}.py"
+            if name not in found and helper_path.exists():
+                found[name] = helper_path
+                pending.append(helper_path)
+    return [found[name] for name in sorted(found)]
+
+
+def is_cacheable(result: Any) -> bool:
+    """Errors, timeouts and exceeded limits may be transient, so only real answers are cached."""
+    return not (isinstance(result, str) and result.startswith(_UNCACHEABLE_PREFIXES))
+
+
+class ResultCache:
+    """Store question outcomes under a key covering every input that can change the answer.
+
+    The key hashes the IFC file, the question script and each ``scripts`` helper module
+    the script imports (directly or through other helpers). Entries are pickles; when the
+    cache outgrows ``max_size_mb`` the least recently used ones are deleted.
+    """
+
+    def __init__(self, root: str | Path | None = None, max_size_mb: float = DEFAULT_MAX_SIZE_MB) -> None:
+        self.root = Path(root) if root is not None else paths.RESULT_CACHE_DIR
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self._lock = threading.Lock()
+
+    def key_for(self, ifc_model_path: str | Path, script_path: str | Path) -> str:
+        script_path = Path(script_path)
+        payload = {
+            "version": CACHE_FORMAT_VERSION,
+            "model": _file_digest(Path(ifc_model_path)),
+            "script": _file_digest(script_path),
+            "helpers": {helper.name: _file_digest(helper) for helper in imported_helpers(script_path)},
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "rb") as handle:
+                outcome = pickle.load(handle)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return None
+        try:
+            os.utime(entry_path)  # mark as recently used for eviction
+        except OSError:
+            pass
+        return outcome
+
+    def put(self, key: str, outcome: Dict[str, Any]) -> None:
+        if not is_cacheable(outcome.get("result")):
+            return
+        entry_path = self._entry_path(key)
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            data = pickle.dumps(outcome)
+        except Exception:  # unpicklable results are simply not cached
+            return
+        fd, tmp_name = tempfile.mkstemp(dir=entry_path.parent, suffix=".tmp")
+        paths.make_shareable(fd)
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_name, entry_path)
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits its size limit."""
+        with self._lock:
+            entries = []
+            total = 0
+            for entry_path in self.root.glob("*/*.pkl"):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+                total += stat.st_size
+            if total <= self.max_size_bytes:
+                return
+            for _, size, entry_path in sorted(entries):
+                try:
+                    entry_path.unlink()
+                except OSError:
+                    continue
+                total -= size
+                if total <= self.max_size_bytes:
+                    break
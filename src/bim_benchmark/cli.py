@@ -3,14 +3,19 @@
 from __future__ import annotations
 
 import argparse
+import json
+import sys
 from pathlib import Path
 from typing import Iterable
 
-from . import paths, runner
+from . import cache, journal, paths, quantities, revisions, runner, server, snapshots, watch, worker_pool
 
 
 def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Run BIM benchmark scripts against IFC models.")
+    parser = argparse.ArgumentParser(
+        description="Run BIM benchmark scripts against IFC models.",
+        epilog="Use `serve` to start a daemon that keeps models loaded and `ask` to query it.",
+    )
     parser.add_argument(
         "target",
         nargs="?",
@@ -29,22 +34,265 @@ def build_parser() -> argparse.ArgumentParser:
         action="append",
         help="Limit execution to specific question IDs (can be repeated).",
     )
+    parser.add_argument(
+        "--mode",
+        choices=runner.EXECUTION_MODES,
+        default=runner.MODE_PER_QUESTION,
+        help="How question workers obtain the model: parse it per question, parse once and fork, or reuse a warm pool.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Maximum number of questions running at once across all models (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--memory-budget-mb",
+        type=float,
+        default=None,
+        help="Cap concurrent workers so their estimated RSS fits this many MB (defaults to 80%% of RAM).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Run every question even when a cached answer for the same model and scripts exists.",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=cache.DEFAULT_MAX_SIZE_MB,
+        help="Evict the least recently used cached answers beyond this size.",
+    )
+    parser.add_argument(
+        "--no-fuse",
+        dest="fuse",
+        action="store_false",
+        help="Run count questions that declare a SCAN separately instead of in one shared model pass.",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the model loaded and re-run the affected questions whenever it or a script changes.",
+    )
+    parser.add_argument(
+        "--watch-interval",
+        type=float,
+        default=watch.DEFAULT_INTERVAL,
+        help="Seconds between checks for changed files in --watch mode.",
+    )
+    parser.add_argument(
+        "--since",
+        default=None,
+        help="Previous revision of the model: only re-run questions whose entity types changed since it.",
+    )
+    parser.add_argument(
+        "--previous-results",
+        default=None,
+        help="Results CSV of the --since revision (defaults to its <model>_answers.csv).",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Skip the questions an interrupted run already journaled for the same model contents.",
+    )
+    parser.add_argument(
+        "--fsync",
+        choices=journal.FSYNC_POLICIES,
+        default=journal.DEFAULT_FSYNC,
+        help="How often the answers journal is forced to disk: after every answer, at most once a second, or never.",
+    )
+    return parser
+
+
+def build_serve_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bim_benchmark serve",
+        description="Keep models parsed in warm workers and answer questions over localhost HTTP.",
+    )
+    parser.add_argument("--host", default=server.DEFAULT_HOST, help="Interface to listen on.")
+    parser.add_argument("--port", type=int, default=server.DEFAULT_PORT, help="Port to listen on.")
+    parser.add_argument(
+        "--questions",
+        dest="questions",
+        default=str(paths.QUESTIONS_PATH),
+        help="Override the path to questions.csv.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of warm workers (defaults to the CPU count).",
+    )
+    parser.add_argument(
+        "--models-per-worker",
+        type=int,
+        default=worker_pool.DEFAULT_MODEL_CACHE_SIZE,
+        help="How many parsed models each worker keeps (least recently used are dropped).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Run every question even when a cached answer for the same model and scripts exists.",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=float,
+        default=cache.DEFAULT_MAX_SIZE_MB,
+        help="Evict the least recently used cached answers beyond this size.",
+    )
     return parser
 
 
+def build_ask_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bim_benchmark ask",
+        description="Ask a running `bim_benchmark serve` daemon and print its answers as JSON.",
+    )
+    parser.add_argument("model", help="Path to the IFC file.")
+    parser.add_argument(
+        "--question-id",
+        dest="question_ids",
+        action="append",
+        required=True,
+        help="Question to answer (can be repeated).",
+    )
+    parser.add_argument("--host", default=server.DEFAULT_HOST, help="Host of the daemon.")
+    parser.add_argument("--port", type=int, default=server.DEFAULT_PORT, help="Port of the daemon.")
+    return parser
+
+
+def build_diff_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bim_benchmark diff",
+        description="List the elements added, removed and modified between two revisions of a model.",
+    )
+    parser.add_argument("old", help="Previous revision of the IFC file.")
+    parser.add_argument("new", help="New revision of the IFC file.")
+    return parser
+
+
+def build_snapshot_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bim_benchmark snapshot",
+        description="Convert IFC models into binary snapshots that open_ifc loads instead of the STEP text.",
+    )
+    parser.add_argument(
+        "target",
+        nargs="?",
+        default=str(paths.MODELS_DIR),
+        help="Path to an IFC file or a directory containing IFC files (defaults to bundled models).",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Compare the open time of each model from STEP text and from its snapshot.",
+    )
+    return parser
+
+
+def build_quantities_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bim_benchmark quantities",
+        description="Count the elements whose quantities are computed in closed form and those tessellated.",
+    )
+    parser.add_argument(
+        "target",
+        nargs="?",
+        default=str(paths.MODELS_DIR),
+        help="Path to an IFC file or a directory containing IFC files (defaults to bundled models).",
+    )
+    return parser
+
+
+SUBCOMMANDS = ("serve", "ask", "diff", "snapshot", "quantities")
+
+
 def main(argv: Iterable[str] | None = None) -> int:
+    argv = list(sys.argv[1:] if argv is None else argv)
+    if argv and argv[0] == "serve":
+        args = build_serve_parser().parse_args(argv[1:])
+        server.serve(
+            args.host,
+            args.port,
+            Path(args.questions),
+            args.jobs,
+            args.models_per_worker,
+            args.use_cache,
+            args.cache_max_mb,
+        )
+        return 0
+    if argv and argv[0] == "ask":
+        args = build_ask_parser().parse_args(argv[1:])
+        try:
+            answers = server.ask(args.model, args.question_ids, args.host, args.port)
+        except (OSError, RuntimeError) as exc:
+            print(f"Error: {exc}", file=sys.stderr)
+            return 1
+        print(json.dumps(answers, indent=2, default=str))
+        return 0
+
+    if argv and argv[0] == "diff":
+        args = build_diff_parser().parse_args(argv[1:])
+        diff = revisions.diff_models(Path(args.old), Path(args.new))
+        print(f"{len(diff.added)} added, {len(diff.removed)} removed, {len(diff.modified)} modified")
+        if diff.changed:
+            print(diff.summary().to_string(index=False))
+            print(f"Touched entity types: {', '.join(sorted(diff.touched_types))}")
+        return 0
+
+    if argv and argv[0] == "snapshot":
+        args = build_snapshot_parser().parse_args(argv[1:])
+        if args.benchmark:
+            print(snapshots.benchmark(Path(args.target)).to_string(index=False))
+        else:
+            for snapshot in snapshots.write_snapshots(Path(args.target)):
+                print(f"Wrote {snapshot}")
+        return 0
+
+    if argv and argv[0] == "quantities":
+        args = build_quantities_parser().parse_args(argv[1:])
+        print(quantities.split(Path(args.target)).to_string(index=False))
+        return 0
+
     parser = build_parser()
     args = parser.parse_args(argv)
 
     target = Path(args.target)
     questions = Path(args.questions)
+    if args.watch:
+        if target.is_dir():
+            parser.error("--watch needs a single IFC file, not a directory")
+        watch.watch(target, questions, args.question_ids, args.watch_interval)
+        return 0
+    options = {
+        "mode": args.mode,
+        "max_workers": args.jobs,
+        "memory_budget_mb": args.memory_budget_mb,
+        "use_cache": args.use_cache,
+        "cache_max_mb": args.cache_max_mb,
+        "fuse": args.fuse,
+        "resume": args.resume,
+        "fsync": args.fsync,
+    }
+
+    if args.since and target.is_dir():
+        parser.error("--since needs a single IFC file, not a directory")
 
     if target.is_dir():
         print(f"Running benchmarks for IFC files in {target}")
-        runner.run_directory(target, questions, args.question_ids)
+        runner.run_directory(target, questions, args.question_ids, **options)
     else:
         print(f"Running benchmark for {target}")
-        runner.run_full_benchmark(target, questions, args.question_ids)
+        runner.run_full_benchmark(
+            target,
+            questions,
+            args.question_ids,
+            since=args.since,
+            previous_results=args.previous_results,
+            **options,
+        )
     return 0
 
 
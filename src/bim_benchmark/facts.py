@@ -0,0 +1,67 @@
+"""Compute the intermediate facts questions declare once per model and inject them."""
+
+from __future__ import annotations
+
+import contextlib
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import pandas as pd
+
+from . import paths
+
+
+FACTS_COLUMN = "requires_facts"
+
+
+class FactsRequest:
+    """A worker task computing ``names`` (and what they require) instead of a question.
+
+    ``known`` holds facts of the model computed earlier; they are reused, not recomputed.
+    """
+
+    def __init__(self, names: Iterable[str], known: Optional[Dict[str, Any]] = None) -> None:
+        self.names = tuple(names)
+        self.known = dict(known or {})
+
+
+def required_facts(row: pd.Series) -> List[str]:
+    """The facts named in a question's ``requires_facts`` cell (``;``-separated)."""
+    value = row.get(FACTS_COLUMN)
+    if not isinstance(value, str):
+        return []
+    return [name.strip() for name in value.split(";") if name.strip()]
+
+
+def compute_model_facts(
+    ifc_model_path: Path, names: Iterable[str], known: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any] | str:
+    """Return ``{fact: value}`` for ``names`` and their requirements, or an error string.
+
+    Facts in ``known`` are served to the computation and left out of the result.
+    """
+    paths.ensure_scripts_importable()
+    from scripts.facts import compute_facts
+    from scripts.question_helpers import open_ifc
+
+    known = known or {}
+    try:
+        with injected(ifc_model_path, known):
+            model = open_ifc(str(paths.resolve_relative(ifc_model_path)))
+            values = compute_facts(model, names)
+    except Exception as exc:
+        return f"Error: {exc}"
+    return {name: value for name, value in values.items() if name not in known}
+
+
+@contextlib.contextmanager
+def injected(ifc_model_path: Path, values: Optional[Dict[str, Any]]) -> Iterator[None]:
+    """Serve ``values`` to the scripts' ``get_fact`` while the block runs."""
+    if not values:
+        yield
+        return
+    paths.ensure_scripts_importable()
+    from scripts.facts import injected_facts
+
+    with injected_facts(paths.resolve_relative(ifc_model_path), values):
+        yield
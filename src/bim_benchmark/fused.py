@@ -0,0 +1,130 @@
+"""Run the questions that declare a ``SCAN`` together, one model pass per entity type."""
+
+from __future__ import annotations
+
+import ast
+import importlib.util
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from . import paths
+
+
+SCAN_ATTRIBUTE = "SCAN"
+
+_DECLARES_SCAN_CACHE: Dict[Tuple[str, int], bool] = {}
+
+
+def declares_scan(script_path: str | Path) -> bool:
+    """Whether the script assigns a module-level ``SCAN`` (checked without importing it)."""
+    script_path = Path(script_path)
+    try:
+        key = (str(script_path), script_path.stat().st_mtime_ns)
+    except OSError:
+        return False
+    if key not in _DECLARES_SCAN_CACHE:
+        try:
+            tree = ast.parse(script_path.read_text(encoding="utf-8"))
+        except (OSError, SyntaxError, ValueError):
+            tree = ast.Module(body=[], type_ignores=[])
+        _DECLARES_SCAN_CACHE[key] = any(
+            isinstance(node, ast.Assign)
+            and any(isinstance(target, ast.Name) and target.id == SCAN_ATTRIBUTE for target in node.targets)
+            for node in tree.body
+        )
+    return _DECLARES_SCAN_CACHE[key]
+
+
+def run_fused_scan(ifc_model_path: Path, script_paths: Sequence[Path]) -> Dict[str, Any]:
+    """Answer every script's ``SCAN`` with at most one parse of the model.
+
+    Returns ``{"results": {script path: answer}, "passes": n, "unfused_passes": m,
+    "step_counts": k}``, where errors are reported as ``"Error: ..."`` strings exactly as
+    the scripts would and ``k`` fast-path counts were read from the STEP histogram
+    instead of the parsed model (which is not parsed at all if that covers every scan).
+    The model is read with the union of the scans' ``requires`` when every scan has one.
+    """
+    paths.ensure_scripts_importable()
+    from scripts.question_helpers import open_ifc
+    from scripts.scan_engine import run_scans
+
+    ifc_model_path = paths.resolve_relative(ifc_model_path)
+    script_paths = [paths.resolve_relative(script_path) for script_path in script_paths]
+    results: Dict[str, Any] = {}
+    scans = {}
+    for script_path in script_paths:
+        if not script_path.exists():
+            results[str(script_path)] = f"Error: Script not found at {script_path}"
+            continue
+        try:
+            spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            scans[str(script_path)] = getattr(module, SCAN_ATTRIBUTE)
+        except Exception as exc:
+            results[str(script_path)] = f"Error: {exc}"
+
+    if not ifc_model_path.exists():
+        for key in scans:
+            results[key] = f"Error: IFC file not found at {ifc_model_path}"
+        return {"results": results, "passes": 0, "unfused_passes": 0, "step_counts": 0}
+
+    # Fast-path counts come from the STEP histogram; the model is parsed only for the rest.
+    step_counts = step_passes = 0
+    for key, scan in list(scans.items()):
+        try:
+            answer = scan.count_from_step(str(ifc_model_path))
+        except Exception:
+            answer = None  # the parse below reports the problem
+        if answer is not None:
+            results[key] = answer
+            step_counts += 1
+            step_passes += len(scan.entity_types)
+            del scans[key]
+    if not scans:
+        return {"results": results, "passes": 0, "unfused_passes": step_passes, "step_counts": step_counts}
+    requires = None
+    if all(scan.requires is not None for scan in scans.values()):
+        requires = list(dict.fromkeys(entity_type for scan in scans.values() for entity_type in scan.requires))
+    try:
+        model = open_ifc(str(ifc_model_path), requires=requires)
+    except Exception as exc:
+        for key in scans:
+            results[key] = f"Error: {exc}"
+        return {"results": results, "passes": 0, "unfused_passes": step_passes, "step_counts": step_counts}
+
+    answers, stats = run_scans(model, scans)
+    for key, answer in answers.items():
+        results[key] = f"Error: {answer}" if isinstance(answer, Exception) else answer
+    return {
+        "results": results,
+        "passes": stats.passes,
+        "unfused_passes": stats.unfused_passes + step_passes,
+        "step_counts": step_counts,
+    }
+
+
+def split_outcome(outcome: Dict[str, Any], script_paths: List[Path], marker: str) -> List[Dict[str, Any]]:
+    """Turn a fused task's outcome into one outcome per script.
+
+    Every outcome carries ``marker`` (the ID of the task's first question) as ``fused``.
+    The task's wall time is recorded once, on the first outcome, and the others have no
+    time of their own, so the time is not mistaken for a question's. A timeout or crash
+    is reported for every script.
+    """
+    fused = outcome["result"]
+    outcomes = []
+    for position, script_path in enumerate(script_paths):
+        if isinstance(fused, dict):
+            result = fused["results"].get(str(paths.resolve_relative(script_path)), "Error: No result returned")
+        else:
+            result = fused
+        outcomes.append(
+            {
+                "result": result,
+                "time": outcome["time"] if position == 0 else None,
+                "peak_rss_mb": outcome.get("peak_rss_mb"),
+                "fused": marker,
+            }
+        )
+    return outcomes
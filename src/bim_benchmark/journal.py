@@ -0,0 +1,156 @@
+"""Append-only journal of a model's answers, written while its questions are in flight."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import paths
+from .cache import is_cacheable
+
+
+FSYNC_ALWAYS = "always"
+FSYNC_INTERVAL = "interval"
+FSYNC_NEVER = "never"
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_INTERVAL, FSYNC_NEVER)
+DEFAULT_FSYNC = FSYNC_INTERVAL
+FSYNC_INTERVAL_SECONDS = 1.0
+
+
+def journal_path(ifc_model_path: Path) -> Path:
+    return paths.RESULTS_DIR / f"{ifc_model_path.stem}_answers.jsonl"
+
+
+def previous_journal_path(journal: Path) -> Path:
+    return journal.with_name(journal.name + ".prev")
+
+
+def _model_digest(ifc_model_path: Path) -> Optional[str]:
+    paths.ensure_scripts_importable()
+    from scripts.ifc_utils import file_digest
+
+    try:
+        return file_digest(ifc_model_path)
+    except OSError:
+        return None
+
+
+def _jsonable(result: Any) -> Any:
+    # The results CSV holds str(result), so that is all a non-scalar answer needs to keep.
+    if result is None or isinstance(result, (str, bool, int, float)):
+        return result
+    return str(result)
+
+
+class ResultJournal:
+    """One JSON line per answer, tagged with the SHA-256 of the model it was computed on.
+
+    ``fsync`` is ``always`` (every line reaches the disk before the next question is
+    recorded), ``interval`` (at most one fsync per second) or ``never`` (lines are only
+    flushed to the OS). With ``resume`` the answers already journaled for the same model
+    contents are kept in :attr:`resumed`, except errors and timeouts, which are run
+    again; without it the journal starts empty, and a non-empty journal left by an
+    interrupted run is moved aside to ``<journal>.prev`` (which a later ``resume`` also
+    reads) rather than truncated.
+    """
+
+    def __init__(self, ifc_model_path: Path, fsync: str = DEFAULT_FSYNC, resume: bool = False) -> None:
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy {fsync!r}; expected one of {', '.join(FSYNC_POLICIES)}")
+        self.path = journal_path(ifc_model_path)
+        self.previous_path = previous_journal_path(self.path)
+        self.fsync = fsync
+        self.model_digest = _model_digest(ifc_model_path)
+        self.resumed: Dict[str, Dict[str, Any]] = self._read() if resume and self.model_digest else {}
+        if not resume:
+            self._set_aside()
+        self._last_sync = 0.0
+        self._rewrite()
+        self._handle = open(self.path, "a", encoding="utf-8")
+
+    def _set_aside(self) -> None:
+        try:
+            if self.path.stat().st_size == 0:
+                return
+        except OSError:
+            return
+        os.replace(self.path, self.previous_path)
+        print(
+            f"Warning: {self.path.name} holds answers from an interrupted run; moved it to "
+            f"{self.previous_path.name} (re-run with --resume to use them)",
+            file=sys.stderr,
+        )
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        entries: Dict[str, Dict[str, Any]] = {}
+        # The set-aside journal is older than the live one, so its answers go first.
+        for path in (self.previous_path, self.path):
+            self._read_into(path, entries)
+        return entries
+
+    def _read_into(self, path: Path, entries: Dict[str, Dict[str, Any]]) -> None:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # torn last line of an interrupted write
+                    if entry.get("model_digest") != self.model_digest:
+                        continue
+                    data = entry["data"]
+                    if is_cacheable(data["result"]):
+                        entries[entry["question_id"]] = data
+                    else:
+                        entries.pop(entry["question_id"], None)
+        except OSError:
+            pass
+
+    def _rewrite(self) -> None:
+        """Replace the journal with the resumed answers (or nothing) in one rename."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        paths.make_shareable(fd)
+        with os.fdopen(fd, "w", encoding="utf-8") as handle:
+            for q_id, data in self.resumed.items():
+                handle.write(self._line(q_id, data))
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(tmp_name, self.path)
+
+    def _line(self, q_id: str, data: Dict[str, Any]) -> str:
+        entry = {
+            "question_id": q_id,
+            "model_digest": self.model_digest,
+            "data": {**data, "result": _jsonable(data["result"])},
+        }
+        return json.dumps(entry, default=str) + "\n"
+
+    def append(self, q_id: str, data: Dict[str, Any]) -> None:
+        self._handle.write(self._line(q_id, data))
+        self._handle.flush()
+        now = time.monotonic()
+        if self.fsync == FSYNC_ALWAYS or (
+            self.fsync == FSYNC_INTERVAL and now - self._last_sync >= FSYNC_INTERVAL_SECONDS
+        ):
+            os.fsync(self._handle.fileno())
+            self._last_sync = now
+
+    def close(self, remove: bool = False) -> None:
+        """Close the journal; ``remove`` once the results CSV holds every answer."""
+        if self._handle.closed:
+            return
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(self._handle.fileno())
+        self._handle.close()
+        if remove:
+            for path in (self.path, self.previous_path):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
@@ -0,0 +1,284 @@
+"""Per-question wall-clock, memory and CPU budgets and their enforcement in workers."""
+
+from __future__ import annotations
+
+import contextlib
+import math
+import os
+import signal
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+import pandas as pd
+
+from . import memory
+
+try:  # pragma: no cover - not available on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+LIMIT_COLUMNS = ("timeout_s", "max_rss_mb", "cpu_seconds")
+
+# A question's timeout follows its difficulty, raised to this multiple of its last runtime
+# on the same model when that was longer. Runtimes are not trusted to lower it: a warm-pool
+# run leaves out the parse that a per-question run pays.
+DIFFICULTY_TIMEOUT_S = {"easy": 600.0, "medium": 1800.0, "hard": 3600.0}
+HISTORY_TIMEOUT_FACTOR = 10.0
+
+# Memory and CPU budgets are derived the same way: the difficulty's entry, raised to a
+# multiple of the question's last peak RSS (whole process, so an overestimate of its
+# growth) or runtime on the model. A difficulty this table lacks leaves them unlimited.
+DIFFICULTY_RSS_MB = {"easy": 2048.0, "medium": 4096.0, "hard": 8192.0}
+HISTORY_RSS_FACTOR = 4.0
+DIFFICULTY_CPU_S = DIFFICULTY_TIMEOUT_S
+HISTORY_CPU_FACTOR = HISTORY_TIMEOUT_FACTOR
+
+WATCHDOG_INTERVAL = 0.2  # seconds between RSS/CPU checks
+WATCHDOG_GRACE = 5.0  # seconds a limit may stay unanswered before the worker exits
+
+TIMEOUT_RESULT = "EXECUTION TIMEOUT"
+MEMORY_LIMIT_RESULT = "MEMORY LIMIT EXCEEDED"
+CPU_LIMIT_RESULT = "CPU LIMIT EXCEEDED"
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+STATUS_MEMORY_LIMIT = "memory_limit"
+STATUS_CPU_LIMIT = "cpu_limit"
+
+# Exit codes of a worker whose script did not return to Python in time to be stopped.
+EXIT_MEMORY_LIMIT = 86
+EXIT_CPU_LIMIT = 87
+_EXIT_RESULTS = {EXIT_MEMORY_LIMIT: MEMORY_LIMIT_RESULT, EXIT_CPU_LIMIT: CPU_LIMIT_RESULT}
+
+
+class QuestionLimits:
+    """Budgets for one task; ``None`` leaves that resource unlimited.
+
+    ``max_rss_mb`` bounds how far the task grows the worker's RSS, not its total: a warm
+    worker's cached models and a forked worker's copy of the parent's are already there.
+    """
+
+    def __init__(
+        self, timeout_s: float, max_rss_mb: Optional[float] = None, cpu_seconds: Optional[float] = None
+    ) -> None:
+        self.timeout_s = timeout_s
+        self.max_rss_mb = max_rss_mb
+        self.cpu_seconds = cpu_seconds
+
+    @property
+    def enforced_in_worker(self) -> bool:
+        return self.max_rss_mb is not None or self.cpu_seconds is not None
+
+    @classmethod
+    def combined(cls, limits: Iterable["QuestionLimits"], default_timeout: float) -> "QuestionLimits":
+        """Budgets for several questions answered by one task (a fused scan).
+
+        Timeouts and CPU budgets add up, but neither exceeds ``default_timeout``, the
+        bound no single question's timeout goes beyond either.
+        """
+        limits = list(limits)
+        rss = [limit.max_rss_mb for limit in limits]
+        cpu = [limit.cpu_seconds for limit in limits]
+        return cls(
+            min(sum(limit.timeout_s for limit in limits), default_timeout),
+            None if None in rss else max(rss),
+            None if None in cpu else min(sum(cpu), default_timeout),
+        )
+
+
+def _cell(row: pd.Series, column: str) -> Optional[float]:
+    value = pd.to_numeric(row.get(column), errors="coerce")
+    if value is None or pd.isna(value) or value <= 0:
+        return None
+    return float(value)
+
+
+def _derived(
+    row: pd.Series,
+    column: str,
+    by_difficulty: Dict[str, float],
+    factor: float,
+    previous: Optional[float],
+    default: Optional[float],
+) -> Optional[float]:
+    """``row[column]``, or the difficulty's budget raised to ``factor`` times ``previous``."""
+    value = _cell(row, column)
+    if value is not None:
+        return value
+    value = by_difficulty.get(str(row.get("difficulty")).strip().lower(), default)
+    if value is not None and previous is not None:
+        value = max(value, factor * previous)
+    return value
+
+
+def question_limits(
+    row: pd.Series,
+    previous_time: Optional[float],
+    default_timeout: float,
+    previous_peak_rss_mb: Optional[float] = None,
+) -> QuestionLimits:
+    """The limits a question's catalogue row sets, derived for the columns it leaves empty.
+
+    The derived timeout is the difficulty's entry in ``DIFFICULTY_TIMEOUT_S``, or
+    ``HISTORY_TIMEOUT_FACTOR`` times ``previous_time`` (the question's last runtime on the
+    model) if that is longer. No timeout exceeds ``default_timeout``. ``max_rss_mb`` and
+    ``cpu_seconds`` follow ``DIFFICULTY_RSS_MB`` and ``previous_peak_rss_mb``, and
+    ``DIFFICULTY_CPU_S`` and ``previous_time``, in the same way.
+    """
+    timeout = _derived(
+        row, "timeout_s", DIFFICULTY_TIMEOUT_S, HISTORY_TIMEOUT_FACTOR, previous_time, default_timeout
+    )
+    return QuestionLimits(
+        min(timeout, default_timeout),
+        _derived(row, "max_rss_mb", DIFFICULTY_RSS_MB, HISTORY_RSS_FACTOR, previous_peak_rss_mb, None),
+        _derived(row, "cpu_seconds", DIFFICULTY_CPU_S, HISTORY_CPU_FACTOR, previous_time, None),
+    )
+
+
+def outcome_status(result: Any) -> str:
+    """Classify a result as ``ok``, ``error``, ``timeout``, ``memory_limit`` or ``cpu_limit``."""
+    if not isinstance(result, str):
+        return STATUS_OK
+    if result.startswith(TIMEOUT_RESULT):
+        return STATUS_TIMEOUT
+    if result.startswith(MEMORY_LIMIT_RESULT):
+        return STATUS_MEMORY_LIMIT
+    if result.startswith(CPU_LIMIT_RESULT):
+        return STATUS_CPU_LIMIT
+    if result.startswith("Error"):
+        return STATUS_ERROR
+    return STATUS_OK
+
+
+def exit_result(exitcode: Optional[int]) -> Optional[str]:
+    """The limit a worker exited on, judged from its exit code (None: it crashed)."""
+    return _EXIT_RESULTS.get(exitcode)
+
+
+class LimitExceeded(BaseException):
+    """Raised in the script's thread when a limit is hit.
+
+    Derives from ``BaseException`` so the ``except Exception`` blocks in scripts and in
+    :func:`run_benchmark_script` do not turn it into an ordinary error answer.
+    """
+
+    def __init__(self, result: str) -> None:
+        super().__init__(result)
+        self.result = result
+
+
+def _process_cpu_seconds() -> float:
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    return usage.ru_utime + usage.ru_stime
+
+
+class _Enforcement:
+    """The limits of the task running in this process, checked by a watchdog thread.
+
+    The RSS budget is counted from the process's RSS when the task starts. The CPU budget
+    is also a soft ``RLIMIT_CPU``, so the kernel signals it even when the watchdog is
+    starved. Only the soft limit is lowered, since a warm worker cannot raise its hard
+    limit again for the next task.
+    """
+
+    def __init__(self, limits: QuestionLimits) -> None:
+        self.limits = limits
+        self.tripped: Optional[str] = None
+        self.raised = False
+        self.done = threading.Event()
+        self.rss_ceiling = None
+        if limits.max_rss_mb is not None:
+            self.rss_ceiling = (memory.current_rss_mb() or 0.0) + limits.max_rss_mb
+        self.cpu_deadline = None
+        if limits.cpu_seconds is not None and resource is not None:
+            self.cpu_deadline = _process_cpu_seconds() + limits.cpu_seconds
+
+    def trip(self, result: str) -> None:
+        if self.tripped is None:
+            self.tripped = result
+            os.kill(os.getpid(), signal.SIGUSR1)
+
+    def watch(self) -> None:
+        tripped_at = None
+        while not self.done.wait(WATCHDOG_INTERVAL):
+            if self.tripped is None:
+                rss = memory.current_rss_mb()
+                if self.rss_ceiling is not None and rss is not None and rss > self.rss_ceiling:
+                    self.trip(MEMORY_LIMIT_RESULT)
+                elif self.cpu_deadline is not None and _process_cpu_seconds() > self.cpu_deadline:
+                    self.trip(CPU_LIMIT_RESULT)
+                if self.tripped is not None:
+                    tripped_at = time.monotonic()
+            elif not self.raised and time.monotonic() - tripped_at > WATCHDOG_GRACE:
+                # The script is stuck in native code and cannot take the exception.
+                os._exit(EXIT_MEMORY_LIMIT if self.tripped == MEMORY_LIMIT_RESULT else EXIT_CPU_LIMIT)
+
+
+_ACTIVE: Optional[_Enforcement] = None
+
+
+def _on_limit_signal(signum, frame) -> None:
+    enforcement = _ACTIVE
+    if enforcement is None or enforcement.raised:
+        return  # a late signal after the task ended
+    if signum != signal.SIGUSR1:  # SIGXCPU from the soft RLIMIT_CPU
+        enforcement.tripped = enforcement.tripped or CPU_LIMIT_RESULT
+    if enforcement.tripped is None:
+        return
+    enforcement.raised = True
+    raise LimitExceeded(enforcement.tripped)
+
+
+@contextlib.contextmanager
+def enforced(limits: Optional[QuestionLimits]) -> Iterator[None]:
+    """Raise :class:`LimitExceeded` in the block once it exceeds ``limits``' memory or CPU.
+
+    Limits are only enforced in a process's main thread on POSIX; elsewhere the block
+    runs unlimited and only the runner's wall-clock timeout applies.
+    """
+    global _ACTIVE
+    if (
+        limits is None
+        or not limits.enforced_in_worker
+        or resource is None
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    enforcement = _Enforcement(limits)
+    previous_handlers = {
+        signum: signal.signal(signum, _on_limit_signal) for signum in (signal.SIGUSR1, signal.SIGXCPU)
+    }
+    soft_cpu, hard_cpu = resource.getrlimit(resource.RLIMIT_CPU)
+    if enforcement.cpu_deadline is not None:
+        soft = math.ceil(enforcement.cpu_deadline)
+        if hard_cpu == resource.RLIM_INFINITY or soft < hard_cpu:
+            resource.setrlimit(resource.RLIMIT_CPU, (soft, hard_cpu))
+    watchdog = threading.Thread(target=enforcement.watch, name="question-limits", daemon=True)
+    _ACTIVE = enforcement
+    watchdog.start()
+    try:
+        yield
+    finally:
+        enforcement.raised = True  # disarm before restoring anything
+        enforcement.done.set()
+        _ACTIVE = None
+        resource.setrlimit(resource.RLIMIT_CPU, (soft_cpu, hard_cpu))
+        watchdog.join()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
+
+
+def limited_result(limits: Optional[QuestionLimits], task, *args) -> Any:
+    """Return ``task(*args)``, or the limit's result string if it was stopped by one."""
+    try:
+        with enforced(limits):
+            return task(*args)
+    except LimitExceeded as exc:
+        return exc.result
+
@@ -0,0 +1,147 @@
+"""Memory measurement and admission control for question workers."""
+
+from __future__ import annotations
+
+import os
+import sys
+import threading
+from pathlib import Path
+from typing import Dict, Optional
+
+try:  # pragma: no cover - not available on Windows
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None
+
+
+WORKER_BASELINE_MB = 150.0  # interpreter + ifcopenshell/numpy/scipy imports
+MODEL_RSS_PER_FILE_MB = 10.0  # resident MB per MB of STEP text, measured on the reference models
+DEFAULT_BUDGET_FRACTION = 0.8
+
+
+def _read_status_kb(field: str) -> Optional[float]:
+    try:
+        with open("/proc/self/status", encoding="ascii") as status:
+            for line in status:
+                if line.startswith(field + ":"):
+                    return float(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def current_rss_mb() -> Optional[float]:
+    """Resident set size of the calling process in MB."""
+    kb = _read_status_kb("VmRSS")
+    return kb / 1024.0 if kb is not None else None
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of the calling process in MB (since the last reset)."""
+    kb = _read_status_kb("VmHWM")
+    if kb is not None:
+        return kb / 1024.0
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere.
+    return peak / (1024.0 * 1024.0) if sys.platform == "darwin" else peak / 1024.0
+
+
+def reset_peak_rss() -> bool:
+    """Reset the kernel's peak-RSS counter so the next reading covers one task only (Linux)."""
+    try:
+        with open("/proc/self/clear_refs", "w", encoding="ascii") as clear_refs:
+            clear_refs.write("5")
+        return True
+    except OSError:
+        return False
+
+
+def total_memory_mb() -> Optional[float]:
+    """Physical memory of the machine in MB, if the platform exposes it."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") / (1024.0 * 1024.0)
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def default_budget_mb() -> Optional[float]:
+    total = total_memory_mb()
+    return total * DEFAULT_BUDGET_FRACTION if total else None
+
+
+def estimate_model_rss_mb(model_path: str | Path) -> float:
+    """Estimate the resident size of a parsed model from the size of its IFC file."""
+    try:
+        size_mb = Path(model_path).stat().st_size / (1024.0 * 1024.0)
+    except OSError:
+        size_mb = 0.0
+    return size_mb * MODEL_RSS_PER_FILE_MB
+
+
+class ModelFootprints:
+    """Per-model estimate of the RSS one question worker needs.
+
+    Starts from a file-size estimate (or a direct measurement when the runner parsed the
+    model itself) and is raised to the largest peak RSS any question has reported.
+    """
+
+    def __init__(self) -> None:
+        self._estimates: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def worker_mb(self, model_path: str | Path) -> float:
+        key = str(model_path)
+        with self._lock:
+            if key not in self._estimates:
+                self._estimates[key] = WORKER_BASELINE_MB + estimate_model_rss_mb(model_path)
+            return self._estimates[key]
+
+    def record_model_rss(self, model_path: str | Path, model_mb: float) -> None:
+        """Replace the file-size guess with a measured model size."""
+        with self._lock:
+            self._estimates[str(model_path)] = WORKER_BASELINE_MB + model_mb
+
+    def observe(self, model_path: str | Path, peak_mb: Optional[float]) -> None:
+        if peak_mb is None:
+            return
+        key = str(model_path)
+        with self._lock:
+            self._estimates[key] = max(self._estimates.get(key, 0.0), peak_mb)
+
+
+class MemoryBudget:
+    """Admit workers only while the sum of their estimated RSS fits in ``budget_mb``.
+
+    A task is always admitted when nothing else is running, so a single model larger than
+    the budget still makes progress (one question at a time).
+    """
+
+    def __init__(self, budget_mb: Optional[float]) -> None:
+        self.budget_mb = budget_mb
+        self.in_use_mb = 0.0
+        self.peak_in_use_mb = 0.0
+        self._running = 0
+        self._condition = threading.Condition()
+
+    def acquire(self, amount_mb: float) -> None:
+        with self._condition:
+            if self.budget_mb is not None:
+                while self._running and self.in_use_mb + amount_mb > self.budget_mb:
+                    self._condition.wait()
+            self._running += 1
+            self.in_use_mb += amount_mb
+            self.peak_in_use_mb = max(self.peak_in_use_mb, self.in_use_mb)
+
+    def release(self, amount_mb: float) -> None:
+        with self._condition:
+            self._running -= 1
+            self.in_use_mb -= amount_mb
+            self._condition.notify_all()
+
+    def max_workers(self, worker_mb: float, limit: int) -> int:
+        """How many workers of ``worker_mb`` fit in the budget, capped at ``limit``."""
+        if self.budget_mb is None or worker_mb <= 0:
+            return limit
+        return max(1, min(limit, int(self.budget_mb // worker_mb)))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import sys
 from pathlib import Path
 
 
@@ -10,17 +12,36 @@ DATA_DIR = REPO_ROOT / "data"
 MODELS_DIR = DATA_DIR / "reference_models"
 RESULTS_DIR = DATA_DIR / "benchmark_results"
 QUESTIONS_PATH = DATA_DIR / "questions.csv"
+CACHE_DIR = DATA_DIR / "cache"
+RESULT_CACHE_DIR = CACHE_DIR / "results"
 SCRIPTS_DIR = REPO_ROOT / "scripts"
 
+# Reading the umask means setting it, so it is read once at import, before any threads.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def ensure_required_directories() -> None:
     """Make sure directories that receive generated artefacts exist."""
     RESULTS_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def ensure_scripts_importable() -> None:
+    """Put the repository root on ``sys.path`` so ``scripts.*`` helpers can be imported."""
+    root = str(REPO_ROOT)
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+
 def resolve_relative(path_fragment: str | Path) -> Path:
     """Resolve a project-relative path fragment to an absolute path."""
     candidate = Path(path_fragment)
     if candidate.is_absolute():
         return candidate
     return REPO_ROOT / candidate
+
+
+def make_shareable(fd: int) -> None:
+    """Give a ``tempfile.mkstemp`` file (always 0600) the mode a plain ``open`` would get."""
+    if hasattr(os, "fchmod"):  # not available on Windows
+        os.fchmod(fd, 0o666 & ~_UMASK)
@@ -0,0 +1,55 @@
+"""Which elements of a model get closed-form quantities and which are tessellated."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from . import paths
+from .snapshots import model_paths
+
+
+def split(target: Path) -> pd.DataFrame:
+    """Per model and entity type, the elements evaluated analytically and those tessellated.
+
+    Only elements with a representation are counted. ``analytic_s`` is the time taken to
+    evaluate every element of the model in closed form.
+    """
+    paths.ensure_scripts_importable()
+    import ifcopenshell
+    from scripts.ifc_utils import QuantityEngine
+
+    rows = []
+    for ifc_path in model_paths(target):
+        model = ifcopenshell.open(str(ifc_path))
+        engine = QuantityEngine()
+        counts = {}
+        start = time.perf_counter()
+        for element in model.by_type("IfcProduct"):
+            if not getattr(element, "Representation", None):
+                continue
+            analytic = engine.get(element) is not None
+            entry = counts.setdefault(element.is_a(), [0, 0])
+            entry[0 if analytic else 1] += 1
+        elapsed = time.perf_counter() - start
+        for entity_type, (analytic, tessellated) in sorted(counts.items()):
+            rows.append(
+                {
+                    "model": ifc_path.name,
+                    "entity_type": entity_type,
+                    "analytic": analytic,
+                    "tessellated": tessellated,
+                }
+            )
+        rows.append(
+            {
+                "model": ifc_path.name,
+                "entity_type": "(all)",
+                "analytic": engine.analytic,
+                "tessellated": engine.tessellated,
+                "analytic_s": round(elapsed, 4),
+            }
+        )
+    return pd.DataFrame(rows, columns=["model", "entity_type", "analytic", "tessellated", "analytic_s"])
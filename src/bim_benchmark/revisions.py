@@ -0,0 +1,303 @@
+"""Compare two revisions of a model and work out which answers they can share."""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import os
+import pickle
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+from . import facts, paths
+from .cache import is_cacheable
+
+
+SNAPSHOT_FORMAT_VERSION = 1
+SNAPSHOT_CACHE_DIR = paths.CACHE_DIR / "revisions"
+
+# A change to the spatial structure can move any element to another storey or building.
+GLOBAL_TYPES = frozenset({"ifcproject", "ifcsite", "ifcbuilding", "ifcbuildingstorey"})
+# Relationships whose membership is diffed rather than followed: one of them lists a whole
+# storey, so a new wall would otherwise touch every element type on that storey.
+_FAN_OUT_RELATIONSHIPS = ("IfcRelContainedInSpatialStructure", "IfcRelAggregates", "IfcRelDecomposes")
+
+_ENTITY_TYPE_LITERAL = re.compile(r"^Ifc[A-Z][A-Za-z0-9]*$")
+
+# GlobalId -> (entity class, content hash, storey label)
+Snapshot = Dict[str, Tuple[str, str, Optional[str]]]
+
+
+class _ContentHasher:
+    """Hash entities by content, following references into non-rooted entities.
+
+    Rooted entities (``IfcRoot``) referenced from an attribute contribute only their
+    GlobalId, and ``OwnerHistory`` is skipped, so re-exporting an unchanged element gives
+    the same hash even though its step ids and timestamps differ.
+    """
+
+    def __init__(self) -> None:
+        self._memo: Dict[int, str] = {}
+
+    def _value(self, value: Any) -> str:
+        import ifcopenshell
+
+        if isinstance(value, ifcopenshell.entity_instance):
+            if value.id() == 0:  # inline typed value such as IfcLabel('...')
+                return f"{value.is_a()}({self._value(value.wrappedValue)})"
+            if value.is_a("IfcRoot"):
+                return f"@{value.GlobalId}"
+            return f"#{self._nested(value)}"
+        if isinstance(value, (tuple, list)):
+            return "(" + ",".join(self._value(item) for item in value) + ")"
+        return repr(value)
+
+    def _nested(self, entity) -> str:
+        digest = self._memo.get(entity.id())
+        if digest is None:
+            digest = self._memo[entity.id()] = self._digest(entity.is_a(), list(entity))
+        return digest
+
+    def _digest(self, ifc_class: str, values: List[Any]) -> str:
+        text = "|".join([ifc_class, *(self._value(value) for value in values)])
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def rooted(self, entity) -> str:
+        values = list(entity)
+        values[1] = None  # OwnerHistory
+        return self._digest(entity.is_a(), values)
+
+
+def model_snapshot(ifc_model_path: Path) -> Snapshot:
+    """GlobalId, class, content hash and storey of every rooted entity of a model.
+
+    Snapshots are cached in ``data/cache/revisions`` by the file's SHA-256.
+    """
+    paths.ensure_scripts_importable()
+    from scripts.ifc_utils import file_digest, storey_resolver
+    from scripts.question_helpers import get_ordered_storeys, open_ifc, storey_label
+
+    ifc_model_path = paths.resolve_relative(ifc_model_path)
+    cache_path = SNAPSHOT_CACHE_DIR / f"{file_digest(ifc_model_path)}-v{SNAPSHOT_FORMAT_VERSION}.pkl"
+    try:
+        with open(cache_path, "rb") as handle:
+            return pickle.load(handle)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    model = open_ifc(str(ifc_model_path), snapshot=False)
+    hasher = _ContentHasher()
+    storey_of = storey_resolver(get_ordered_storeys(model))
+    snapshot: Snapshot = {}
+    for entity in model.by_type("IfcRoot"):
+        storey = storey_of(entity) if entity.is_a("IfcProduct") else None
+        snapshot[entity.GlobalId] = (entity.is_a(), hasher.rooted(entity), storey_label(storey) if storey else None)
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+    paths.make_shareable(fd)
+    with os.fdopen(fd, "wb") as handle:
+        pickle.dump(snapshot, handle)
+    os.replace(tmp_name, cache_path)
+    return snapshot
+
+
+class ModelDiff:
+    """Rooted entities added, removed and modified between two revisions.
+
+    ``touched_types`` holds the classes whose answers may differ: those of the changed
+    entities, of the entities they are related to through a changed or one-hop
+    relationship (openings to their walls, property sets to their objects, ...), and of
+    the entities that joined or left a spatial container.
+    """
+
+    def __init__(self, old: Snapshot, new: Snapshot) -> None:
+        self.added = {guid: new[guid] for guid in new.keys() - old.keys()}
+        self.removed = {guid: old[guid] for guid in old.keys() - new.keys()}
+        self.modified = {
+            guid: new[guid] for guid in new.keys() & old.keys() if new[guid][:2] != old[guid][:2]
+        }
+        self.touched_types: Set[str] = set()
+        self.schema: Optional[str] = None
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
+
+    @property
+    def global_change(self) -> bool:
+        """Whether the spatial structure changed, which can move any answer."""
+        return any(ifc_class.lower() in GLOBAL_TYPES for ifc_class in self.touched_types)
+
+    def summary(self) -> pd.DataFrame:
+        """Counts per change, entity class and storey."""
+        records = [
+            {"change": change, "ifc_class": ifc_class, "storey": storey or "-"}
+            for change, entries in (("added", self.added), ("removed", self.removed), ("modified", self.modified))
+            for ifc_class, _, storey in entries.values()
+        ]
+        if not records:
+            return pd.DataFrame(columns=["change", "ifc_class", "storey", "count"])
+        table = pd.DataFrame(records)
+        return table.groupby(["change", "ifc_class", "storey"]).size().reset_index(name="count")
+
+    def follow_relationships(self, old_model, new_model) -> None:
+        """Fill in ``touched_types`` from the two parsed revisions the snapshots came from."""
+        if self.changed:
+            self.schema = new_model.schema
+            self.touched_types = _touched_types(old_model, new_model, self)
+
+    def touches(self, entity_types: Optional[Iterable[str]]) -> bool:
+        """Whether a question reading ``entity_types`` (None: unknown) can change its answer."""
+        if not self.changed:
+            return False
+        if entity_types is None or self.global_change:
+            return True
+        wanted = {entity_type.lower() for entity_type in entity_types}
+        return any(wanted.intersection(_lineage(self.schema, ifc_class)) for ifc_class in self.touched_types)
+
+
+def _lineage(schema: Optional[str], ifc_class: str) -> Tuple[str, ...]:
+    """``ifc_class`` and its supertypes, lower-cased (just ``ifc_class`` if unknown)."""
+    paths.ensure_scripts_importable()
+    from scripts.question_helpers import schema_lineage
+
+    return schema_lineage(schema, ifc_class) or (ifc_class.lower(),)
+
+
+def _rooted_references(entity) -> Set[Any]:
+    """Rooted entities referenced directly by ``entity``'s attributes."""
+    import ifcopenshell
+
+    found = set()
+    pending = list(entity)
+    while pending:
+        value = pending.pop()
+        if isinstance(value, (tuple, list)):
+            pending.extend(value)
+        elif isinstance(value, ifcopenshell.entity_instance) and value.id() and value.is_a("IfcRoot"):
+            found.add(value)
+    return found
+
+
+def _touched_types(old_model, new_model, diff: ModelDiff) -> Set[str]:
+    touched = {entries[guid][0] for entries in (diff.added, diff.removed, diff.modified) for guid in entries}
+
+    def related(model, guid: str) -> None:
+        try:
+            entity = model.by_guid(guid)
+        except RuntimeError:
+            return
+        if entity.is_a("IfcRelationship"):
+            if not any(entity.is_a(fan_out) for fan_out in _FAN_OUT_RELATIONSHIPS):
+                touched.update(other.is_a() for other in _rooted_references(entity))
+            return
+        for relationship in model.get_inverse(entity):
+            if relationship.is_a("IfcRelationship") and not any(
+                relationship.is_a(fan_out) for fan_out in _FAN_OUT_RELATIONSHIPS
+            ):
+                touched.update(other.is_a() for other in _rooted_references(relationship) if other != entity)
+
+    for guid in diff.added.keys() | diff.modified.keys():
+        related(new_model, guid)
+    for guid in diff.removed.keys() | diff.modified.keys():
+        related(old_model, guid)
+
+    # Members that joined or left a spatial container (or an aggregate) changed storey.
+    for guid, (ifc_class, _, _) in diff.modified.items():
+        if not any(ifc_class == fan_out or _is_subclass(new_model, ifc_class, fan_out) for fan_out in _FAN_OUT_RELATIONSHIPS):
+            continue
+        try:
+            before = {entity.GlobalId: entity.is_a() for entity in _rooted_references(old_model.by_guid(guid))}
+            after = {entity.GlobalId: entity.is_a() for entity in _rooted_references(new_model.by_guid(guid))}
+        except RuntimeError:
+            continue
+        touched.update(before[member] for member in before.keys() - after.keys())
+        touched.update(after[member] for member in after.keys() - before.keys())
+    return touched
+
+
+def _is_subclass(model, ifc_class: str, supertype: str) -> bool:
+    return supertype.lower() in _lineage(model.schema, ifc_class)
+
+
+def diff_models(old_model_path: Path, new_model_path: Path) -> ModelDiff:
+    """Diff two revisions of a model by GlobalId and content hash."""
+    paths.ensure_scripts_importable()
+    from scripts.question_helpers import open_ifc
+
+    diff = ModelDiff(model_snapshot(old_model_path), model_snapshot(new_model_path))
+    if diff.changed:
+        diff.follow_relationships(
+            open_ifc(str(paths.resolve_relative(old_model_path)), snapshot=False),
+            open_ifc(str(paths.resolve_relative(new_model_path)), snapshot=False),
+        )
+    return diff
+
+
+def question_entity_types(script_path: Path, fact_names: Iterable[str] = ()) -> Optional[Set[str]]:
+    """Entity types a question reads: the ``Ifc*`` names in its script plus those of its facts.
+
+    Returns None when the script names no entity type, since its dependencies are then
+    hidden in helpers and the question must always be re-run.
+    """
+    try:
+        tree = ast.parse(Path(script_path).read_text(encoding="utf-8"))
+    except (OSError, SyntaxError, ValueError):
+        return None
+    entity_types = {
+        node.value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and _ENTITY_TYPE_LITERAL.match(node.value)
+    }
+    fact_names = list(fact_names)
+    if fact_names:
+        paths.ensure_scripts_importable()
+        from scripts.facts import fact_entity_types
+
+        try:
+            entity_types |= fact_entity_types(fact_names)
+        except ValueError:
+            return None
+    return entity_types or None
+
+
+def previous_answers(results_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Read a results CSV back into the runner's per-question result rows."""
+    table = pd.read_csv(results_path, dtype=str, keep_default_na=False)
+    answers = {}
+    for record in table.to_dict("records"):
+        answers[record["question_id"]] = {
+            "question": record["question"],
+            "result": record["result"],
+            "difficulty": record["difficulty"],
+            "time": float(record["time_seconds"]) if record["time_seconds"] else None,
+            "fused": record.get("fused") or None,
+            "peak_rss_mb": float(record["peak_rss_mb"]) if record.get("peak_rss_mb") else None,
+            "cached": True,
+        }
+    return answers
+
+
+def carried_answers(
+    df: pd.DataFrame,
+    diff: ModelDiff,
+    previous: Dict[str, Dict[str, Any]],
+) -> Dict[str, Dict[str, Any]]:
+    """The previous answers of the questions in ``df`` the revision cannot have changed.
+
+    Errors and timeouts are never carried forward.
+    """
+    carried = {}
+    for _, row in df.iterrows():
+        q_id = row["question_id"]
+        if q_id not in previous or not is_cacheable(previous[q_id]["result"]):
+            continue
+        entity_types = question_entity_types(paths.resolve_relative(row["script_path"]), facts.required_facts(row))
+        if not diff.touches(entity_types):
+            carried[q_id] = previous[q_id]
+    return carried
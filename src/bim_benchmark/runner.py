@@ -5,24 +5,151 @@ from __future__ import annotations
 import concurrent.futures
 import importlib.util
 import multiprocessing
+import os
+import sys
+import tempfile
+import threading
 import time
 from pathlib import Path
 from queue import Empty
-from typing import Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 import pandas as pd
 from tqdm import tqdm
 
-from . import paths
+from . import facts, fused, journal, limits, memory, paths, revisions, scheduler
+from .cache import DEFAULT_MAX_SIZE_MB, ResultCache
+from .worker_pool import WarmWorkerPool
 
 
 SCRIPT_TIMEOUT = 8000  # seconds
 
+MODE_PER_QUESTION = "per-question"
+MODE_PARSE_ONCE = "parse-once"
+MODE_WARM_POOL = "warm-pool"
+EXECUTION_MODES = (MODE_PER_QUESTION, MODE_PARSE_ONCE, MODE_WARM_POOL)
 
-def _run_script_worker(result_queue, ifc_model_path: Path, script_path: Path) -> None:
-    """Execute a benchmark script and push the outcome to the provided queue."""
-    result = run_benchmark_script(ifc_model_path, script_path)
-    result_queue.put(result)
+
+def _question_helpers():
+    """Import ``scripts.question_helpers`` lazily so the CLI starts without ifcopenshell."""
+    paths.ensure_scripts_importable()
+    from scripts import question_helpers
+
+    return question_helpers
+
+
+def _process_context(mode: str):
+    """Return the multiprocessing context used to start question workers."""
+    if mode not in EXECUTION_MODES:
+        raise ValueError(f"Unknown execution mode {mode!r}; expected one of {', '.join(EXECUTION_MODES)}")
+    if mode == MODE_PARSE_ONCE:
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise ValueError("The parse-once mode needs the 'fork' start method, which this platform lacks")
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
+def _preload_model(ifc_model_path: Path, footprints: memory.ModelFootprints) -> bool:
+    """Parse the model in the parent so forked workers inherit it copy-on-write."""
+    question_helpers = _question_helpers()
+    rss_before = memory.current_rss_mb()
+    try:
+        model = question_helpers.open_ifc(str(ifc_model_path), snapshot=False)
+    except RuntimeError:
+        # Let every question report the parse failure on its own, as in per-question mode.
+        return False
+    rss_after = memory.current_rss_mb()
+    if rss_before is not None and rss_after is not None:
+        footprints.record_model_rss(ifc_model_path, rss_after - rss_before)
+    question_helpers.register_open_model(ifc_model_path, model)
+    return True
+
+
+def execute_task(
+    ifc_model_path: Path,
+    script_path,
+    fact_values: Optional[Dict[str, Any]] = None,
+    question_limits: Optional[limits.QuestionLimits] = None,
+):
+    """Run one script with ``fact_values`` injected, within ``question_limits``.
+
+    ``script_path`` may also be a list of scripts (answered as one fused scan) or a
+    :class:`facts.FactsRequest`.
+    """
+    return limits.limited_result(question_limits, _execute_task, ifc_model_path, script_path, fact_values)
+
+
+def _execute_task(ifc_model_path: Path, script_path, fact_values: Optional[Dict[str, Any]]):
+    try:
+        if isinstance(script_path, facts.FactsRequest):
+            return facts.compute_model_facts(ifc_model_path, script_path.names, script_path.known)
+        if isinstance(script_path, (list, tuple)):
+            return fused.run_fused_scan(ifc_model_path, script_path)
+        with facts.injected(ifc_model_path, fact_values):
+            return run_benchmark_script(ifc_model_path, script_path)
+    finally:
+        _flush_geometry()
+
+
+def _flush_geometry() -> None:
+    """Persist the meshes the task tessellated one element at a time, if it used any."""
+    ifc_utils = sys.modules.get("scripts.ifc_utils")
+    if ifc_utils is not None:
+        try:
+            ifc_utils.flush_geometry_stores()
+        except OSError:
+            pass  # the store is a cache; the answers stand without it
+
+
+def _run_script_worker(
+    result_queue,
+    ifc_model_path: Path,
+    script_path,
+    fact_values: Optional[Dict[str, Any]] = None,
+    question_limits: Optional[limits.QuestionLimits] = None,
+) -> None:
+    """Execute a benchmark task and push the outcome to the provided queue."""
+    memory.reset_peak_rss()
+    result = execute_task(ifc_model_path, script_path, fact_values, question_limits)
+    result_queue.put({"result": result, "peak_rss_mb": memory.peak_rss_mb()})
+
+
+def _run_in_process(
+    context,
+    ifc_model_path: Path,
+    script_path,
+    fact_values: Optional[Dict[str, Any]] = None,
+    question_limits: Optional[limits.QuestionLimits] = None,
+) -> Dict[str, Any]:
+    """Run one task in a dedicated process and return ``{"result", "time", "peak_rss_mb"}``."""
+    timeout = question_limits.timeout_s if question_limits is not None else SCRIPT_TIMEOUT
+    result_queue = context.Queue()
+    process = context.Process(
+        target=_run_script_worker,
+        args=(result_queue, ifc_model_path, script_path, fact_values, question_limits),
+    )
+
+    start_time = time.time()
+    process.start()
+    process.join(timeout)
+
+    if process.is_alive():
+        process.terminate()
+        process.join()
+        outcome = {"result": limits.TIMEOUT_RESULT, "peak_rss_mb": None}
+        elapsed = float(timeout)
+    else:
+        try:
+            outcome = result_queue.get_nowait()
+        except Empty:
+            result = limits.exit_result(process.exitcode) or "Error: No result returned"
+            outcome = {"result": result, "peak_rss_mb": None}
+        elapsed = time.time() - start_time
+
+    result_queue.close()
+    result_queue.join_thread()
+    outcome["time"] = elapsed
+    return outcome
 
 
 def run_benchmark_script(ifc_model_path: Path, script_path: Path):
@@ -54,88 +181,23 @@ def run_benchmark_script(ifc_model_path: Path, script_path: Path):
         return f"Error: {exc}"
 
 
-def run_full_benchmark(
-    ifc_model_path: str | Path,
-    csv_path: str | Path | None = None,
-    question_ids: Optional[Iterable[str | int]] = None,
-):
-    """Run every benchmark question defined in the CSV for a single IFC file."""
-    paths.ensure_required_directories()
-
-    ifc_model_path = paths.resolve_relative(ifc_model_path)
-    csv_path = paths.resolve_relative(csv_path or paths.QUESTIONS_PATH)
-
-    df = pd.read_csv(csv_path)
-    results = {}
-
+def _select_questions(df: pd.DataFrame, question_ids: Optional[Iterable[str | int]]) -> List[int]:
+    """Translate requested question IDs (or positional indices) into row indices."""
     if not question_ids:
-        selection = list(range(len(df)))
-    else:
-        selection = []
-        for requested in question_ids:
-            if isinstance(requested, int):
-                selection.append(requested)
-                continue
-            matches = df.index[df["question_id"] == requested]
-            if not matches.empty:
-                selection.append(int(matches[0]))
-
-    def process_question(idx: int):
-        if idx >= len(df):
-            return None
-        row = df.iloc[idx]
-        question_id = row["question_id"]
-        script_path = paths.resolve_relative(row["script_path"])
-
-        result_queue = multiprocessing.Queue()
-        process = multiprocessing.Process(
-            target=_run_script_worker,
-            args=(result_queue, ifc_model_path, script_path),
-        )
-
-        start_time = time.time()
-        process.start()
-        process.join(SCRIPT_TIMEOUT)
-
-        if process.is_alive():
-            process.terminate()
-            process.join()
-            result = "EXECUTION TIMEOUT"
-            elapsed = float(SCRIPT_TIMEOUT)
-        else:
-            try:
-                result = result_queue.get_nowait()
-            except Empty:
-                result = "Error: No result returned"
-            elapsed = time.time() - start_time
-
-        result_queue.close()
-        result_queue.join_thread()
-
-        return (
-            question_id,
-            {
-                "question": row["question_text"],
-                "result": result,
-                "difficulty": row["difficulty"],
-                "time": round(elapsed, 3),
-            },
-        )
-
-    with concurrent.futures.ThreadPoolExecutor(max_workers=multiprocessing.cpu_count()) as executor:
-        future_to_idx = {executor.submit(process_question, idx): idx for idx in selection}
-        results_iter = concurrent.futures.as_completed(future_to_idx)
-        for future in tqdm(
-            results_iter,
-            total=len(future_to_idx),
-            desc=f"{ifc_model_path.stem}.ifc Benchmark",
-            ncols=120,
-        ):
-            res = future.result()
-            if res is not None:
-                q_id, data = res
-                results[q_id] = data
-
+        return list(range(len(df)))
+    selection = []
+    for requested in question_ids:
+        if isinstance(requested, int):
+            selection.append(requested)
+            continue
+        matches = df.index[df["question_id"] == requested]
+        if not matches.empty:
+            selection.append(int(matches[0]))
+    return [idx for idx in selection if idx < len(df)]
+
+
+def _write_results(ifc_model_path: Path, results: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Write ``<model>_answers.csv`` sorted by question ID and return the sorted results."""
     results = dict(sorted(results.items(), key=lambda item: item[0]))
 
     results_df = pd.DataFrame(
@@ -147,27 +209,441 @@ def run_full_benchmark(
                 "difficulty": data["difficulty"],
                 "model": str(ifc_model_path),
                 "time_seconds": data["time"],
+                "fused": data.get("fused"),
+                "peak_rss_mb": data.get("peak_rss_mb"),
+                "cached": data.get("cached", False),
+                "status": limits.outcome_status(data["result"]),
             }
             for q_id, data in results.items()
         ]
     )
     output_path = paths.RESULTS_DIR / f"{ifc_model_path.stem}_answers.csv"
-    results_df.to_csv(output_path, index=False)
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, suffix=".tmp")
+    paths.make_shareable(fd)
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as handle:
+        results_df.to_csv(handle, index=False)
+    os.replace(tmp_name, output_path)
     return results
 
 
+def _result_row(row: pd.Series, outcome: Dict[str, Any], *, cached: bool) -> Dict[str, Any]:
+    peak_rss = outcome.get("peak_rss_mb")
+    return {
+        "question": row["question_text"],
+        "result": outcome["result"],
+        "difficulty": row["difficulty"],
+        "time": round(outcome["time"], 3) if outcome["time"] is not None else None,
+        "fused": outcome.get("fused"),
+        "peak_rss_mb": round(peak_rss, 1) if peak_rss is not None else None,
+        "cached": cached,
+    }
+
+
+class _ModelRun:
+    """Book-keeping for one model while its questions are in flight."""
+
+    def __init__(
+        self,
+        ifc_model_path: Path,
+        selection: List[str],
+        carried: Optional[Dict[str, Dict[str, Any]]] = None,
+        result_journal: Optional[journal.ResultJournal] = None,
+    ) -> None:
+        self.ifc_model_path = ifc_model_path
+        self.journal = result_journal
+        self.previous_times = scheduler.historical_question_times(ifc_model_path)
+        self.previous_peaks = scheduler.historical_question_peaks(ifc_model_path)
+        resumed = result_journal.resumed if result_journal is not None else {}
+        self.results: Dict[str, Dict[str, Any]] = {
+            q_id: data for q_id, data in {**resumed, **(carried or {})}.items() if q_id in selection
+        }
+        if result_journal is not None:
+            for q_id, data in self.results.items():
+                if q_id not in resumed:
+                    result_journal.append(q_id, data)
+        self.pending = len(selection) - len(self.results)
+        self.loaded = False
+        self.preloaded = False
+        self.lock = threading.Lock()
+        self.facts: Dict[str, Any] = {}
+        self.failed_facts: set = set()
+        self.facts_lock = threading.Lock()
+
+
+def _run_models(
+    model_paths: List[Path],
+    csv_path: Path,
+    question_ids: Optional[Iterable[str | int]],
+    mode: str,
+    pool: Optional[WarmWorkerPool],
+    max_workers: Optional[int],
+    memory_budget_mb: Optional[float],
+    result_cache: Optional[ResultCache],
+    progress_label: str,
+    fuse: bool = True,
+    carried: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None,
+    resume: bool = False,
+    fsync: str = journal.DEFAULT_FSYNC,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Run the selected questions for every model under one shared concurrency budget.
+
+    Tasks are queued model by model in the order given, so a single executor keeps all
+    workers busy across model boundaries. Each model's CSV is written as soon as its last
+    question completes. A task only starts once the estimated RSS of its worker fits in
+    ``memory_budget_mb`` next to the workers already running. Answers found in
+    ``result_cache`` are returned without running the script. With ``fuse`` the stale
+    questions of a model whose scripts declare a ``SCAN`` run as one task that visits
+    each entity type once for all of them. Facts named in a question's
+    ``requires_facts`` column are computed once per model, by the first question that
+    needs them, and injected into every question that declares them. ``carried`` maps a
+    model path to answers taken over from a previous revision; those questions are not run.
+
+    Every answer is appended to the model's :class:`journal.ResultJournal` as it comes
+    in, and the journal is removed once the CSV is written. With ``resume`` the
+    questions a previous, interrupted run journaled for the same model are not run again.
+
+    Tasks are dispatched longest first by their runtime in the previous results CSVs (see
+    :class:`scheduler.CostModel`), across all models; a warm pool orders them within each
+    model instead, so its workers keep their parsed models. The predicted and actual
+    makespans are printed at the end.
+    """
+    paths.ensure_required_directories()
+    context = _process_context(mode)
+
+    df = pd.read_csv(csv_path)
+    selection = _select_questions(df, question_ids)
+    carried = carried or {}
+    selected_ids = [df.iloc[idx]["question_id"] for idx in selection]
+    runs = [
+        _ModelRun(
+            model_path,
+            selected_ids,
+            carried.get(str(model_path)),
+            journal.ResultJournal(model_path, fsync, resume),
+        )
+        for model_path in model_paths
+    ]
+    for run in runs:
+        if run.journal.resumed:
+            print(f"Resuming {run.ifc_model_path.name}: {len(run.journal.resumed)} answers already journaled")
+    footprints = memory.ModelFootprints()
+    budget = memory.MemoryBudget(memory_budget_mb)
+    max_workers = max_workers or multiprocessing.cpu_count()
+    tasks = [(run, idx) for run in runs for idx in selection if df.iloc[idx]["question_id"] not in run.results]
+
+    aggregate: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    def finish(run: _ModelRun) -> None:
+        aggregate[str(run.ifc_model_path)] = _write_results(run.ifc_model_path, run.results)
+        run.journal.close(remove=True)
+
+    def record(run: _ModelRun, q_id: str, data: Dict[str, Any]) -> None:
+        run.results[q_id] = data
+        run.journal.append(q_id, data)
+        run.pending -= 1
+        if run.pending == 0:
+            finish(run)
+            if run.preloaded:
+                _question_helpers().release_open_model(run.ifc_model_path)
+                run.preloaded = False
+
+    for run in runs:
+        if not run.pending:
+            finish(run)
+
+    # Serve cache hits straight away; only stale or unknown answers reach a worker.
+    stale_tasks = []
+    for run, idx in tasks:
+        row = df.iloc[idx]
+        cache_key = None
+        if result_cache is not None:
+            try:
+                cache_key = result_cache.key_for(run.ifc_model_path, paths.resolve_relative(row["script_path"]))
+            except OSError:
+                pass  # missing model or script: run it so the error is reported
+            cached = result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                record(run, row["question_id"], _result_row(row, cached, cached=True))
+                continue
+        stale_tasks.append((run, [idx], [cache_key]))
+    if not stale_tasks:
+        if result_cache is not None:
+            result_cache.evict()
+        return aggregate
+    if fuse:
+        stale_tasks = _fuse_scan_tasks(df, stale_tasks)
+
+    # Longest predicted task first. A warm pool keeps the models in their cost order and
+    # sorts within each, so a worker's parsed models are not evicted by tasks hopping
+    # between models; fresh workers parse their model anyway, so the order is global.
+    cost_model = scheduler.CostModel()
+    predictions = [
+        [cost_model.predict(run.ifc_model_path, df.iloc[idx]["question_id"]) for idx in indices]
+        for run, indices, _ in stale_tasks
+    ]
+    costs = {id(task): sum(cost or 0.0 for cost in costs) for task, costs in zip(stale_tasks, predictions)}
+    predicted_tasks = sum(all(cost is not None for cost in costs) for costs in predictions)
+    run_position = {id(run): position for position, run in enumerate(runs)}
+    if mode == MODE_WARM_POOL:
+        stale_tasks.sort(key=lambda task: (run_position[id(task[0])], -costs[id(task)]))
+    else:
+        stale_tasks.sort(key=lambda task: -costs[id(task)])
+
+    def execute(
+        run: _ModelRun, task, question_limits: limits.QuestionLimits, fact_values: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        worker_mb = footprints.worker_mb(run.ifc_model_path)
+        budget.acquire(worker_mb)
+        try:
+            if pool is not None:
+                outcome = pool.run(run.ifc_model_path, task, question_limits.timeout_s, fact_values, question_limits)
+            else:
+                outcome = _run_in_process(context, run.ifc_model_path, task, fact_values, question_limits)
+        finally:
+            budget.release(worker_mb)
+        footprints.observe(run.ifc_model_path, outcome.get("peak_rss_mb"))
+        return outcome
+
+    def model_facts(run: _ModelRun, names: List[str], question_limits: limits.QuestionLimits) -> Dict[str, Any]:
+        """The model's facts, computing ``names`` first if no question has yet."""
+        with run.facts_lock:
+            missing = [name for name in names if name not in run.facts and name not in run.failed_facts]
+            if missing:
+                start_time = time.time()
+                # A worker, forked from the preloaded model in parse-once mode, runs within
+                # the question's limits; the parent could not enforce them.
+                values = execute(run, facts.FactsRequest(missing, run.facts), question_limits)["result"]
+                if isinstance(values, dict):
+                    run.facts.update(values)
+                    tqdm.write(
+                        f"{run.ifc_model_path.name}: computed facts {', '.join(values)} "
+                        f"in {time.time() - start_time:.2f}s"
+                    )
+                else:
+                    # Each dependent question computes (and reports) the fact itself.
+                    run.failed_facts.update(missing)
+            return dict(run.facts)
+
+    def process_question(run: _ModelRun, indices: List[int], cache_keys: List[Optional[str]]):
+        rows = [df.iloc[idx] for idx in indices]
+        script_paths = [paths.resolve_relative(row["script_path"]) for row in rows]
+
+        if mode == MODE_PARSE_ONCE:
+            with run.lock:
+                if not run.loaded:
+                    run.preloaded = _preload_model(run.ifc_model_path, footprints)
+                    run.loaded = True
+
+        question_limits = limits.QuestionLimits.combined(
+            [
+                limits.question_limits(
+                    row,
+                    run.previous_times.get(row["question_id"]),
+                    SCRIPT_TIMEOUT,
+                    run.previous_peaks.get(row["question_id"]),
+                )
+                for row in rows
+            ],
+            SCRIPT_TIMEOUT,
+        )
+        fact_names = facts.required_facts(rows[0]) if len(rows) == 1 else []
+        fact_values = model_facts(run, fact_names, question_limits) if fact_names else None
+        outcome = execute(run, script_paths if len(script_paths) > 1 else script_paths[0], question_limits, fact_values)
+
+        if len(script_paths) > 1:
+            if isinstance(outcome["result"], dict):
+                passes, unfused_passes = outcome["result"]["passes"], outcome["result"]["unfused_passes"]
+                step_counts = outcome["result"].get("step_counts", 0)
+                tqdm.write(
+                    f"{run.ifc_model_path.name}: {len(rows)} scan questions answered in one task with "
+                    f"{passes} model passes instead of {unfused_passes} ({unfused_passes - passes} saved"
+                    + (f", {step_counts} counted from the STEP text)" if step_counts else ")")
+                )
+            outcomes = fused.split_outcome(outcome, script_paths, rows[0]["question_id"])
+        else:
+            outcomes = [outcome]
+        answers = []
+        for row, cache_key, question_outcome in zip(rows, cache_keys, outcomes):
+            if cache_key is not None:
+                result_cache.put(cache_key, question_outcome)
+            answers.append((row["question_id"], _result_row(row, question_outcome, cached=False)))
+        return answers
+
+    owns_pool = mode == MODE_WARM_POOL and pool is None
+    if owns_pool:
+        largest_worker_mb = max(footprints.worker_mb(run.ifc_model_path) for run, _, _ in stale_tasks)
+        pool = WarmWorkerPool(budget.max_workers(largest_worker_mb, max_workers), context=context)
+    workers = min(max_workers, pool.size) if pool is not None else max_workers
+    start_time = time.time()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_run = {
+                executor.submit(process_question, run, indices, cache_keys): run
+                for run, indices, cache_keys in stale_tasks
+            }
+            with tqdm(total=sum(len(indices) for _, indices, _ in stale_tasks), desc=progress_label, ncols=120) as bar:
+                for future in concurrent.futures.as_completed(future_to_run):
+                    for q_id, data in future.result():
+                        record(future_to_run[future], q_id, data)
+                        bar.update()
+        if predicted_tasks:
+            predicted = scheduler.predicted_makespan((costs[id(task)] for task in stale_tasks), workers)
+            print(
+                f"Makespan on {workers} workers: predicted {predicted:.1f}s "
+                f"({predicted_tasks}/{len(stale_tasks)} tasks with history), actual {time.time() - start_time:.1f}s"
+            )
+    finally:
+        for run in runs:
+            # Still open only if the run was interrupted: keep it for --resume.
+            run.journal.close()
+            if run.preloaded:
+                _question_helpers().release_open_model(run.ifc_model_path)
+        if owns_pool:
+            pool.close()
+        if result_cache is not None:
+            result_cache.evict()
+    return aggregate
+
+
+def _fuse_scan_tasks(df: pd.DataFrame, stale_tasks: List[tuple]) -> List[tuple]:
+    """Merge each model's stale questions whose scripts declare a ``SCAN`` into one task.
+
+    The fused task takes the place of the model's first scan question so the queue order
+    (and the cost ordering of the models) is kept.
+    """
+    scan_tasks: Dict[int, tuple] = {}
+    merged = []
+    for task in stale_tasks:
+        run, indices, cache_keys = task
+        row = df.iloc[indices[0]]
+        if facts.required_facts(row) or not fused.declares_scan(paths.resolve_relative(row["script_path"])):
+            merged.append(task)
+            continue
+        fused_task = scan_tasks.get(id(run))
+        if fused_task is None:
+            fused_task = scan_tasks[id(run)] = (run, [], [])
+            merged.append(fused_task)
+        fused_task[1].extend(indices)
+        fused_task[2].extend(cache_keys)
+    return merged
+
+
+def run_full_benchmark(
+    ifc_model_path: str | Path,
+    csv_path: str | Path | None = None,
+    question_ids: Optional[Iterable[str | int]] = None,
+    mode: str = MODE_PER_QUESTION,
+    pool: Optional[WarmWorkerPool] = None,
+    max_workers: Optional[int] = None,
+    memory_budget_mb: Optional[float] = None,
+    use_cache: bool = True,
+    cache_max_mb: float = DEFAULT_MAX_SIZE_MB,
+    fuse: bool = True,
+    since: str | Path | None = None,
+    previous_results: str | Path | None = None,
+    resume: bool = False,
+    fsync: str = journal.DEFAULT_FSYNC,
+):
+    """Run every benchmark question defined in the CSV for a single IFC file.
+
+    ``mode`` selects how workers get the model: ``per-question`` lets every script parse
+    the IFC in its own process, ``parse-once`` parses it once in the parent and forks
+    workers that share the parsed ``ifcopenshell.file`` through ``open_ifc``, and
+    ``warm-pool`` sends questions to long-lived workers that keep models loaded. Pass
+    ``pool`` to reuse a warm pool across several models. Concurrent workers are capped so
+    their estimated RSS stays within ``memory_budget_mb`` (default: 80% of physical memory).
+    With ``use_cache`` answers whose model, script and helper sources are unchanged come
+    from the on-disk result cache and are flagged in the ``cached`` column. With ``fuse``
+    the questions that declare a ``SCAN`` share one pass over the model; the fused task's
+    time is recorded once, on its first question, and all of them name it in ``fused``.
+
+    ``since`` names the previous revision of the model. Its answers (from
+    ``previous_results``, by default that revision's results CSV) are carried forward for
+    the questions whose entity types the diff between the revisions does not touch.
+
+    Answers are journaled to ``<model>_answers.jsonl`` as they complete (``fsync`` sets
+    how often the journal is forced to disk); ``resume`` skips the questions a crashed or
+    interrupted run already answered on the same model contents.
+    """
+    ifc_model_path = paths.resolve_relative(ifc_model_path)
+    csv_path = paths.resolve_relative(csv_path or paths.QUESTIONS_PATH)
+
+    carried = None
+    if since is not None:
+        since = paths.resolve_relative(since)
+        previous_results = paths.resolve_relative(
+            previous_results or paths.RESULTS_DIR / f"{since.stem}_answers.csv"
+        )
+        diff = revisions.diff_models(since, ifc_model_path)
+        print(f"{since.name} -> {ifc_model_path.name}: {len(diff.added)} added, "
+              f"{len(diff.removed)} removed, {len(diff.modified)} modified")
+        if diff.changed:
+            print(diff.summary().to_string(index=False))
+        previous = revisions.previous_answers(previous_results) if previous_results.exists() else {}
+        df = pd.read_csv(csv_path)
+        carried = {
+            str(ifc_model_path): revisions.carried_answers(df.iloc[_select_questions(df, question_ids)], diff, previous)
+        }
+        print(f"Carrying {len(carried[str(ifc_model_path)])} answers forward from {previous_results.name}")
+
+    aggregate = _run_models(
+        [ifc_model_path],
+        csv_path,
+        question_ids,
+        mode,
+        pool,
+        max_workers,
+        memory_budget_mb if memory_budget_mb is not None else memory.default_budget_mb(),
+        ResultCache(max_size_mb=cache_max_mb) if use_cache else None,
+        f"{ifc_model_path.stem}.ifc Benchmark",
+        fuse,
+        carried,
+        resume,
+        fsync,
+    )
+    return aggregate[str(ifc_model_path)]
+
+
 def run_directory(
     models_dir: str | Path,
     csv_path: str | Path | None = None,
     question_ids: Optional[Iterable[str | int]] = None,
+    mode: str = MODE_PER_QUESTION,
+    max_workers: Optional[int] = None,
+    memory_budget_mb: Optional[float] = None,
+    use_cache: bool = True,
+    cache_max_mb: float = DEFAULT_MAX_SIZE_MB,
+    fuse: bool = True,
+    resume: bool = False,
+    fsync: str = journal.DEFAULT_FSYNC,
 ):
-    """Run the benchmark for every IFC file found in a directory."""
+    """Run the benchmark for every IFC file found in a directory.
+
+    All (model, question) pairs share one pool of ``max_workers`` workers. The most
+    expensive models (by previous runtime, else file size) are queued first so small
+    models fill the tail instead of waiting behind large ones. Each model has its own
+    journal, so ``resume`` picks up every model where the interrupted run left it.
+    """
     models_dir = paths.resolve_relative(models_dir)
+    csv_path = paths.resolve_relative(csv_path or paths.QUESTIONS_PATH)
 
     if not models_dir.exists():
         raise FileNotFoundError(f"Models directory not found: {models_dir}")
 
-    aggregate = {}
-    for model_path in sorted(models_dir.glob("*.ifc")):
-        aggregate[str(model_path)] = run_full_benchmark(model_path, csv_path, question_ids)
-    return aggregate
+    model_paths = scheduler.order_models_by_cost(sorted(models_dir.glob("*.ifc")))
+    aggregate = _run_models(
+        model_paths,
+        csv_path,
+        question_ids,
+        mode,
+        None,
+        max_workers,
+        memory_budget_mb if memory_budget_mb is not None else memory.default_budget_mb(),
+        ResultCache(max_size_mb=cache_max_mb) if use_cache else None,
+        f"{len(model_paths)} models Benchmark",
+        fuse,
+        None,
+        resume,
+        fsync,
+    )
+    return {str(model_path): aggregate[str(model_path)] for model_path in sorted(model_paths)}
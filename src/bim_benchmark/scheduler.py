@@ -0,0 +1,152 @@
+"""Cost heuristics used to order benchmark work."""
+
+from __future__ import annotations
+
+import heapq
+import statistics
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from . import paths
+from .cache import is_cacheable
+
+
+def results_path_for(model_path: str | Path) -> Path:
+    """Location of the answers CSV produced for ``model_path``."""
+    return paths.RESULTS_DIR / f"{Path(model_path).stem}_answers.csv"
+
+
+def historical_runtime(model_path: str | Path) -> Optional[float]:
+    """Return the summed ``time_seconds`` of the model's previous run, if one was recorded."""
+    results_path = results_path_for(model_path)
+    if not results_path.exists():
+        return None
+    try:
+        times = pd.read_csv(results_path, usecols=["time_seconds"])["time_seconds"]
+    except (OSError, ValueError):
+        return None
+    times = pd.to_numeric(times, errors="coerce").dropna()
+    if times.empty:
+        return None
+    return float(times.sum())
+
+
+def _question_history(results_path: Path, column: str) -> Dict[str, float]:
+    """``{question_id: column}`` of a results CSV, answered unfused rows only."""
+    if not results_path.exists():
+        return {}
+    columns = {"question_id", "result", column, "fused"}
+    try:
+        table = pd.read_csv(results_path, usecols=lambda name: name in columns, dtype=str)
+    except (OSError, ValueError):
+        return {}
+    if not {"question_id", "result", column} <= set(table.columns):
+        return {}
+    if "fused" in table.columns:
+        table = table[table["fused"].isna()]
+    history = {}
+    for q_id, result, value in table[["question_id", "result", column]].itertuples(index=False):
+        value = pd.to_numeric(value, errors="coerce")
+        if is_cacheable(result) and not pd.isna(value):
+            history[q_id] = float(value)
+    return history
+
+
+def historical_question_times(model_path: str | Path) -> Dict[str, float]:
+    """Return ``{question_id: time_seconds}`` of the model's previous run, answered rows only.
+
+    Questions answered by a fused scan are left out: their time is the whole task's.
+    """
+    return _question_history(results_path_for(model_path), "time_seconds")
+
+
+def historical_question_peaks(model_path: str | Path) -> Dict[str, float]:
+    """Return ``{question_id: peak_rss_mb}`` of the model's previous run, like the times."""
+    return _question_history(results_path_for(model_path), "peak_rss_mb")
+
+
+class CostModel:
+    """Predict the runtime of a question on a model from the results CSVs on disk.
+
+    A question's own previous time on the model is used when there is one. Otherwise it
+    is the median of its times on the other models, each scaled by the ratio of file
+    sizes. Questions never answered anywhere get the model's median predicted time.
+    A results CSV is matched to its model by name in ``paths.MODELS_DIR``, since the
+    ``model`` column holds the path on whichever machine wrote it.
+    """
+
+    def __init__(self, results_dir: Path | None = None) -> None:
+        self.results_dir = results_dir or paths.RESULTS_DIR
+        self._other_models: Optional[List[Tuple[float, Dict[str, float]]]] = None
+        self._model_times: Dict[str, Dict[str, float]] = {}
+        self._fallbacks: Dict[str, Optional[float]] = {}
+
+    def _times(self, model_path: Path) -> Dict[str, float]:
+        key = str(model_path)
+        if key not in self._model_times:
+            self._model_times[key] = _question_history(
+                self.results_dir / f"{Path(model_path).stem}_answers.csv", "time_seconds"
+            )
+        return self._model_times[key]
+
+    def _others(self) -> List[Tuple[float, Dict[str, float]]]:
+        """``(model file size, {question: time})`` for every model with a results CSV."""
+        if self._other_models is None:
+            self._other_models = []
+            for results_path in sorted(self.results_dir.glob("*_answers.csv")):
+                model_path = paths.MODELS_DIR / f"{results_path.stem.removesuffix('_answers')}.ifc"
+                try:
+                    size = model_path.stat().st_size
+                except OSError:
+                    continue
+                times = _question_history(results_path, "time_seconds")
+                if times and size:
+                    self._other_models.append((float(size), times))
+        return self._other_models
+
+    def _scaled(self, model_path: Path, question_id: str) -> Optional[float]:
+        try:
+            size = float(Path(model_path).stat().st_size)
+        except OSError:
+            return None
+        estimates = [
+            times[question_id] * size / other_size for other_size, times in self._others() if question_id in times
+        ]
+        return statistics.median(estimates) if estimates else None
+
+    def predict(self, model_path: Path, question_id: str) -> Optional[float]:
+        """Predicted seconds for ``question_id`` on ``model_path``; None without any history."""
+        own = self._times(model_path).get(question_id)
+        if own is not None:
+            return own
+        scaled = self._scaled(model_path, question_id)
+        if scaled is not None:
+            return scaled
+        key = str(model_path)
+        if key not in self._fallbacks:
+            own_times = list(self._times(model_path).values())
+            self._fallbacks[key] = statistics.median(own_times) if own_times else None
+        return self._fallbacks[key]
+
+
+def predicted_makespan(costs: Iterable[float], workers: int) -> float:
+    """Wall-clock time of greedily handing ``costs``, in order, to ``workers`` workers."""
+    finish_times = [0.0] * max(1, workers)
+    for cost in costs:
+        heapq.heapreplace(finish_times, finish_times[0] + cost)
+    return max(finish_times)
+
+
+def order_models_by_cost(model_paths: Iterable[Path]) -> List[Path]:
+    """Return models sorted from most to least expensive.
+
+    Previous runtimes are used when every model has one; otherwise the file size is the
+    proxy, so the two measures are never mixed in one ordering.
+    """
+    model_paths = list(model_paths)
+    runtimes = {model_path: historical_runtime(model_path) for model_path in model_paths}
+    if model_paths and all(runtime is not None for runtime in runtimes.values()):
+        return sorted(model_paths, key=lambda model_path: runtimes[model_path], reverse=True)
+    return sorted(model_paths, key=lambda model_path: model_path.stat().st_size, reverse=True)
@@ -0,0 +1,229 @@
+"""Local HTTP daemon that answers benchmark questions from warm workers."""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from . import facts, limits, paths
+from .cache import DEFAULT_MAX_SIZE_MB, ResultCache
+from .runner import SCRIPT_TIMEOUT
+from .worker_pool import DEFAULT_MODEL_CACHE_SIZE, WarmWorkerPool
+
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class ServiceError(Exception):
+    """A request the service cannot answer; ``status`` is the HTTP status to reply with."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class BenchmarkService:
+    """Answer questions on any model with a :class:`WarmWorkerPool` whose workers keep
+    recently used models parsed.
+
+    Answers found in ``result_cache`` are returned without running the script, and fresh
+    answers are stored there, exactly as in a CLI run.
+    """
+
+    def __init__(
+        self,
+        csv_path: str | Path,
+        pool: WarmWorkerPool,
+        result_cache: Optional[ResultCache] = None,
+        timeout: float = SCRIPT_TIMEOUT,
+    ) -> None:
+        self.csv_path = paths.resolve_relative(csv_path)
+        self.pool = pool
+        self.result_cache = result_cache
+        self.timeout = timeout
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=pool.size)
+        self._questions: Optional[pd.DataFrame] = None
+        self._questions_mtime: Optional[int] = None
+
+    def questions(self) -> pd.DataFrame:
+        """The question catalogue, re-read when ``questions.csv`` changes."""
+        mtime = self.csv_path.stat().st_mtime_ns
+        if self._questions is None or mtime != self._questions_mtime:
+            self._questions = pd.read_csv(self.csv_path).set_index("question_id", drop=False)
+            self._questions_mtime = mtime
+        return self._questions
+
+    def ask(self, ifc_model_path: str | Path, question_id: str) -> Dict[str, Any]:
+        """Answer one question on one model; the reply mirrors a row of the results CSV."""
+        ifc_model_path = paths.resolve_relative(ifc_model_path)
+        if not ifc_model_path.exists():
+            raise ServiceError(404, f"IFC file not found at {ifc_model_path}")
+        questions = self.questions()
+        if question_id not in questions.index:
+            raise ServiceError(404, f"Unknown question {question_id!r}")
+        row = questions.loc[question_id]
+        script_path = paths.resolve_relative(row["script_path"])
+
+        cache_key = None
+        if self.result_cache is not None:
+            try:
+                cache_key = self.result_cache.key_for(ifc_model_path, script_path)
+            except OSError:
+                pass
+            cached = self.result_cache.get(cache_key) if cache_key else None
+            if cached is not None:
+                return self._reply(ifc_model_path, row, cached, cached=True)
+
+        question_limits = limits.question_limits(row, None, self.timeout)
+        fact_values = None
+        fact_names = facts.required_facts(row)
+        if fact_names:
+            # Workers cache facts per model, so this only costs time on the first ask.
+            fact_values = self.pool.run(
+                ifc_model_path, facts.FactsRequest(fact_names), question_limits.timeout_s, None, question_limits
+            )["result"]
+            if not isinstance(fact_values, dict):
+                fact_values = None
+        outcome = self.pool.run(ifc_model_path, script_path, question_limits.timeout_s, fact_values, question_limits)
+        if cache_key is not None:
+            self.result_cache.put(cache_key, outcome)
+        return self._reply(ifc_model_path, row, outcome, cached=False)
+
+    def ask_many(self, ifc_model_path: str | Path, question_ids: Iterable[str]) -> List[Dict[str, Any]]:
+        """Answer several questions concurrently, one worker each, in the order given."""
+        futures = [self._executor.submit(self.ask, ifc_model_path, question_id) for question_id in question_ids]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.pool.close()
+
+    @staticmethod
+    def _reply(ifc_model_path: Path, row: pd.Series, outcome: Dict[str, Any], *, cached: bool) -> Dict[str, Any]:
+        peak_rss = outcome.get("peak_rss_mb")
+        return {
+            "question_id": row["question_id"],
+            "question": row["question_text"],
+            "result": outcome["result"],
+            "difficulty": row["difficulty"],
+            "model": str(ifc_model_path),
+            "time_seconds": round(outcome["time"], 3),
+            "peak_rss_mb": round(peak_rss, 1) if peak_rss is not None else None,
+            "cached": cached,
+            "status": limits.outcome_status(outcome["result"]),
+        }
+
+
+def _json_bytes(payload: Any) -> bytes:
+    # Answers can hold sets, tuples or numpy scalars; fall back to their string form.
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """``GET /health``, ``GET /questions`` and ``POST /ask`` with
+    ``{"model": path, "question_ids": [...]}``."""
+
+    server_version = "bim-benchmark"
+    service: BenchmarkService
+
+    def _send(self, status: int, payload: Any) -> None:
+        body = _json_bytes(payload)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        if self.path == "/health":
+            self._send(200, {"status": "ok", "workers": self.service.pool.size})
+        elif self.path == "/questions":
+            questions = self.service.questions()
+            self._send(200, questions[["question_id", "question_text", "difficulty"]].to_dict("records"))
+        else:
+            self._send(404, {"error": f"Unknown path {self.path}"})
+
+    def do_POST(self) -> None:  # noqa: N802 - http.server naming
+        if self.path != "/ask":
+            self._send(404, {"error": f"Unknown path {self.path}"})
+            return
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            request = json.loads(self.rfile.read(length) or b"{}")
+            model = request["model"]
+            question_ids = request.get("question_ids") or [request["question_id"]]
+        except (ValueError, KeyError, TypeError) as exc:
+            self._send(400, {"error": f"Bad request: {exc}"})
+            return
+        try:
+            self._send(200, {"answers": self.service.ask_many(model, question_ids)})
+        except ServiceError as exc:
+            self._send(exc.status, {"error": str(exc)})
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002 - http.server signature
+        print(f"[{time.strftime('%H:%M:%S')}] {self.address_string()} {format % args}", flush=True)
+
+
+def serve(
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    csv_path: str | Path | None = None,
+    workers: Optional[int] = None,
+    model_cache_size: int = DEFAULT_MODEL_CACHE_SIZE,
+    use_cache: bool = True,
+    cache_max_mb: float = DEFAULT_MAX_SIZE_MB,
+) -> None:
+    """Serve questions on ``host:port`` until interrupted."""
+    paths.ensure_required_directories()
+    pool = WarmWorkerPool(workers, model_cache_size=model_cache_size)
+    service = BenchmarkService(
+        csv_path or paths.QUESTIONS_PATH,
+        pool,
+        ResultCache(max_size_mb=cache_max_mb) if use_cache else None,
+    )
+    handler = type("Handler", (_Handler,), {"service": service})
+    httpd = ThreadingHTTPServer((host, port), handler)
+    print(f"Serving BIM benchmark questions on http://{host}:{httpd.server_port} with {pool.size} workers", flush=True)
+    try:
+        httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        httpd.server_close()
+        service.close()
+        if service.result_cache is not None:
+            service.result_cache.evict()
+
+
+def ask(
+    ifc_model_path: str | Path,
+    question_ids: Iterable[str],
+    host: str = DEFAULT_HOST,
+    port: int = DEFAULT_PORT,
+    timeout: float = SCRIPT_TIMEOUT,
+) -> List[Dict[str, Any]]:
+    """Send questions to a running :func:`serve` daemon and return its answers."""
+    payload = {"model": str(Path(ifc_model_path).resolve()), "question_ids": list(question_ids)}
+    request = urllib.request.Request(
+        f"http://{host}:{port}/ask",
+        data=_json_bytes(payload),
+        headers={"Content-Type": "application/json"},
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return json.load(response)["answers"]
+    except urllib.error.HTTPError as exc:
+        try:
+            message = json.load(exc)["error"]
+        except (ValueError, KeyError):
+            message = exc.reason
+        raise RuntimeError(f"The benchmark server refused the request: {message}") from exc
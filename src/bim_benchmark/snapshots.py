@@ -0,0 +1,75 @@
+"""Binary snapshots of IFC models and the open-time comparison against STEP parsing."""
+
+from __future__ import annotations
+
+import gc
+import time
+from pathlib import Path
+from typing import List
+
+import pandas as pd
+
+from . import paths
+
+
+def model_paths(target: Path) -> List[Path]:
+    """The IFC file ``target`` or the IFC files in the directory ``target``."""
+    target = paths.resolve_relative(target)
+    return sorted(target.glob("*.ifc")) if target.is_dir() else [target]
+
+
+def write_snapshots(target: Path) -> List[Path]:
+    """Snapshot every IFC file under ``target`` and return the snapshot paths."""
+    paths.ensure_scripts_importable()
+    from scripts.question_helpers import write_snapshot
+
+    return [Path(write_snapshot(str(ifc_path))) for ifc_path in model_paths(target)]
+
+
+def _workload(model) -> int:
+    """Read every product and its property sets, since opening a snapshot is lazy."""
+    import ifcopenshell.util.element
+
+    products = model.by_type("IfcProduct")
+    for product in products:
+        ifcopenshell.util.element.get_psets(product)
+    return len(products)
+
+
+def _timed(open_model) -> tuple:
+    gc.collect()
+    start = time.perf_counter()
+    model = open_model()
+    opened = time.perf_counter()
+    _workload(model)
+    return opened - start, time.perf_counter() - start
+
+
+def benchmark(target: Path) -> pd.DataFrame:
+    """Open time and open-plus-read time of each model from STEP text and from its snapshot.
+
+    Models without a snapshot for their current contents are snapshotted first.
+    """
+    paths.ensure_scripts_importable()
+    import ifcopenshell
+    from scripts.question_helpers import snapshot_path, write_snapshot
+
+    rows = []
+    for ifc_path in model_paths(target):
+        snapshot = Path(snapshot_path(str(ifc_path)))
+        if not snapshot.is_dir():
+            write_snapshot(str(ifc_path))
+        step_open, step_total = _timed(lambda: ifcopenshell.open(str(ifc_path)))
+        snapshot_open, snapshot_total = _timed(lambda: ifcopenshell.open(str(snapshot), readonly=True))
+        rows.append(
+            {
+                "model": ifc_path.name,
+                "size_mb": round(ifc_path.stat().st_size / 2**20, 2),
+                "step_open_s": round(step_open, 4),
+                "snapshot_open_s": round(snapshot_open, 4),
+                "step_read_s": round(step_total, 4),
+                "snapshot_read_s": round(snapshot_total, 4),
+                "open_speedup": round(step_open / snapshot_open, 1) if snapshot_open else None,
+            }
+        )
+    return pd.DataFrame(rows)
@@ -0,0 +1,249 @@
+"""Re-run questions in place while their model or scripts are being edited."""
+
+from __future__ import annotations
+
+import importlib
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Set
+
+import pandas as pd
+
+from . import limits, paths, revisions, scheduler
+from .cache import imported_helpers, is_cacheable
+from .runner import SCRIPT_TIMEOUT, _select_questions, _write_results, execute_task
+
+
+DEFAULT_INTERVAL = 1.0  # seconds between polls
+
+
+def _digest(path: Path) -> Optional[str]:
+    paths.ensure_scripts_importable()
+    from scripts.ifc_utils import file_digest
+
+    try:
+        return file_digest(path)
+    except OSError:
+        return None
+
+
+def _helper_module_name(helper_path: Path) -> str:
+    relative = helper_path.relative_to(paths.REPO_ROOT).with_suffix("")
+    return ".".join(relative.parts)
+
+
+class ModelWatcher:
+    """Keep one model parsed in this process and answer the selected questions on it.
+
+    :meth:`poll` compares the model, the question scripts and the ``scripts`` helpers they
+    import with what the last answers were computed from (by content, so touching a file
+    does nothing). An edited question script is simply run again. An edited helper is
+    re-imported together with the helpers that import it, and only the questions that
+    import any of those are re-run. A changed model is re-parsed and diffed against the
+    previous revision's snapshot (see :mod:`revisions`); only the questions whose answers
+    the diff may have changed are re-run. Questions run within their catalogue limits
+    (:func:`limits.question_limits`), which here can stop them on memory and CPU only.
+    """
+
+    def __init__(self, ifc_model_path: Path, csv_path: Path, question_ids: Optional[Iterable[str | int]] = None):
+        self.ifc_model_path = ifc_model_path
+        self.csv_path = csv_path
+        self.question_ids = question_ids
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self._rows: Dict[str, pd.Series] = {}
+        self._digests: Dict[Path, Optional[str]] = {}
+        self._mtimes: Dict[Path, Optional[int]] = {}
+        self._model = None
+        self._revision: Optional[revisions.Snapshot] = None
+        self._previous_times: Dict[str, float] = {}
+        self._previous_peaks: Dict[str, float] = {}
+
+    def _question_helpers(self):
+        paths.ensure_scripts_importable()
+        from scripts import question_helpers
+
+        return question_helpers
+
+    def _load_model(self) -> float:
+        question_helpers = self._question_helpers()
+        start_time = time.time()
+        question_helpers.release_open_model(self.ifc_model_path)
+        self._model = None
+        try:
+            self._model = question_helpers.open_ifc(str(self.ifc_model_path), snapshot=False)
+        except RuntimeError:
+            pass  # every question reports the parse error itself
+        if self._model is not None:
+            question_helpers.register_open_model(self.ifc_model_path, self._model)
+        return time.time() - start_time
+
+    def _model_revision(self) -> Optional[revisions.Snapshot]:
+        """The loaded model's snapshot, or None if it did not parse."""
+        if self._model is None:
+            return None
+        try:
+            return revisions.model_snapshot(self.ifc_model_path)
+        except (OSError, RuntimeError):
+            return None
+
+    def _unaffected(self, old_model, old_revision: Optional[revisions.Snapshot]) -> Set[str]:
+        """Questions whose answers the change from ``old_model`` cannot have altered."""
+        if old_model is None or old_revision is None or self._revision is None:
+            return set()
+        diff = revisions.ModelDiff(old_revision, self._revision)
+        diff.follow_relationships(old_model, self._model)
+        df = pd.DataFrame(list(self._rows.values()))
+        return set(revisions.carried_answers(df, diff, self.results))
+
+    def _load_questions(self) -> None:
+        df = pd.read_csv(self.csv_path)
+        self._rows = {}
+        for idx in _select_questions(df, self.question_ids):
+            row = df.iloc[idx]
+            self._rows[row["question_id"]] = row
+
+    def _script_path(self, q_id: str) -> Path:
+        return paths.resolve_relative(self._rows[q_id]["script_path"])
+
+    def _helpers(self) -> Set[Path]:
+        return {helper for q_id in self._rows for helper in imported_helpers(self._script_path(q_id))}
+
+    def _watched_files(self) -> Set[Path]:
+        return {self.ifc_model_path, *(self._script_path(q_id) for q_id in self._rows), *self._helpers()}
+
+    def _snapshot(self) -> None:
+        self._digests = {path: _digest(path) for path in self._watched_files()}
+        self._mtimes = {path: self._mtime(path) for path in self._digests}
+
+    @staticmethod
+    def _mtime(path: Path) -> Optional[int]:
+        try:
+            return path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+    def _run(self, question_ids: Iterable[str]) -> pd.DataFrame:
+        rows = []
+        for q_id in sorted(question_ids):
+            row = self._rows[q_id]
+            question_limits = limits.question_limits(
+                row, self._previous_times.get(q_id), SCRIPT_TIMEOUT, self._previous_peaks.get(q_id)
+            )
+            start_time = time.time()
+            result = execute_task(self.ifc_model_path, self._script_path(q_id), None, question_limits)
+            elapsed = time.time() - start_time
+            if is_cacheable(result):
+                self._previous_times[q_id] = elapsed
+            self.results[q_id] = {
+                "question": row["question_text"],
+                "result": result,
+                "difficulty": row["difficulty"],
+                "time": round(elapsed, 3),
+                "peak_rss_mb": None,
+                "cached": False,
+            }
+            rows.append(
+                {
+                    "question_id": q_id,
+                    "question": row["question_text"],
+                    "result": result,
+                    "difficulty": row["difficulty"],
+                    "time_seconds": round(elapsed, 3),
+                }
+            )
+        self.results = _write_results(self.ifc_model_path, self.results)
+        return pd.DataFrame(rows)
+
+    def start(self) -> pd.DataFrame:
+        """Parse the model and answer every selected question."""
+        paths.ensure_required_directories()
+        self._load_questions()
+        self._previous_times = scheduler.historical_question_times(self.ifc_model_path)
+        self._previous_peaks = scheduler.historical_question_peaks(self.ifc_model_path)
+        self._load_model()
+        self._revision = self._model_revision()
+        self._snapshot()
+        return self._run(self._rows)
+
+    def _reload_helpers(self, changed: Set[Path]) -> Set[Path]:
+        """Re-import the changed helpers and the helpers importing them; return them all."""
+        helpers = self._helpers()
+        stale = changed & helpers
+        for helper in helpers:
+            if stale.intersection(imported_helpers(helper)):
+                stale.add(helper)
+        # A module's importers import strictly more helpers, so reload it before them.
+        for helper in sorted(stale, key=lambda path: len(imported_helpers(path))):
+            module = sys.modules.get(_helper_module_name(helper))
+            if module is not None:
+                importlib.reload(module)
+        if self._model is not None:
+            # A reloaded question_helpers starts with an empty model registry.
+            self._question_helpers().register_open_model(self.ifc_model_path, self._model)
+        return stale
+
+    def poll(self) -> Optional[pd.DataFrame]:
+        """Re-run what changed since the last poll; return the refreshed rows, if any."""
+        changed = set()
+        for path in self._watched_files():
+            mtime = self._mtime(path)
+            if path in self._mtimes and mtime == self._mtimes[path]:
+                continue
+            self._mtimes[path] = mtime
+            digest = _digest(path)
+            if digest != self._digests.get(path):
+                self._digests[path] = digest
+                changed.add(path)
+        if not changed:
+            return None
+
+        helpers = self._reload_helpers(changed)
+        affected = {
+            q_id
+            for q_id in self._rows
+            if self._script_path(q_id) in changed or helpers.intersection(imported_helpers(self._script_path(q_id)))
+        }
+        if self.ifc_model_path in changed:
+            old_model, old_revision = self._model, self._revision
+            elapsed = self._load_model()
+            self._revision = self._model_revision()
+            unaffected = self._unaffected(old_model, old_revision)
+            affected |= set(self._rows) - unaffected
+            print(
+                f"{self.ifc_model_path.name} changed: re-parsed in {elapsed:.2f}s, "
+                f"re-running {len(affected)} question(s)",
+                flush=True,
+            )
+        else:
+            names = ", ".join(sorted(path.name for path in changed))
+            print(f"{names} changed: re-running {len(affected)} question(s)", flush=True)
+        self._snapshot()
+        return self._run(affected) if affected else None
+
+
+def watch(
+    ifc_model_path: str | Path,
+    csv_path: str | Path | None = None,
+    question_ids: Optional[Iterable[str | int]] = None,
+    interval: float = DEFAULT_INTERVAL,
+) -> None:
+    """Answer the questions, then keep re-running the affected ones until interrupted."""
+    ifc_model_path = paths.resolve_relative(ifc_model_path)
+    csv_path = paths.resolve_relative(csv_path or paths.QUESTIONS_PATH)
+    watcher = ModelWatcher(ifc_model_path, csv_path, question_ids)
+    _print_rows(watcher.start())
+    print(f"Watching {ifc_model_path.name} and its question scripts (Ctrl+C to stop)", flush=True)
+    try:
+        while True:
+            time.sleep(interval)
+            refreshed = watcher.poll()
+            if refreshed is not None:
+                _print_rows(refreshed)
+    except KeyboardInterrupt:
+        pass
+
+
+def _print_rows(rows: pd.DataFrame) -> None:
+    rows.to_csv(sys.stdout, index=False)
+    sys.stdout.flush()
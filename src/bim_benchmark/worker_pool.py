@@ -0,0 +1,218 @@
+"""Long-lived pool of pre-warmed processes that execute benchmark scripts."""
+
+from __future__ import annotations
+
+import importlib
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from . import limits, memory, paths
+
+
+WARM_IMPORTS = ("ifcopenshell", "ifcopenshell.geom", "scripts.ifc_utils", "scripts.question_helpers")
+DEFAULT_MODEL_CACHE_SIZE = 2
+
+
+def _model_cache_key(ifc_model_path: str) -> Tuple[str, int]:
+    real_path = os.path.realpath(ifc_model_path)
+    try:
+        mtime = os.stat(real_path).st_mtime_ns
+    except OSError:
+        mtime = -1
+    return real_path, mtime
+
+
+def _worker_main(conn, model_cache_size: int) -> None:
+    """Serve ``(ifc_model_path, script_path)`` tasks from ``conn`` until told to stop.
+
+    Tasks also carry the intermediate facts to inject and the task's
+    :class:`limits.QuestionLimits`. ``script_path`` may also be a list of scripts, answered
+    as one fused scan, or a ``FactsRequest``.
+    """
+    paths.ensure_scripts_importable()
+    for module_name in WARM_IMPORTS:
+        importlib.import_module(module_name)
+
+    from scripts import ifc_utils, question_helpers
+
+    from .runner import execute_task
+
+    models: "OrderedDict[Tuple[str, int], Any]" = OrderedDict()
+
+    while True:
+        try:
+            task = conn.recv()
+        except (EOFError, OSError):
+            break
+        if task is None:
+            break
+
+        ifc_model_path, script_path, fact_values, question_limits = task
+        key = _model_cache_key(ifc_model_path)
+        model = models.get(key)
+        if model is None:
+            # A stale registration (older mtime) must not shadow the re-parse.
+            question_helpers.release_open_model(ifc_model_path)
+            try:
+                model = question_helpers.open_ifc(ifc_model_path, snapshot=False)
+            except RuntimeError:
+                model = None
+            if model is not None:
+                models[key] = model
+                while len(models) > model_cache_size:
+                    (evicted_path, _), evicted = models.popitem(last=False)
+                    question_helpers.release_open_model(evicted_path)
+                    ifc_utils.forget_model_caches(evicted)
+        else:
+            models.move_to_end(key)
+
+        if model is not None:
+            question_helpers.register_open_model(ifc_model_path, model)
+        memory.reset_peak_rss()
+        if isinstance(script_path, list):
+            script_path = [Path(path) for path in script_path]
+        elif isinstance(script_path, str):
+            script_path = Path(script_path)
+        result = execute_task(Path(ifc_model_path), script_path, fact_values, question_limits)
+        peak_rss_mb = memory.peak_rss_mb()
+
+        try:
+            conn.send({"result": result, "peak_rss_mb": peak_rss_mb})
+        except Exception as exc:  # unpicklable results
+            conn.send({"result": f"Error: {exc}", "peak_rss_mb": peak_rss_mb})
+
+
+class _Worker:
+    def __init__(self, process, conn) -> None:
+        self.process = process
+        self.conn = conn
+
+
+class WarmWorkerPool:
+    """Keep ``size`` worker processes alive and reuse them across questions and models.
+
+    Each worker imports ifcopenshell and the ``scripts`` helpers once at start-up and keeps
+    an LRU of parsed models keyed by path and modification time. A worker that times out
+    or dies is discarded and replaced by a fresh one, so one question cannot poison the
+    next.
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        *,
+        model_cache_size: int = DEFAULT_MODEL_CACHE_SIZE,
+        context=None,
+    ) -> None:
+        self.size = size or multiprocessing.cpu_count()
+        self.model_cache_size = model_cache_size
+        self._context = context or multiprocessing.get_context()
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._workers: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    def __enter__(self) -> "WarmWorkerPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _spawn(self) -> _Worker:
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_conn, self.model_cache_size),
+            daemon=True,
+        )
+        process.start()
+        child_conn.close()
+        worker = _Worker(process, parent_conn)
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _recycle(self, worker: _Worker) -> _Worker:
+        """Kill ``worker`` and return a freshly started replacement."""
+        if worker.process.is_alive():
+            worker.process.terminate()
+        worker.process.join()
+        worker.conn.close()
+        with self._lock:
+            self._workers.remove(worker)
+        return self._spawn()
+
+    def run(
+        self,
+        ifc_model_path: str | Path,
+        script_path: Any,
+        timeout: float,
+        fact_values: Optional[Dict[str, Any]] = None,
+        question_limits: Optional[limits.QuestionLimits] = None,
+    ) -> Dict[str, Any]:
+        """Run one script (or a fused list of scripts, or a facts request) on an idle worker.
+
+        ``fact_values`` are injected for the script, and the worker stops it once it exceeds
+        the memory or CPU budget of ``question_limits``. Returns
+        ``{"result", "time", "peak_rss_mb"}``.
+        """
+        if self._closed:
+            raise RuntimeError("The worker pool has been closed")
+
+        worker = self._idle.get()
+        start_time = time.time()
+        try:
+            if isinstance(script_path, (list, tuple)):
+                task = [str(path) for path in script_path]
+            elif isinstance(script_path, (str, Path)):
+                task = str(script_path)
+            else:
+                task = script_path
+            worker.conn.send((str(ifc_model_path), task, fact_values, question_limits))
+            if worker.conn.poll(timeout):
+                outcome = worker.conn.recv()
+                outcome["time"] = time.time() - start_time
+            else:
+                worker = self._recycle(worker)
+                outcome = {"result": limits.TIMEOUT_RESULT, "time": float(timeout), "peak_rss_mb": None}
+        except (EOFError, OSError):
+            worker.process.join(timeout=1)
+            exitcode = worker.process.exitcode
+            worker = self._recycle(worker)
+            result = limits.exit_result(exitcode) or f"Error: Worker process exited unexpectedly (exit code {exitcode})"
+            outcome = {
+                "result": result,
+                "time": time.time() - start_time,
+                "peak_rss_mb": None,
+            }
+        finally:
+            self._idle.put(worker)
+        return outcome
+
+    def close(self) -> None:
+        """Stop every worker; running tasks are not waited for."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            workers = list(self._workers)
+            self._workers.clear()
+        for worker in workers:
+            try:
+                worker.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        for worker in workers:
+            worker.process.join(timeout=5)
+            if worker.process.is_alive():
+                worker.process.terminate()
+                worker.process.join()
+            worker.conn.close()